@@ -0,0 +1,11 @@
+import pytest
+
+from pypergraph.keyring.wallets.shared import sid_manager
+
+
+@pytest.fixture(autouse=True, scope="module")
+def reset_wallet_ids():
+    """Wallet ids come from a global counter, don't let one test module shift the ids expected by another."""
+    sid_manager.reset_sid()
+    yield
+    sid_manager.reset_sid()
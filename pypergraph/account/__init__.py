@@ -1,5 +1,19 @@
 from .dag_account import DagAccount
 from .metagraph_client import MetagraphTokenClient
 from .monitor import Monitor as DagMonitor
+from .sharded_sender import ShardedSender
+from .address_watcher import AddressWatcher
+from .gap_limit_scanner import GapLimitScanner
+from .data_pipeline import DataUpdatePipeline
+from .transaction_auditor import TransactionAuditor
 
-__all__ = ["DagAccount", "MetagraphTokenClient", "DagMonitor"]
+__all__ = [
+    "DagAccount",
+    "MetagraphTokenClient",
+    "DagMonitor",
+    "ShardedSender",
+    "AddressWatcher",
+    "GapLimitScanner",
+    "DataUpdatePipeline",
+    "TransactionAuditor",
+]
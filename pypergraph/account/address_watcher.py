@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Callable, Any
+
+from rx.core.abc import Disposable
+from rx.subject import Subject
+
+from pypergraph.account.monitor import SNAPSHOT_INTERVAL, MonitorMetrics
+from pypergraph.network import DagTokenNetwork
+from pypergraph.network.models.block_explorer import Transaction
+
+logger = logging.getLogger(__name__)
+
+
+class AddressWatcher:
+    """
+    Watch a large, changing set of addresses for transactions and balance changes.
+
+    The watcher tails the snapshots once and looks up the source and destination of every
+    snapshot transaction in an address index. The number of network requests depends on the
+    number of snapshots, not on the number of watched addresses.
+    """
+
+    def __init__(self, network=None, poll_interval: float = SNAPSHOT_INTERVAL):
+        """
+        :param network: (Optional) DagTokenNetwork or MetagraphTokenNetwork. Default: new mainnet DagTokenNetwork.
+        :param poll_interval: Seconds between checks for new snapshots.
+        """
+        self.network = network or DagTokenNetwork()
+        self.poll_interval = poll_interval
+        # Address: Subject, addresses without subscribers are still reported to subscribe_all()
+        self._index: Dict[str, Optional[Subject]] = {}
+        self._transaction_change: Subject = Subject()
+        self.last_ordinal: Optional[int] = None
+        self.metrics = MonitorMetrics()
+        self._poll_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._index
+
+    def add(self, addresses: Iterable[str]):
+        """
+        Watch addresses.
+
+        :param addresses: DAG addresses.
+        """
+        for address in addresses:
+            self._index.setdefault(address, None)
+
+    def remove(self, addresses: Iterable[str]):
+        """
+        Stop watching addresses, their subscribers are completed.
+
+        :param addresses: DAG addresses.
+        """
+        for address in addresses:
+            subject = self._index.pop(address, None)
+            if subject is not None:
+                subject.on_completed()
+
+    def subscribe(self, address: str, callback: Callable[[Any], Any]) -> Disposable:
+        """
+        Listen for events of a single address, the address is watched if it isn't already.
+        Event = {"module": "address_watcher", "event": "transaction", "address": address, "direction": "incoming",
+                 "delta": amount, "snapshot": ordinal, "transaction": Transaction}
+        Event = {"module": "address_watcher", "event": "balance_change", "address": address, "delta": amount,
+                 "snapshot": ordinal}
+
+        :param address: DAG address.
+        :param callback: Callable receiving the event dictionary.
+        :return: Disposable, use dispose() to unsubscribe.
+        """
+        subject = self._index.get(address)
+        if subject is None:
+            subject = self._index[address] = Subject()
+        return subject.subscribe(on_next=callback)
+
+    def subscribe_all(self, callback: Callable[[Any], Any]) -> Disposable:
+        """
+        Listen for events of all watched addresses.
+
+        :param callback: Callable receiving the event dictionary, see subscribe().
+        :return: Disposable, use dispose() to unsubscribe.
+        """
+        return self._transaction_change.subscribe(on_next=callback)
+
+    @property
+    def running(self) -> bool:
+        return self._poll_task is not None and not self._poll_task.done()
+
+    def start(self, from_ordinal: Optional[int] = None):
+        """
+        Start tailing snapshots.
+
+        :param from_ordinal: (Optional) Last processed snapshot ordinal, e.g. stored from last_ordinal. Snapshots
+            after this ordinal are processed. Default: Start from the latest snapshot.
+        """
+        if from_ordinal is not None:
+            self.last_ordinal = from_ordinal
+        if not self.running:
+            self._poll_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop tailing snapshots."""
+        task, self._poll_task = self._poll_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self):
+        while True:
+            start = time.monotonic()
+            try:
+                await self.process_new_snapshots()
+            except Exception as e:
+                logger.error(f"AddressWatcher :: {e}", exc_info=True)
+            self.metrics.record(time.monotonic() - start)
+            await asyncio.sleep(self.poll_interval)
+
+    async def process_new_snapshots(self) -> int:
+        """
+        Process the snapshots created since the last processed snapshot.
+
+        :return: Number of dispatched transaction events.
+        """
+        latest = await self.network.get_latest_snapshot()
+        if self.last_ordinal is None:
+            self.last_ordinal = latest.ordinal
+            return 0
+
+        count = 0
+        for ordinal in range(self.last_ordinal + 1, latest.ordinal + 1):
+            transactions = await self.network.get_transactions_by_snapshot(ordinal)
+            count += self.dispatch(ordinal, transactions)
+            # Only advance after a complete snapshot, a failed request is retried on the next tick
+            self.last_ordinal = ordinal
+        return count
+
+    def dispatch(self, ordinal: int, transactions: List[Transaction]) -> int:
+        """
+        Dispatch the transactions of a snapshot to the subscribers of the watched addresses.
+
+        :param ordinal: Snapshot ordinal.
+        :param transactions: Transactions included in the snapshot.
+        :return: Number of dispatched transaction events.
+        """
+        count = 0
+        deltas: Dict[str, int] = {}
+        for tx in transactions:
+            for address, direction, delta in (
+                (tx.source, "outgoing", -(tx.amount + tx.fee)),
+                (tx.destination, "incoming", tx.amount),
+            ):
+                if address not in self._index:
+                    continue
+                deltas[address] = deltas.get(address, 0) + delta
+                self._emit(
+                    address,
+                    {
+                        "module": "address_watcher",
+                        "event": "transaction",
+                        "address": address,
+                        "direction": direction,
+                        "delta": delta,
+                        "snapshot": ordinal,
+                        "transaction": tx,
+                    },
+                )
+                count += 1
+
+        for address, delta in deltas.items():
+            if delta:
+                self._emit(
+                    address,
+                    {
+                        "module": "address_watcher",
+                        "event": "balance_change",
+                        "address": address,
+                        "delta": delta,
+                        "snapshot": ordinal,
+                    },
+                )
+        return count
+
+    def _emit(self, address: str, event: Dict[str, Any]):
+        try:
+            subject = self._index.get(address)
+            if subject is not None:
+                subject.on_next(event)
+            self._transaction_change.on_next(event)
+        except Exception as e:
+            logger.error(f"AddressWatcher :: Error in event handler: {e}")
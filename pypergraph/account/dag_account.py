@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional, Union, Tuple, List
@@ -7,7 +8,7 @@ from rx.subject import Subject
 
 from pypergraph.account.models.key_trio import KeyTrio
 from pypergraph.network.shared.operations import allow_spend, token_lock
-from pypergraph.keystore import KeyStore
+from pypergraph.keystore import KeyStore, Signer
 from pypergraph.network import DagTokenNetwork
 from pypergraph.network.models.transaction import (
     TransactionStatus,
@@ -19,9 +20,14 @@ from pypergraph.network.models.transaction import (
 
 
 class DagAccount:
-    def __init__(self):
-        self.network: DagTokenNetwork = DagTokenNetwork()
+    def __init__(self, network: Optional[DagTokenNetwork] = None):
+        """
+        :param network: (Optional) Network instance, e.g. shared by several accounts. Default: new mainnet DagTokenNetwork.
+        """
+        self.network: DagTokenNetwork = network or DagTokenNetwork()
         self.key_trio: Optional[KeyTrio] = None
+        # Signs with the key held by a SigningDaemon, see login_with_signer()
+        self.signer: Optional[Signer] = None
         self._session_change: Subject = Subject()
 
     def connect(
@@ -124,6 +130,18 @@ class DagAccount:
         address = KeyStore.get_dag_address_from_public_key(public_key)
         self._set_keys_and_address(None, public_key, address)
 
+    async def login_with_signer(self, signer: Signer, address: str):
+        """
+        Login with an account served by a SigningDaemon, the private key stays in the daemon.
+        Transactions, allow spends and token locks are signed by the daemon.
+
+        :param signer: Signer connected to the daemon's socket.
+        :param address: DAG address served by the daemon.
+        """
+        public_key = await signer.get_public_key(address)
+        self.login_with_public_key(public_key)
+        self.signer = signer
+
     def is_active(self):
         """
         Check if any account is logged in.
@@ -139,6 +157,7 @@ class DagAccount:
         :return:
         """
         self.key_trio = None
+        self.signer = None
         try:
             self._session_change.on_next({"module": "account", "event": "logout"})
         except Exception as e:
@@ -151,6 +170,7 @@ class DagAccount:
         self.key_trio = KeyTrio(
             private_key=private_key, public_key=public_key, address=address
         )
+        self.signer = None
         try:
             self._session_change.on_next({"module": "account", "event": "login"})
         except Exception as e:
@@ -177,6 +197,21 @@ class DagAccount:
             return int(response.balance)
         return 0
 
+    async def _sign_hashes(self, hashes: List[str]) -> List[str]:
+        # One batched request when a SigningDaemon holds the key
+        if self.signer is not None:
+            return await self.signer.sign_many(self.address, hashes)
+        return [KeyStore.sign(self.key_trio.private_key, hash_) for hash_ in hashes]
+
+    def _build_signed_transaction(
+        self, tx, hash_: str, signature: str
+    ) -> SignedTransaction:
+        valid = KeyStore.verify(self.public_key, hash_, signature)
+        if not valid:
+            raise ValueError("Wallet :: Invalid signature.")
+        proof = SignatureProof(id=self.public_key[2:], signature=signature)
+        return SignedTransaction(value=tx, proofs=[proof])
+
     async def generate_signed_transaction(
         self,
         to_address: str,
@@ -208,13 +243,8 @@ class DagAccount:
             last_ref=last_ref,
             fee=fee,
         )
-        signature = KeyStore.sign(self.key_trio.private_key, hash_)
-        valid = KeyStore.verify(self.public_key, hash_, signature)
-        if not valid:
-            raise ValueError("Wallet :: Invalid signature.")
-        proof = SignatureProof(id=self.public_key[2:], signature=signature)
-        tx = SignedTransaction(value=tx, proofs=[proof])
-        return tx, hash_
+        (signature,) = await self._sign_hashes([hash_])
+        return self._build_signed_transaction(tx, hash_, signature), hash_
 
     async def transfer(
         self, to_address: str, amount: int, fee: int = 0, auto_estimate_fee=False
@@ -286,6 +316,7 @@ class DagAccount:
             valid_until_epoch=valid_until_epoch,
             network=self.network,
             key_trio=self.key_trio,
+            signer=self.signer,
         )
         return response
 
@@ -323,6 +354,7 @@ class DagAccount:
             unlock_epoch=unlock_epoch,
             network=self.network,
             key_trio=self.key_trio,
+            signer=self.signer,
         )
         return response
 
@@ -358,13 +390,28 @@ class DagAccount:
 
         return True
 
-    async def wait_for_balance_change(self, initial_value: Optional[int] = None):
+    async def wait_for_balance_change(
+        self, initial_value: Optional[int] = None, monitor=None, timeout: float = 120
+    ):
         """
         Check if balance changed since initial value.
 
         :param initial_value:
+        :param monitor: (Optional) Monitor of this account. The balance is then checked by the monitor's
+            polling loop, shared by all waiters, instead of polling the network per caller.
+        :param timeout: Seconds to wait when using a monitor.
         :return: True if balance changed, False if no change.
         """
+        if monitor is not None:
+            try:
+                await asyncio.wait_for(
+                    monitor.wait_for_balance_change(self.address, initial_value),
+                    timeout,
+                )
+                return True
+            except asyncio.TimeoutError:
+                return False
+
         if initial_value is None:
             initial_value = await self.get_balance()
             await self.wait(5)
@@ -401,18 +448,24 @@ class DagAccount:
                 self.address
             )
 
-        txns = []
+        # The hashes chain without signatures, so all transactions are signed in one batch
+        prepared = []
         for transfer in transfers:
-            transaction, hash_ = await self.generate_signed_transaction(
-                to_address=transfer["to_address"],
+            tx, hash_ = KeyStore.prepare_tx(
                 amount=transfer["amount"],
-                fee=transfer.get("fee", 0),
+                to_address=transfer["to_address"],
+                from_address=self.address,
                 last_ref=last_ref,
+                fee=transfer.get("fee", 0),
             )
             last_ref = TransactionReference(ordinal=last_ref.ordinal + 1, hash=hash_)
-            txns.append(transaction)
+            prepared.append((tx, hash_))
 
-        return txns
+        signatures = await self._sign_hashes([hash_ for _, hash_ in prepared])
+        return [
+            self._build_signed_transaction(tx, hash_, signature)
+            for (tx, hash_), signature in zip(prepared, signatures)
+        ]
 
     async def transfer_batch_transactions(self, transactions: List[SignedTransaction]):
         """
@@ -0,0 +1,271 @@
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+
+from pydantic import BaseModel, Field
+from rx.subject import Subject
+
+from pypergraph.keystore.signing_worker import handle_requests, init_worker
+
+logger = logging.getLogger(__name__)
+
+
+class DataUpdateResult(BaseModel):
+    index: int = Field(ge=0)  # Position in the update stream
+    hash: Optional[str] = None  # Hash returned by the data layer 1
+    error: Optional[str] = None
+
+    @property
+    def sent(self) -> bool:
+        return self.hash is not None
+
+
+class DataPipelineReport(BaseModel):
+    results: List[DataUpdateResult] = Field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def sent(self) -> int:
+        return sum(1 for r in self.results if r.sent)
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if not r.sent)
+
+
+class DataUpdatePipeline:
+    """
+    Sign and post a stream of metagraph data updates from the account of a MetagraphTokenClient.
+
+    Updates are read in chunks, each chunk is encoded and signed (KeyStore.data_sign) in a pool of worker
+    processes, or by the SigningDaemon if the account logged in with a Signer, and the signed updates are
+    posted to the data layer 1 with at most max_in_flight requests at a time. Reading the stream pauses
+    while the signed updates wait for a free request slot.
+    """
+
+    def __init__(
+        self,
+        client,
+        encoding: Optional[Union[Literal["base64"], Callable[[dict], str]]] = None,
+        prefix: Union[bool, str] = True,
+        workers: Optional[int] = None,
+        chunk_size: int = 64,
+        max_in_flight: int = 16,
+    ):
+        """
+        :param client: MetagraphTokenClient with a data layer 1 host and a logged in account.
+        :param encoding: None (JSON, default), 'base64' or a custom encoding function, see KeyStore.data_sign().
+            With workers, the function must be importable by the worker processes (defined at module level).
+        :param prefix: Enable or disable the default data signing prefix, or inject a custom prefix.
+        :param workers: (Optional) Number of signing worker processes, 0 to sign in the event loop.
+            Default: One per CPU.
+        :param chunk_size: Number of updates signed per worker task.
+        :param max_in_flight: Maximum number of concurrent post requests.
+        """
+        if client.network.dl1_api is None:
+            raise ValueError(
+                "DataUpdatePipeline :: The client has no data layer 1 host."
+            )
+        account = client.account
+        if account.signer is None and not account.key_trio.private_key:
+            raise ValueError(
+                "DataUpdatePipeline :: The account needs a private key or a signer."
+            )
+        if account.signer is not None and callable(encoding):
+            raise ValueError(
+                "DataUpdatePipeline :: Custom encoding functions are not supported with a signer."
+            )
+        self.client = client
+        self.encoding = encoding
+        self.prefix = prefix
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.max_in_flight = max_in_flight
+        self._progress_change: Subject = Subject()
+
+    async def run(
+        self, updates: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+    ) -> DataPipelineReport:
+        """
+        Sign and post all updates.
+
+        :param updates: Iterable or async iterable of data updates (the 'value' of each signed update).
+        :return: DataPipelineReport with a result per update, in stream order.
+        """
+        start = time.monotonic()
+        account = self.client.account
+        keys = None
+        executor = None
+        if account.signer is None:
+            keys = {
+                account.address: {
+                    "private_key": account.private_key,
+                    "public_key": account.public_key,
+                }
+            }
+            if self.workers != 0:
+                executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=init_worker,
+                    initargs=(keys,),
+                )
+
+        results: Dict[int, DataUpdateResult] = {}
+        progress = {"total": 0, "sent": 0, "failed": 0}
+        # Signed updates waiting for a post slot, a full queue pauses the stream
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_in_flight)
+        posters = [
+            asyncio.create_task(self._post_updates(queue, results, progress))
+            for _ in range(self.max_in_flight)
+        ]
+        # One chunk per worker is signed at a time
+        signing = asyncio.Semaphore(
+            1 if executor is None else self.workers or os.cpu_count() or 1
+        )
+        sign_tasks = set()
+
+        async def sign(chunk):
+            try:
+                await self._sign_chunk(chunk, keys, executor, queue, results, progress)
+            finally:
+                signing.release()
+
+        def start_signing(chunk):
+            task = asyncio.create_task(sign(chunk))
+            sign_tasks.add(task)
+            task.add_done_callback(sign_tasks.discard)
+
+        try:
+            chunk = []
+            async for update in self._iterate(updates):
+                chunk.append((progress["total"], update))
+                progress["total"] += 1
+                if len(chunk) == self.chunk_size:
+                    await signing.acquire()
+                    start_signing(chunk)
+                    chunk = []
+            if chunk:
+                await signing.acquire()
+                start_signing(chunk)
+            await asyncio.gather(*sign_tasks)
+            await queue.join()
+        finally:
+            pending = [*sign_tasks, *posters]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+        return DataPipelineReport(
+            results=[results[i] for i in sorted(results)],
+            duration=time.monotonic() - start,
+        )
+
+    @staticmethod
+    async def _iterate(updates):
+        if hasattr(updates, "__aiter__"):
+            async for update in updates:
+                yield update
+        else:
+            for update in updates:
+                yield update
+
+    async def _sign_chunk(
+        self,
+        chunk: List[tuple],
+        keys: Optional[Dict[str, Dict[str, str]]],
+        executor: Optional[ProcessPoolExecutor],
+        queue: asyncio.Queue,
+        results: Dict[int, DataUpdateResult],
+        progress: Dict[str, int],
+    ):
+        account = self.client.account
+        requests = [
+            {
+                "op": "data_sign",
+                "address": account.address,
+                "msg": update,
+                "prefix": self.prefix,
+                "encoding": self.encoding,
+            }
+            for _, update in chunk
+        ]
+        try:
+            if account.signer is not None:
+                signed = await account.signer.request(requests)
+            elif executor is not None:
+                signed = await asyncio.get_running_loop().run_in_executor(
+                    executor, handle_requests, requests
+                )
+            else:
+                signed = handle_requests(requests, keys)
+        except Exception as e:
+            logger.error(f"DataUpdatePipeline :: {e}", exc_info=True)
+            signed = [{"error": f"Unable to sign: {e}"}] * len(chunk)
+
+        proof_id = account.public_key[2:]
+        for (index, update), result in zip(chunk, signed):
+            if "error" in result:
+                results[index] = DataUpdateResult(index=index, error=result["error"])
+                progress["failed"] += 1
+                self._emit_progress(progress)
+                continue
+            tx = {
+                "value": update,
+                "proofs": [{"id": proof_id, "signature": result["signature"]}],
+            }
+            await queue.put((index, tx))
+
+    async def _post_updates(
+        self,
+        queue: asyncio.Queue,
+        results: Dict[int, DataUpdateResult],
+        progress: Dict[str, int],
+    ):
+        while True:
+            index, tx = await queue.get()
+            item = DataUpdateResult(index=index)
+            try:
+                response = await self.client.network.post_data(tx)
+                item.hash = response.get("hash") if response else None
+                if not item.hash:
+                    raise ValueError("No hash returned by data layer 1.")
+            except Exception as e:
+                logger.error(f"DataUpdatePipeline :: {e}", exc_info=True)
+                item.error = str(e)
+            results[index] = item
+            progress["sent" if item.sent else "failed"] += 1
+            self._emit_progress(progress)
+            queue.task_done()
+
+    def _emit_progress(self, progress: Dict[str, int]):
+        try:
+            self._progress_change.on_next(
+                {"module": "data_pipeline", "event": "progress", **progress}
+            )
+        except Exception as e:
+            logger.error(f"DataUpdatePipeline :: Error in progress handler: {e}")
+
+    def subscribe_progress(self, callback):
+        """
+        Listen for progress events. The total grows while the update stream is read.
+        Event = {"module": "data_pipeline", "event": "progress", "total": n, "sent": n, "failed": n}
+
+        :param callback: Callable receiving the event dictionary.
+        :return: Disposable, use dispose() to unsubscribe.
+        """
+        return self._progress_change.subscribe(on_next=callback)
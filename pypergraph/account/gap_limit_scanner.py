@@ -0,0 +1,128 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from pypergraph.core import NetworkId
+from pypergraph.core.exceptions import NetworkError
+from pypergraph.keyring.keyrings.hd_deriver import DerivedKey, HdDeriver
+from pypergraph.network import DagTokenNetwork
+
+logger = logging.getLogger(__name__)
+
+
+class ScanResult(BaseModel):
+    used: List[DerivedKey] = Field(default_factory=list)  # Ordered by index
+    scanned: int = Field(default=0, ge=0)
+    last_used_index: Optional[int] = None
+
+    @property
+    def num_of_accounts(self) -> int:
+        """Number of accounts to restore, e.g. MultiAccountWallet(num_of_accounts=...)."""
+        return 0 if self.last_used_index is None else self.last_used_index + 1
+
+
+class GapLimitScanner:
+    """
+    Discover the used indexes of an HD wallet.
+
+    Addresses are derived in batches and checked concurrently for a balance or transaction history.
+    The scan stops after gap_limit consecutive unused indexes (BIP44 account discovery).
+    """
+
+    def __init__(
+        self,
+        network=None,
+        gap_limit: int = 20,
+        max_concurrent_checks: int = 8,
+    ):
+        """
+        :param network: (Optional) DagTokenNetwork or MetagraphTokenNetwork. Default: new mainnet DagTokenNetwork.
+        :param gap_limit: Number of consecutive unused indexes ending the scan.
+        :param max_concurrent_checks: Maximum number of addresses checked at once.
+        """
+        if gap_limit < 1:
+            raise ValueError("GapLimitScanner :: The gap limit must be at least 1.")
+        self.network = network or DagTokenNetwork()
+        self.gap_limit = gap_limit
+        self.max_concurrent_checks = max_concurrent_checks
+
+    async def is_used(self, address: str) -> bool:
+        """
+        :param address: DAG address.
+        :return: True if the address holds a balance or has transactions. Lookup errors are raised, an
+            unreachable node or block explorer must not make an address look unused.
+        """
+        balance, transactions = await asyncio.gather(
+            self._get_balance(address), self._get_transactions(address)
+        )
+        return balance > 0 or bool(transactions)
+
+    async def _get_transactions(self, address: str) -> list:
+        # The network wrappers return None on any error, call the block explorer directly
+        metagraph_id = getattr(self.network.connected_network, "metagraph_id", None)
+        try:
+            if metagraph_id:
+                return await self.network.be_api.get_currency_transactions_by_address(
+                    metagraph_id, address, limit=1
+                )
+            return await self.network.be_api.get_transactions_by_address(
+                address, limit=1
+            )
+        except NetworkError as e:
+            # The block explorer responds 404 for addresses without transactions
+            if e.status == 404:
+                return []
+            raise e
+
+    async def _get_balance(self, address: str) -> int:
+        try:
+            return (await self.network.get_address_balance(address)).balance
+        except NetworkError as e:
+            # Addresses never used may be unknown to the node
+            if e.status == 404:
+                return 0
+            raise e
+
+    async def scan(self, deriver: HdDeriver, start: int = 0) -> ScanResult:
+        """
+        Derive and check addresses until gap_limit consecutive indexes are unused.
+
+        :param deriver: HdDeriver of the wallet's mnemonic.
+        :param start: First index.
+        :return: ScanResult with the used indexes.
+        """
+        if deriver.network != NetworkId.Constellation.value:
+            raise ValueError(
+                "GapLimitScanner :: Only Constellation addresses can be scanned."
+            )
+        # Created in the running event loop
+        semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+
+        async def check(address: str) -> bool:
+            async with semaphore:
+                return await self.is_used(address)
+
+        result = ScanResult()
+        index = start
+        while True:
+            # Scan until gap_limit indexes following the last used index (or the start) are unused
+            first_unused = (
+                start if result.last_used_index is None else result.last_used_index + 1
+            )
+            count = first_unused + self.gap_limit - index
+            if count <= 0:
+                break
+            keys = await deriver.derive(index, count)
+            used = await asyncio.gather(*[check(key.address) for key in keys])
+            for key, is_used in zip(keys, used):
+                if is_used:
+                    result.used.append(key)
+                    result.last_used_index = key.index
+            result.scanned += len(keys)
+            index += count
+            logger.debug(
+                f"GapLimitScanner :: Scanned {result.scanned} addresses, last used index: {result.last_used_index}."
+            )
+        return result
@@ -9,6 +9,7 @@ from pypergraph.network.models.transaction import (
     TransactionReference,
 )
 from pypergraph.network.metagraph_network import MetagraphTokenNetwork
+from pypergraph.network.shared.balance_cache import BalanceSnapshot
 
 
 class MetagraphTokenClient:
@@ -80,6 +81,34 @@ class MetagraphTokenClient:
             return int(response.balance)
         return 0
 
+    async def get_balance_at_ordinal(
+        self, ordinal: int, address: Optional[str] = None
+    ) -> int:
+        """
+        Get Metagraph token balance at a snapshot ordinal, cached since it never changes. Ordinals past the
+        latest snapshot ordinal raise ValueError.
+
+        :param ordinal: Snapshot ordinal.
+        :param address: (Optional) DAG address. Default: The active account.
+        :return: Integer.
+        """
+        response = await self.network.get_address_balance_at_ordinal(
+            ordinal, address or self.address
+        )
+        return int(response.balance)
+
+    async def get_balances_at_ordinal(
+        self, addresses: List[str], ordinal: Optional[int] = None
+    ) -> BalanceSnapshot:
+        """
+        Get Metagraph token balances of many addresses at one snapshot ordinal, e.g. for end-of-day statements.
+
+        :param addresses: DAG addresses.
+        :param ordinal: (Optional) Snapshot ordinal. Default: Pin the latest snapshot ordinal.
+        :return: BalanceSnapshot with the ordinal and the balance per address.
+        """
+        return await self.network.get_balances_at_ordinal(addresses, ordinal)
+
     async def get_fee_recommendation(self):
         # TODO: Fee api
         last_ref = await self.network.get_address_last_accepted_transaction_ref(
@@ -127,6 +156,7 @@ class MetagraphTokenClient:
             valid_until_epoch=valid_until_epoch,
             network=self.network,
             key_trio=self.account.key_trio,
+            signer=self.account.signer,
         )
         return response
 
@@ -164,6 +194,7 @@ class MetagraphTokenClient:
             unlock_epoch=unlock_epoch,
             network=self.network,
             key_trio=self.account.key_trio,
+            signer=self.account.signer,
         )
         return response
 
@@ -1,13 +1,11 @@
-# TODO: wait_for
-#       Storage path
+# TODO: Storage path
 
 import asyncio
 import logging
 import time
 import json
 
-# from dataclasses import dataclass
-from typing import Dict, Union, List, Optional, Any, Callable
+from typing import Dict, Union, List, Optional, Any, Callable, Tuple, Literal
 
 from pydantic import BaseModel, Field
 from rx import operators as ops, of, empty, Observable
@@ -17,17 +15,21 @@ from rx.subject import BehaviorSubject
 
 from pypergraph.account.tests import secret
 from pypergraph.core.cross_platform.state_storage_db import StateStorageDb
-from pypergraph.network.models.network import NetworkInfo
 from pypergraph.network.models.transaction import TransactionStatus, PendingTransaction
 from pypergraph.network.models.block_explorer import Transaction
 
 TWELVE_MINUTES = 12 * 60 * 1000
-
-
-# @dataclass
-# class WaitFor:
-#     future: asyncio.Future
-#     resolve: callable
+MIN_CHECK_AGE = 5 * 1000  # A freshly posted transaction can't be in a snapshot yet
+MAX_SNAPSHOT_CATCH_UP = 20  # Fall back to per-hash lookups when further behind
+SNAPSHOT_LOOKUP_AFTER = (
+    5  # Look up transactions not matched within this many snapshots by hash
+)
+# Polling intervals in seconds
+MIN_POLL_INTERVAL = 2.0
+MAX_POLL_INTERVAL = 60.0
+POLL_BACKOFF = 0.25  # Interval as a fraction of the youngest pending transaction's age
+SNAPSHOT_INTERVAL = 10.0  # Expected snapshot cadence, slower polls are aligned to it
+SNAPSHOT_GRACE = 1.0  # Time for the block explorer to index a new snapshot
 
 
 class DagWalletMonitorUpdate(BaseModel):
@@ -36,21 +38,115 @@ class DagWalletMonitorUpdate(BaseModel):
     tx_changed: bool = False
 
 
+class MemPool:
+    """
+    Pending transactions indexed by hash. The compact records (without hash and unset fields) are kept
+    next to the transactions and stored as {hash: record}.
+    """
+
+    def __init__(self, records: Optional[Dict[str, dict]] = None):
+        self.records: Dict[str, dict] = records or {}
+        self.txs: Dict[str, PendingTransaction] = {
+            hash_: PendingTransaction(hash=hash_, **record)
+            for hash_, record in self.records.items()
+        }
+
+    @classmethod
+    def from_stored(cls, stored) -> "MemPool":
+        if isinstance(stored, list):
+            # Memory pools were stored as a list of (JSON) transactions
+            pool = cls()
+            for tx in stored:
+                pool.put(
+                    PendingTransaction(
+                        **(json.loads(tx) if isinstance(tx, str) else tx)
+                    )
+                )
+            return pool
+        # The pool changes its records in place, don't change the stored (cached) value
+        return cls(dict(stored or {}))
+
+    def __contains__(self, hash_: str) -> bool:
+        return hash_ in self.txs
+
+    def __len__(self) -> int:
+        return len(self.txs)
+
+    def values(self) -> List[PendingTransaction]:
+        return list(self.txs.values())
+
+    def put(self, tx: PendingTransaction):
+        """Add or update a transaction."""
+        self.txs[tx.hash] = tx
+        self.records[tx.hash] = tx.model_dump(exclude={"hash"}, exclude_none=True)
+
+    def remove(self, hash_: str):
+        self.txs.pop(hash_, None)
+        self.records.pop(hash_, None)
+
+
+class MonitorMetrics(BaseModel):
+    ticks: int = 0
+    last_tick_duration: float = 0.0
+    max_tick_duration: float = 0.0
+    total_tick_duration: float = 0.0
+    next_interval: Optional[float] = None  # None while idle
+
+    @property
+    def average_tick_duration(self) -> float:
+        return self.total_tick_duration / self.ticks if self.ticks else 0.0
+
+    def record(self, duration: float):
+        self.ticks += 1
+        self.last_tick_duration = duration
+        self.max_tick_duration = max(self.max_tick_duration, duration)
+        self.total_tick_duration += duration
+
+
 class Monitor:
-    def __init__(self, account, state_storage_file_path: str):
+    def __init__(
+        self,
+        account,
+        state_storage_file_path: str,
+        max_concurrent_checks: int = 10,
+        confirmation: Literal["poll", "snapshot"] = "poll",
+        storage_flush_interval: Optional[float] = 1.0,
+    ):
         """
         Monitors events and stores states.
 
-        :param account: DagAccount()
+        :param account: DagAccount() or MetagraphTokenClient().
         :param state_storage_file_path: Full path and filename to storage (with file extension).
+        :param max_concurrent_checks: Maximum number of pending transactions looked up at the same time.
+        :param confirmation: 'poll' looks up every pending transaction hash in the block explorer.
+            'snapshot' follows new (global or currency) snapshots and matches their transactions against
+            the pending hashes, i.e. one request per snapshot regardless of the number of pending transactions.
+        :param storage_flush_interval: Seconds memory pool changes are kept in memory before they are written to
+            the storage file. Set None to write every change immediately. Changes are flushed by stop().
         """
+        if confirmation not in ("poll", "snapshot"):
+            raise ValueError(
+                f"Monitor :: Unsupported confirmation strategy: {confirmation}"
+            )
         self.account = account
+        self.max_concurrent_checks = max_concurrent_checks
+        self.confirmation = confirmation
+        self._last_snapshot_ordinal: Optional[int] = None
+        self._last_snapshot_time: Optional[float] = None
+        # Hash: snapshot ordinal since which the transaction wasn't matched
+        self._unmatched_since: Dict[str, int] = {}
         self._scheduler = AsyncIOScheduler(asyncio.get_event_loop())
         self._mem_pool_change = BehaviorSubject(DagWalletMonitorUpdate().model_dump())
-        self.last_timer = 0.0
-        self.pending_timer = 0.0
-        # self.wait_for_map: Dict[str, WaitFor] = {}
-        self.cache_utils = StateStorageDb(file_path=state_storage_file_path)
+        self._poll_task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.metrics = MonitorMetrics()
+        self._mem_pools: Dict[str, MemPool] = {}  # Storage key: MemPool
+        self.wait_for_map: Dict[str, List[asyncio.Future]] = {}
+        # Address: [[initial balance, future], ...]
+        self.wait_for_balance_map: Dict[str, List[List[Any]]] = {}
+        self.cache_utils = StateStorageDb(
+            file_path=state_storage_file_path, flush_interval=storage_flush_interval
+        )
         self.cache_utils.set_prefix("pypergraph-")
 
     def subscribe_mem_pool(self, callback: Callable[[Any], Observable]) -> Disposable:
@@ -108,57 +204,57 @@ class Monitor:
         ).subscribe()
         return subscription  # subscription.dispose() to unsub
 
-    async def set_to_mem_pool_monitor(self, pool: List[PendingTransaction]):
+    def _mem_pool_key(self) -> str:
         network_info = self.account.network.get_network()
-        key = f"network-{network_info['network_id'].lower()}-mempool"
-        await self.cache_utils.set(key, [tx.model_dump() for tx in pool])
+        return f"network-{network_info['network_id'].lower()}-mempool"
+
+    async def _get_mem_pool(self) -> MemPool:
+        key = self._mem_pool_key()
+        if key not in self._mem_pools:
+            try:
+                pool = MemPool.from_stored(await self.cache_utils.get(key))
+            except Exception as e:
+                logging.warning(f"Monitor :: {e}, will use empty pool.", exc_info=True)
+                pool = MemPool()
+            # Another coroutine may have loaded the pool meanwhile
+            self._mem_pools.setdefault(key, pool)
+        return self._mem_pools[key]
+
+    async def _save_mem_pool(self, pool: MemPool):
+        # The pool keeps changing its records, store a copy
+        await self.cache_utils.set(self._mem_pool_key(), dict(pool.records))
+
+    async def set_to_mem_pool_monitor(self, pool: List[PendingTransaction]):
+        mem_pool = MemPool()
+        for tx in pool:
+            mem_pool.put(tx)
+        self._mem_pools[self._mem_pool_key()] = mem_pool
+        await self._save_mem_pool(mem_pool)
 
     async def get_mem_pool_from_monitor(
         self, address: Optional[str] = None
     ) -> List[PendingTransaction]:
         address = address or self.account.address
-        network_info = self.account.network.get_network()
-
-        try:
-            txs: List[json] = (
-                await self.cache_utils.get(
-                    f"network-{network_info['network_id'].lower()}-mempool"
-                )
-                or []
-            )
-            txs = (
-                [
-                    PendingTransaction(**json.loads(tx))
-                    if not isinstance(tx, dict)
-                    else PendingTransaction(**tx)
-                    for tx in txs
-                ]
-                if txs
-                else []
-            )
-        except Exception as e:
-            logging.warning(f"Monitor :: {e}, will return empty list.", exc_info=True)
-            return []
+        pool = await self._get_mem_pool()
         return [
             tx
-            for tx in txs
+            for tx in pool.values()
             if not address
             or not tx.receiver
             or tx.receiver == address
             or tx.sender == address
         ]
 
-    async def add_to_mem_pool_monitor(
-        self, value: PendingTransaction
-    ):  # 'value' can be a dict or string
-        network_info = NetworkInfo(**self.account.network.get_network())
-        key = f"network-{network_info.network_id}-mempool"
-
-        # Get cached payload or initialize empty list
-        cached = await self.cache_utils.get(key)
-        payload = cached if isinstance(cached, list) else []
-        payload = [PendingTransaction(**p) for p in payload]
+    async def remove_from_mem_pool_monitor(self, hash: str):
+        pool = await self._get_mem_pool()
+        if hash in pool:
+            pool.remove(hash)
+            self._unmatched_since.pop(hash, None)
+            await self._save_mem_pool(pool)
 
+    async def add_to_mem_pool_monitor(
+        self, value: Union[PendingTransaction, str]
+    ):  # 'value' can be a PendingTransaction or hash
         # Create transaction object
         if isinstance(value, str):
             tx = PendingTransaction(
@@ -169,39 +265,124 @@ class Monitor:
         else:
             raise ValueError("Monitor :: Must be PendingTransaction or hash.")
 
-        # Check for existing transaction
-        if not any(p.hash == tx.hash for p in payload):
-            payload.append(tx)
-            payload = [tx.model_dump_json(indent=2) for tx in payload]
-            await self.cache_utils.set(key, payload)
-            self.last_timer = int(time.time() * 1000)
-            self.pending_timer = 1000
+        pool = await self._get_mem_pool()
+        if tx.hash not in pool:
+            pool.put(tx)
+            await self._save_mem_pool(pool)
 
-        asyncio.create_task(self.poll_pending_txs())
+        self.start()
+        self._wake.set()
         return tx.model_dump()
 
-    async def poll_pending_txs(self):
-        try:
-            current_time = int(time.time() * 1000)
-            if current_time - self.last_timer + 1000 < self.pending_timer:
-                logging.debug("Monitor :: Canceling extra timer.")
-                return
+    @property
+    def running(self) -> bool:
+        return self._poll_task is not None and not self._poll_task.done()
+
+    def start(self):
+        """
+        Start the polling scheduler. A single task polls the pending transactions, calling start() again
+        has no effect.
+        """
+        if self.running:
+            return
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        self._wake.set()  # Poll the stored memory pool right away
+        self._poll_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stop the polling scheduler, wait for the running tick to be cancelled and flush the storage.
+        Futures from wait_for_transaction() and wait_for_balance_change() are cancelled.
+        """
+        task, self._poll_task = self._poll_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        futures = [f for waiters in self.wait_for_map.values() for f in waiters]
+        futures += [
+            f for waiters in self.wait_for_balance_map.values() for _, f in waiters
+        ]
+        self.wait_for_map, self.wait_for_balance_map = {}, {}
+        for future in futures:
+            future.cancel()
+        await self.cache_utils.close()
+
+    def start_monitor(self):
+        self.start()
+
+    async def _run(self):
+        interval = None
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            # Transactions added during the tick wake the scheduler again
+            self._wake.clear()
+
+            start = time.monotonic()
+            pending_txs = await self.poll_pending_txs()
+            await self._check_balances()
+            self.metrics.record(time.monotonic() - start)
+            if pending_txs is None:
+                # The check failed, back off and retry instead of going idle with transactions pending
+                interval = (
+                    MIN_POLL_INTERVAL
+                    if interval is None
+                    else min(interval * 2, MAX_POLL_INTERVAL)
+                )
+            elif pending_txs:
+                interval = self._next_interval(pending_txs)
+            elif self.wait_for_balance_map:
+                interval = SNAPSHOT_INTERVAL
+            else:
+                # Nothing to watch: sleep until a transaction or waiter is added
+                interval = None
+            self.metrics.next_interval = interval
+
+    def _next_interval(self, pending_txs: List[PendingTransaction]) -> float:
+        """
+        Seconds until the next tick. Polls fast right after a post and backs off as the youngest pending
+        transaction ages. Slower polls are aligned to just after the next expected snapshot.
+
+        :param pending_txs: The transactions still pending.
+        :return: Float.
+        """
+        now = time.time()
+        age = now - max(tx.timestamp for tx in pending_txs) / 1000
+        interval = min(max(age * POLL_BACKOFF, MIN_POLL_INTERVAL), MAX_POLL_INTERVAL)
+        if interval < SNAPSHOT_INTERVAL:
+            return interval
+        if self._last_snapshot_time is not None:
+            since_snapshot = (now + interval - self._last_snapshot_time) % (
+                SNAPSHOT_INTERVAL
+            )
+            return (
+                interval
+                + (SNAPSHOT_INTERVAL - since_snapshot) % SNAPSHOT_INTERVAL
+                + SNAPSHOT_GRACE
+            )
+        # Snapshot times unknown, poll at a multiple of the snapshot cadence
+        return -(-interval // SNAPSHOT_INTERVAL) * SNAPSHOT_INTERVAL
 
+    async def poll_pending_txs(self) -> Optional[List[PendingTransaction]]:
+        """
+        Check the pending transactions once, store the remaining pool and emit a memory pool update.
+
+        :return: The transactions still pending, None if they couldn't be checked.
+        """
+        try:
             pending_result = await self.process_pending_txs()
+            if pending_result is None:
+                return None
             pending_txs = pending_result["pending_txs"]
             tx_changed = pending_result["tx_changed"]
             trans_txs = pending_result["trans_txs"]
             pending_has_confirmed = pending_result["pending_has_confirmed"]
-            pool_count = pending_result["pool_count"]
-
-            if pending_txs:
-                await self.set_to_mem_pool_monitor(pending_txs)
-                self.pending_timer = 1000
-                self.last_timer = current_time
-                await asyncio.sleep(10)
-                asyncio.create_task(self.poll_pending_txs())
-            elif pool_count > 0:
-                await self.set_to_mem_pool_monitor([])
 
             self._mem_pool_change.on_next(
                 DagWalletMonitorUpdate(
@@ -213,91 +394,215 @@ class Monitor:
             logging.debug(
                 f"Monitor :: Memory pool updated: {self._mem_pool_change.value}"
             )
+            return pending_txs
         except Exception as e:
             logging.error(f"Monitor :: {e}", exc_info=True)
+            return None
 
     async def process_pending_txs(self) -> Dict[str, Any]:
         try:
+            mem_pool = await self._get_mem_pool()
             pool = await self.get_mem_pool_from_monitor()
-            trans_txs = []
-            next_pool = []
-            pending_has_confirmed = False
-            tx_changed = False
+            now = int(time.time() * 1000)
+            semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+            snapshot_txs = (
+                await self._get_snapshot_transactions()
+                if self.confirmation == "snapshot" and pool
+                else None
+            )
 
-            for index, pending_tx in enumerate(pool):
-                pending_tx = pool[index]
-                try:
-                    tx_hash = pending_tx.hash
-                    try:
-                        be_tx = await self.account.network.get_transaction(tx_hash)
-                        if be_tx:
-                            pending_tx.timestamp = int(
-                                be_tx.timestamp.timestamp() * 1000
-                            )
-                            pending_has_confirmed = True
-                            tx_changed = True
-                            pending_tx.pending = False
-                            pending_tx.status = TransactionStatus.CONFIRMED.value
-                            pending_tx.pending_msg = "Confirmed"
-                            # if tx_hash in self.wait_for_map:
-                            #     self.wait_for_map[tx_hash].resolve(True)
-                            #     del self.wait_for_map[tx_hash]
-                        else:
-                            if (
-                                pending_tx.status != "CHECKPOINT_ACCEPTED"
-                                and pending_tx.status
-                                != TransactionStatus.GLOBAL_STATE_PENDING.value
-                                and pending_tx.timestamp + TWELVE_MINUTES
-                                < int(time.time() * 1000)
-                            ):
-                                pending_tx.status = TransactionStatus.DROPPED.value
-                                pending_tx.pending = False
-                                tx_changed = True
-                            else:
-                                if (
-                                    pending_tx.status
-                                    != TransactionStatus.GLOBAL_STATE_PENDING.value
-                                ):
-                                    pending_tx.status = (
-                                        TransactionStatus.GLOBAL_STATE_PENDING.value
-                                    )
-                                    pending_tx.pending_msg = "Will confirm shortly..."
-                                    tx_changed = True
-                                elif not pending_tx.status:
-                                    pending_tx.status = "UNKNOWN"
-                                    pending_tx.pending_msg = "Transaction not found..."
-                                next_pool.append(pending_tx)
-                    except Exception as e:
-                        logging.error(f"Monitor :: {e}", exc_info=True)
-
-                    trans_txs.append(pending_tx)
-                except Exception as e:
-                    logging.error(f"Monitor :: {e}", exc_info=True)
+            async def check(pending_tx: PendingTransaction) -> Tuple[bool, bool]:
+                # The snapshots read this tick aren't read again, so every transaction is matched against them
+                if snapshot_txs is None and now - pending_tx.timestamp < MIN_CHECK_AGE:
+                    # Too fresh to be included in a snapshot, status can't change yet
+                    return True, False
+                async with semaphore:
+                    return await self._check_pending_tx(pending_tx, snapshot_txs)
+
+            # The checks share the network instance and thereby its connection pool
+            results = await asyncio.gather(*[check(tx) for tx in pool])
 
+            next_pool = []
+            for tx, (keep, changed) in zip(pool, results):
+                if keep:
+                    next_pool.append(tx)
+                    if changed:
+                        mem_pool.put(tx)
+                else:
+                    mem_pool.remove(tx.hash)
+                    self._unmatched_since.pop(tx.hash, None)
+                    self._resolve(self.wait_for_map.pop(tx.hash, []), tx)
+            if any(changed for _, changed in results):
+                await self._save_mem_pool(mem_pool)
             return {
                 "pending_txs": next_pool,
-                "tx_changed": tx_changed,
-                "trans_txs": trans_txs,
-                "pending_has_confirmed": pending_has_confirmed,
+                "tx_changed": any(changed for _, changed in results),
+                "trans_txs": pool,
+                "pending_has_confirmed": any(
+                    tx.status == TransactionStatus.CONFIRMED.value for tx in pool
+                ),
                 "pool_count": len(pool),
             }
         except Exception as e:
             logging.error(f"Monitor :: {e}", exc_info=True)
 
-    # async def wait_for_transaction(self, hash: str) -> asyncio.Future:
-    #     """Execute function after transaction has finished."""
-    #     # TODO
-    #     if hash not in self.wait_for_map:
-    #         loop = asyncio.get_event_loop()
-    #         future = loop.create_future()
-    #         self.wait_for_map[hash] = WaitFor(
-    #             future=future,
-    #             resolve=lambda result: future.set_result(result)
-    #         )
-    #     return self.wait_for_map[hash].future
+    async def _get_snapshot_transactions(self) -> Optional[Dict[str, Transaction]]:
+        """
+        Get the transactions of all snapshots created since the last call, indexed by hash.
 
-    def start_monitor(self):
-        asyncio.create_task(self.poll_pending_txs())
+        :return: Dictionary {hash: Transaction} or None if the snapshots can't be followed (first call, too
+            far behind or network error), in which case the pending transactions are looked up by hash.
+        """
+        try:
+            latest = await self.account.network.get_latest_snapshot()
+            self._last_snapshot_time = latest.timestamp.timestamp()
+            last_ordinal = self._last_snapshot_ordinal
+            if last_ordinal is None or latest.ordinal - last_ordinal > (
+                MAX_SNAPSHOT_CATCH_UP
+            ):
+                # Transactions may have been confirmed in snapshots we haven't seen
+                self._last_snapshot_ordinal = latest.ordinal
+                return None
+
+            transactions = {}
+            for ordinal in range(last_ordinal + 1, latest.ordinal + 1):
+                for tx in await self.account.network.get_transactions_by_snapshot(
+                    ordinal
+                ):
+                    transactions[tx.hash] = tx
+                self._last_snapshot_ordinal = ordinal
+            return transactions
+        except Exception as e:
+            logging.error(f"Monitor :: {e}", exc_info=True)
+            return None
+
+    async def _check_pending_tx(
+        self,
+        pending_tx: PendingTransaction,
+        snapshot_txs: Optional[Dict[str, Transaction]] = None,
+    ) -> Tuple[bool, bool]:
+        """
+        Look up a pending transaction and update its status.
+
+        :param pending_tx: The pending transaction, updated in place.
+        :param snapshot_txs: (Optional) Transactions of the latest snapshots indexed by hash. If not set, or the
+            transaction wasn't matched within SNAPSHOT_LOOKUP_AFTER snapshots, the transaction is looked up in the
+            block explorer.
+        :return: Tuple (still pending, status changed).
+        """
+        try:
+            if snapshot_txs is not None:
+                be_tx = snapshot_txs.get(pending_tx.hash)
+                if be_tx is None and self._snapshot_lookup_due(pending_tx.hash):
+                    # E.g. added to the pool after the snapshot containing it was read
+                    be_tx = await self.account.network.get_transaction(pending_tx.hash)
+            else:
+                be_tx = await self.account.network.get_transaction(pending_tx.hash)
+        except Exception as e:
+            logging.error(f"Monitor :: {e}", exc_info=True)
+            return True, False
+
+        if be_tx:
+            pending_tx.timestamp = int(be_tx.timestamp.timestamp() * 1000)
+            pending_tx.pending = False
+            pending_tx.status = TransactionStatus.CONFIRMED.value
+            pending_tx.pending_msg = "Confirmed"
+            return False, True
+
+        if (
+            pending_tx.status != "CHECKPOINT_ACCEPTED"
+            and pending_tx.status != TransactionStatus.GLOBAL_STATE_PENDING.value
+            and pending_tx.timestamp + TWELVE_MINUTES < int(time.time() * 1000)
+        ):
+            pending_tx.status = TransactionStatus.DROPPED.value
+            pending_tx.pending = False
+            return False, True
+
+        if pending_tx.status != TransactionStatus.GLOBAL_STATE_PENDING.value:
+            pending_tx.status = TransactionStatus.GLOBAL_STATE_PENDING.value
+            pending_tx.pending_msg = "Will confirm shortly..."
+            return True, True
+        elif not pending_tx.status:
+            pending_tx.status = "UNKNOWN"
+            pending_tx.pending_msg = "Transaction not found..."
+        return True, False
+
+    def _snapshot_lookup_due(self, hash_: str) -> bool:
+        ordinal = self._last_snapshot_ordinal
+        since = self._unmatched_since.setdefault(hash_, ordinal)
+        if ordinal - since < SNAPSHOT_LOOKUP_AFTER:
+            return False
+        # Look up again after another SNAPSHOT_LOOKUP_AFTER snapshots
+        self._unmatched_since[hash_] = ordinal
+        return True
+
+    def wait_for_transaction(self, hash: str) -> asyncio.Future:
+        """
+        Get a future resolved by the polling scheduler when a transaction in the memory pool is confirmed or
+        dropped. Add the transaction with add_to_mem_pool_monitor().
+
+        :param hash: Transaction hash.
+        :return: Future with the PendingTransaction, check its status for CONFIRMED or DROPPED.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.wait_for_map.setdefault(hash, []).append(future)
+        self.start()
+        return future
+
+    def wait_for_balance_change(
+        self, address: Optional[str] = None, initial_value: Optional[int] = None
+    ) -> asyncio.Future:
+        """
+        Get a future resolved by the polling scheduler when the balance of an address changes. The balance
+        is requested once per tick and address, regardless of the number of waiters.
+
+        :param address: DAG address. Default: Address of the monitored account.
+        :param initial_value: (Optional) Balance to compare with. Default: The first balance requested.
+        :return: Future with the new balance.
+        """
+        future = asyncio.get_running_loop().create_future()
+        address = address or self.account.address
+        self.wait_for_balance_map.setdefault(address, []).append(
+            [initial_value, future]
+        )
+        self.start()
+        self._wake.set()
+        return future
+
+    async def _check_balances(self):
+        semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+
+        async def check(address: str):
+            async with semaphore:
+                try:
+                    response = await self.account.network.get_address_balance(address)
+                except Exception as e:
+                    logging.error(f"Monitor :: {e}", exc_info=True)
+                    return
+            balance = int(response.balance) if response else 0
+            waiters = []
+            for waiter in self.wait_for_balance_map.get(address, []):
+                initial_value, future = waiter
+                if future.done():
+                    continue  # Cancelled or timed out
+                if initial_value is None:
+                    waiter[0] = balance
+                elif balance != initial_value:
+                    future.set_result(balance)
+                    continue
+                waiters.append(waiter)
+            if waiters:
+                self.wait_for_balance_map[address] = waiters
+            else:
+                self.wait_for_balance_map.pop(address, None)
+
+        await asyncio.gather(*[check(a) for a in list(self.wait_for_balance_map)])
+
+    @staticmethod
+    def _resolve(futures: List[asyncio.Future], result: Any):
+        for future in futures:
+            if not future.done():
+                future.set_result(result)
 
     async def get_latest_transactions(
         self,
@@ -353,6 +658,7 @@ async def main():
     print(txs)
     network_sub.dispose()
     await asyncio.sleep(120)
+    await monitor.stop()
     account.logout()
     await asyncio.sleep(1)
     mem_pool_sub.dispose()
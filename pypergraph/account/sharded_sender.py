@@ -0,0 +1,229 @@
+import asyncio
+import logging
+import time
+from typing import List, Optional, Dict, Any
+
+from pydantic import BaseModel, Field
+from rx.subject import Subject
+
+from pypergraph.account.dag_account import DagAccount
+from pypergraph.core import NetworkId
+from pypergraph.network import DagTokenNetwork
+from pypergraph.network.models.transaction import TransactionReference
+
+logger = logging.getLogger(__name__)
+
+
+class TransferResult(BaseModel):
+    index: int = Field(ge=0)  # Position in the original transfer list
+    source: str
+    to_address: str
+    amount: int = Field(ge=0)
+    fee: int = Field(default=0, ge=0)
+    hash: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def sent(self) -> bool:
+        return self.hash is not None
+
+
+class ShardResult(BaseModel):
+    source: str
+    results: List[TransferResult] = Field(default_factory=list)
+    last_ref: Optional[TransactionReference] = None
+    duration: float = 0.0
+
+
+class ShardedTransferReport(BaseModel):
+    shards: List[ShardResult] = Field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def results(self) -> List[TransferResult]:
+        """All transfer results ordered as the original transfer list."""
+        return sorted(
+            (r for shard in self.shards for r in shard.results), key=lambda r: r.index
+        )
+
+    @property
+    def sent(self) -> int:
+        return sum(1 for r in self.results if r.sent)
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if not r.sent)
+
+
+class ShardedSender:
+    """
+    Send a large list of $DAG transfers from several source accounts at once.
+
+    Transactions from one address must be chained by parent reference, so a single
+    account can only ever drive one serial chain. The sender splits the transfer
+    list across the accounts derived in a MultiAccountWallet or HdKeyring and drives
+    each account's chain concurrently.
+    """
+
+    def __init__(
+        self,
+        wallet,
+        network: Optional[DagTokenNetwork] = None,
+    ):
+        """
+        :param wallet: MultiAccountWallet or HdKeyring with Constellation accounts.
+        :param network: (Optional) Shared network instance. Default: new mainnet DagTokenNetwork.
+        """
+        self.network = network or DagTokenNetwork()
+        self.accounts: List[DagAccount] = []
+        for keyring_account in wallet.get_accounts():
+            if keyring_account.get_network_id() != NetworkId.Constellation.value:
+                continue
+            # All shards share one network instance (and connection pool)
+            account = DagAccount(network=self.network)
+            account.login_with_private_key(keyring_account.get_private_key())
+            self.accounts.append(account)
+        if not self.accounts:
+            raise ValueError(
+                "ShardedSender :: The wallet holds no Constellation accounts."
+            )
+        self._progress_change: Subject = Subject()
+
+    @property
+    def addresses(self) -> List[str]:
+        return [account.address for account in self.accounts]
+
+    def split(self, transfers: List[dict]) -> List[List[Dict[str, Any]]]:
+        """
+        Split the transfers round-robin across the source accounts. Each transfer keeps its original list index.
+
+        :param transfers: List of dictionaries, e.g. [{'to_address': to_address, 'amount': 10000000, 'fee': 200000}, ...]
+        :return: One list of transfers per source account.
+        """
+        shards = [[] for _ in self.accounts]
+        for index, transfer in enumerate(transfers):
+            shards[index % len(self.accounts)].append({**transfer, "index": index})
+        return shards
+
+    async def fund_sources(
+        self, funding_account: DagAccount, transfers: List[dict], fee: int = 0
+    ) -> List[str]:
+        """
+        Top up every source account with the amount (and fees) needed for its share of the transfers.
+        Accounts that already hold enough are skipped.
+
+        :param funding_account: Logged in DagAccount holding the funds.
+        :param transfers: The transfers that will be sent with send().
+        :param fee: Fee paid on each funding transaction.
+        :return: List of funding transaction hashes.
+        """
+        funding = []
+        for account, shard in zip(self.accounts, self.split(transfers)):
+            required = sum(t["amount"] + t.get("fee", 0) for t in shard)
+            balance = await account.get_balance()
+            if required > balance:
+                funding.append(
+                    {
+                        "to_address": account.address,
+                        "amount": required - balance,
+                        "fee": fee,
+                    }
+                )
+        if not funding:
+            return []
+        return await funding_account.transfer_batch(funding)
+
+    async def send(self, transfers: List[dict]) -> ShardedTransferReport:
+        """
+        Sign and post all transfers, driving one transaction chain per source account concurrently.
+        A failed post stops the chain of that account, since later transactions would reference a missing parent.
+
+        :param transfers: List of dictionaries, e.g. [{'to_address': to_address, 'amount': 10000000, 'fee': 200000}, ...]
+        :return: ShardedTransferReport with a result per transfer.
+        """
+        start = time.monotonic()
+        progress = {"total": len(transfers), "sent": 0, "failed": 0}
+        shards = await asyncio.gather(
+            *[
+                self._send_shard(account, shard, progress)
+                for account, shard in zip(self.accounts, self.split(transfers))
+            ]
+        )
+        return ShardedTransferReport(
+            shards=list(shards), duration=time.monotonic() - start
+        )
+
+    async def _send_shard(
+        self, account: DagAccount, shard: List[Dict[str, Any]], progress: Dict[str, int]
+    ) -> ShardResult:
+        start = time.monotonic()
+        result = ShardResult(source=account.address)
+        if not shard:
+            return result
+
+        error = None
+        try:
+            last_ref = await self.network.get_address_last_accepted_transaction_ref(
+                account.address
+            )
+        except Exception as e:
+            logger.error(f"ShardedSender :: {e}", exc_info=True)
+            last_ref, error = None, f"Unable to get last reference: {e}"
+
+        for transfer in shard:
+            item = TransferResult(
+                index=transfer["index"],
+                source=account.address,
+                to_address=transfer["to_address"],
+                amount=transfer["amount"],
+                fee=transfer.get("fee", 0),
+            )
+            if error is None:
+                try:
+                    tx, hash_ = await account.generate_signed_transaction(
+                        item.to_address, item.amount, item.fee, last_ref
+                    )
+                    posted_hash = await self.network.post_transaction(tx)
+                    if not posted_hash:
+                        raise ValueError("No transaction hash returned by layer 1.")
+                    item.hash = posted_hash
+                    last_ref = TransactionReference(
+                        ordinal=last_ref.ordinal + 1, hash=hash_
+                    )
+                except Exception as e:
+                    logger.error(f"ShardedSender :: {e}", exc_info=True)
+                    error = str(e)
+                    item.error = error
+            else:
+                item.error = f"Skipped, chain stopped: {error}"
+
+            result.results.append(item)
+            progress["sent" if item.sent else "failed"] += 1
+            self._emit_progress(account.address, progress)
+
+        result.last_ref = last_ref
+        result.duration = time.monotonic() - start
+        return result
+
+    def _emit_progress(self, source: str, progress: Dict[str, int]):
+        try:
+            self._progress_change.on_next(
+                {
+                    "module": "sharded_sender",
+                    "event": "progress",
+                    "source": source,
+                    **progress,
+                }
+            )
+        except Exception as e:
+            logger.error(f"ShardedSender :: Error in progress handler: {e}")
+
+    def subscribe_progress(self, callback):
+        """
+        Listen for progress events.
+        Event = {"module": "sharded_sender", "event": "progress", "source": address, "total": n, "sent": n, "failed": n}
+
+        :param callback: Callable receiving the event dictionary.
+        :return: Disposable, use dispose() to unsubscribe.
+        """
+        return self._progress_change.subscribe(on_next=callback)
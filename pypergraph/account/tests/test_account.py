@@ -1,9 +1,17 @@
+import asyncio
+
 import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
 from pypergraph.core.exceptions import NetworkError
-from pypergraph.account import DagAccount, MetagraphTokenClient
+from pypergraph.account import (
+    DagAccount,
+    DataUpdatePipeline,
+    MetagraphTokenClient,
+    ShardedSender,
+)
+from pypergraph.keyring import MultiAccountWallet
 from pypergraph.network.models.transaction import PendingTransaction
 
 
@@ -281,6 +289,182 @@ class TestMockAccount:
         # r = await metagraph_account.transfer_batch(transfers=txn_data)
         # assert len(r) == 4
 
+    @pytest.mark.asyncio
+    async def test_sharded_sender(
+        self, httpx_mock: HTTPXMock, mock_l1_api_responses, monkeypatch
+    ):
+        from secret import mnemo, to_address
+
+        wallet = MultiAccountWallet()
+        wallet.create(
+            network="Constellation", label="Payouts", num_of_accounts=2, mnemonic=mnemo
+        )
+        sender = ShardedSender(wallet)
+        assert sender.addresses == [
+            "DAG0zJW14beJtZX2BY2KA9gLbpaZ8x6vgX4KVPVX",
+            "DAG0LX8bQXduupLy4SuCvQweTGDgYJG2aaBP4Ppq",
+        ]
+        for address in sender.addresses:
+            httpx_mock.add_response(
+                method="GET",
+                url=f"https://l1-lb-mainnet.constellationnetwork.io/transactions/last-reference/{address}",
+                json=mock_l1_api_responses["last_ref"],
+            )
+        for _ in range(5):
+            httpx_mock.add_response(
+                method="POST",
+                url="https://l1-lb-mainnet.constellationnetwork.io/transactions",
+                json={
+                    "data": {
+                        "hash": "b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9"
+                    }
+                },
+            )
+        transfers = [
+            {"to_address": to_address, "amount": 10000000 + i, "fee": 200000}
+            for i in range(5)
+        ]
+        events = []
+        sender.subscribe_progress(events.append)
+
+        report = await sender.send(transfers)
+
+        assert [len(shard.results) for shard in report.shards] == [3, 2]
+        assert [r.amount for r in report.results] == [t["amount"] for t in transfers]
+        assert [r.source for r in report.results][:2] == sender.addresses
+        assert report.sent == 5 and report.failed == 0
+        assert report.shards[0].last_ref.ordinal == 3
+        assert events[-1]["sent"] == 5
+
+        # An empty hash from layer 1 is a failed transfer
+        async def post_transaction(tx):
+            return ""
+
+        monkeypatch.setattr(sender.network, "post_transaction", post_transaction)
+        for address in sender.addresses:
+            httpx_mock.add_response(
+                method="GET",
+                url=f"https://l1-lb-mainnet.constellationnetwork.io/transactions/last-reference/{address}",
+                json=mock_l1_api_responses["last_ref"],
+            )
+        report = await sender.send(transfers[:2])
+        assert report.sent == 0 and report.failed == 2
+        assert all(r.hash is None and r.error for r in report.results)
+
+    @pytest.mark.asyncio
+    async def test_signing_daemon(self, dag_account, tmp_path):
+        from secret import to_address
+        from pypergraph.keystore import KeyStore, Signer, SigningDaemon
+
+        last_ref = {"ordinal": 5, "hash": "0" * 64}
+        transfers = [
+            {"to_address": to_address, "amount": 10000000 + i, "fee": 200000}
+            for i in range(3)
+        ]
+
+        for workers in (0, 2):
+            socket_path = str(tmp_path / f"signer-{workers}.sock")
+            async with SigningDaemon(
+                [dag_account.private_key], socket_path, workers=workers, chunk_size=2
+            ) as daemon:
+                assert daemon.addresses == [dag_account.address]
+                async with Signer(socket_path) as signer:
+                    account = DagAccount()
+                    await account.login_with_signer(signer, dag_account.address)
+                    assert account.public_key == dag_account.public_key
+                    assert account.key_trio.private_key is None
+
+                    txns = await account.generate_batch_transactions(
+                        transfers, last_ref
+                    )
+                    assert [tx.value.amount for tx in txns] == [
+                        t["amount"] for t in transfers
+                    ]
+                    assert [tx.value.parent.ordinal for tx in txns] == [5, 6, 7]
+                    for tx in txns:
+                        assert tx.proofs[0].id == account.public_key[2:]
+                    signature, hash_ = await signer.data_sign(
+                        account.address, {"a": 1}, prefix=False
+                    )
+                    assert (
+                        hash_
+                        == KeyStore().data_sign(
+                            dag_account.private_key, {"a": 1}, prefix=False
+                        )[1]
+                    )
+                    assert KeyStore.verify(account.public_key, hash_, signature)
+                    signed = await signer.brotli_sign(account.address, {"a": 1})
+                    assert signed["proofs"][0]["id"] == account.public_key[2:]
+
+                    results = await signer.request(
+                        [
+                            {"op": "sign", "address": to_address, "msg": hash_},
+                            {"op": "unknown", "address": account.address},
+                        ]
+                    )
+                    assert all("error" in result for result in results)
+                    with pytest.raises(ValueError):
+                        await signer.sign(to_address, hash_)
+
+    @pytest.mark.asyncio
+    async def test_data_update_pipeline(self, dag_account, monkeypatch):
+        from pypergraph.keystore import KeyStore
+
+        client = MetagraphTokenClient(
+            account=dag_account,
+            metagraph_id="DAG7ChnhUF7uKgn8tXy45aj4zn9AFuhaZr8VXY43",
+            data_l1_host="http://localhost:9400",
+        )
+        posted = []
+        in_flight = {"now": 0, "max": 0}
+
+        async def post_data(tx):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.001)
+            in_flight["now"] -= 1
+            if tx["value"]["reading"] == 7:
+                raise NetworkError("Bad request", status=400)
+            posted.append(tx)
+            return {"hash": f"hash-{tx['value']['reading']}"}
+
+        monkeypatch.setattr(client.network, "post_data", post_data)
+
+        async def readings():
+            for i in range(20):
+                yield {"sensor": "s1", "reading": i}
+
+        keystore = KeyStore()
+        for workers, encoding, updates in (
+            (0, None, readings()),
+            (2, "base64", [{"sensor": "s1", "reading": i} for i in range(20)]),
+        ):
+            posted.clear()
+            pipeline = DataUpdatePipeline(
+                client,
+                encoding=encoding,
+                workers=workers,
+                chunk_size=3,
+                max_in_flight=4,
+            )
+            events = []
+            pipeline.subscribe_progress(events.append)
+            report = await pipeline.run(updates)
+
+            assert [r.index for r in report.results] == list(range(20))
+            assert report.sent == 19 and report.failed == 1
+            assert report.results[7].error and report.results[8].hash == "hash-8"
+            assert events[-1]["sent"] == 19 and events[-1]["total"] == 20
+            assert in_flight["max"] <= 4
+            for tx in posted:
+                proof = tx["proofs"][0]
+                assert proof["id"] == dag_account.public_key[2:]
+                assert keystore.verify_data(
+                    proof["id"],
+                    keystore.encode_data(tx["value"], encoding=encoding),
+                    proof["signature"],
+                )
+
 
 @pytest.mark.integration
 class TestIntegrationAccount:
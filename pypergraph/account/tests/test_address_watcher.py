@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pypergraph.account import AddressWatcher
+
+
+def tx(source: str, destination: str, amount: int, fee: int = 0):
+    return SimpleNamespace(
+        source=source, destination=destination, amount=amount, fee=fee
+    )
+
+
+@pytest.fixture
+def watcher(monkeypatch):
+    watcher = AddressWatcher()
+    snapshots = {
+        101: [tx("DAG_A", "DAG_X", 100, 1), tx("DAG_X", "DAG_B", 50)],
+        102: [],
+        103: [tx("DAG_Y", "DAG_B", 10), tx("DAG_B", "DAG_A", 5, 1)],
+    }
+    watcher.requests = 0
+
+    async def get_latest_snapshot():
+        watcher.requests += 1
+        return SimpleNamespace(ordinal=103)
+
+    async def get_transactions_by_snapshot(ordinal):
+        watcher.requests += 1
+        return snapshots[ordinal]
+
+    monkeypatch.setattr(watcher.network, "get_latest_snapshot", get_latest_snapshot)
+    monkeypatch.setattr(
+        watcher.network, "get_transactions_by_snapshot", get_transactions_by_snapshot
+    )
+    return watcher
+
+
+@pytest.mark.account
+class TestAddressWatcher:
+    @pytest.mark.asyncio
+    async def test_dispatch_by_address(self, watcher):
+        events, all_events = [], []
+        watcher.add(f"DAG_{i}" for i in range(100_000))
+        watcher.add(["DAG_A"])
+        watcher.subscribe("DAG_B", events.append)
+        watcher.subscribe_all(all_events.append)
+        watcher.last_ordinal = 100
+
+        assert await watcher.process_new_snapshots() == 5
+        # One request per snapshot, regardless of the number of watched addresses
+        assert watcher.requests == 4
+        assert watcher.last_ordinal == 103
+        transactions = [e for e in events if e["event"] == "transaction"]
+        assert [(e["direction"], e["delta"]) for e in transactions] == [
+            ("incoming", 50),
+            ("incoming", 10),
+            ("outgoing", -6),
+        ]
+        assert events[-1] == {
+            "module": "address_watcher",
+            "event": "balance_change",
+            "address": "DAG_B",
+            "delta": 4,
+            "snapshot": 103,
+        }
+        assert [(e["address"], e["event"], e["snapshot"]) for e in all_events] == [
+            ("DAG_A", "transaction", 101),
+            ("DAG_B", "transaction", 101),
+            ("DAG_A", "balance_change", 101),
+            ("DAG_B", "balance_change", 101),
+            ("DAG_B", "transaction", 103),
+            ("DAG_B", "transaction", 103),
+            ("DAG_A", "transaction", 103),
+            ("DAG_B", "balance_change", 103),
+            ("DAG_A", "balance_change", 103),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_add_and_remove(self, watcher):
+        events = []
+        watcher.subscribe("DAG_A", events.append)
+        watcher.remove(["DAG_A"])
+        assert "DAG_A" not in watcher and len(watcher) == 0
+
+        # The first call only records the latest snapshot
+        assert await watcher.process_new_snapshots() == 0
+        assert watcher.last_ordinal == 103
+        watcher.last_ordinal = 100
+        assert await watcher.process_new_snapshots() == 0
+        assert events == []
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import pytest
+from bip32utils import BIP32Key
+
+from pypergraph.account import GapLimitScanner
+from pypergraph.core.exceptions import NetworkError
+from pypergraph.keyring import HdDeriver, MultiAccountWallet
+
+
+@pytest.mark.account
+class TestGapLimitScanner:
+    @pytest.mark.asyncio
+    async def test_derive_in_workers(self, monkeypatch):
+        from secret import mnemo, from_address
+
+        async with HdDeriver(mnemo, workers=2, chunk_size=2) as deriver:
+            keys = await deriver.derive(0, 5)
+        assert deriver._executor is None
+        inline = await HdDeriver(mnemo, workers=0).derive(0, 5)
+        assert keys == inline
+        # Without the context manager, each call shuts down its own pool
+        deriver = HdDeriver(mnemo, workers=2, chunk_size=2)
+        assert await deriver.derive(0, 5) == keys
+        assert deriver._executor is None
+        assert [k.index for k in keys] == [0, 1, 2, 3, 4]
+        assert keys[0].address == from_address
+
+        # Keys derived in bulk are reused by wallets created afterwards
+        child_keys = []
+        child_key = BIP32Key.ChildKey
+
+        def counting_child_key(self, i):
+            child_keys.append(i)
+            return child_key(self, i)
+
+        monkeypatch.setattr(BIP32Key, "ChildKey", counting_child_key)
+        wallet = MultiAccountWallet()
+        wallet.set_derivation_cache(deriver.derivation_cache)
+        wallet.create(
+            network="Constellation", label="New MAW", mnemonic=mnemo, num_of_accounts=5
+        )
+        # Only the path "m/44'/1137'/0'/0" is derived
+        assert len(child_keys) == 4
+        assert [a.get_address() for a in wallet.get_accounts()] == [
+            k.address for k in keys
+        ]
+
+    @pytest.mark.asyncio
+    async def test_scan_stops_after_gap_limit(self, monkeypatch):
+        from secret import mnemo
+
+        deriver = HdDeriver(mnemo, workers=0)
+        keys = await deriver.derive(0, 30)
+        funded, with_history = keys[0].address, keys[3].address
+        checked = []
+
+        async def get_address_balance(address):
+            checked.append(address)
+            if address != funded:
+                raise NetworkError("Not found", status=404)
+            return SimpleNamespace(balance=100)
+
+        async def get_transactions_by_address(address, limit=None):
+            if address in (with_history, keys[25].address):
+                return [object()]
+            raise NetworkError("Not found", status=404)
+
+        scanner = GapLimitScanner(gap_limit=5)
+        monkeypatch.setattr(scanner.network, "get_address_balance", get_address_balance)
+        monkeypatch.setattr(
+            scanner.network.be_api,
+            "get_transactions_by_address",
+            get_transactions_by_address,
+        )
+        result = await scanner.scan(deriver)
+
+        # Index 25 is beyond the gap after index 3
+        assert [k.index for k in result.used] == [0, 3]
+        assert result.scanned == len(checked) == 9
+        assert result.num_of_accounts == 4
+
+        # An outage doesn't look like unused addresses
+        async def unavailable(address, limit=None):
+            raise NetworkError("Service unavailable", status=503)
+
+        monkeypatch.setattr(
+            scanner.network.be_api, "get_transactions_by_address", unavailable
+        )
+        with pytest.raises(NetworkError):
+            await scanner.scan(deriver)
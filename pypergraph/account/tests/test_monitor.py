@@ -0,0 +1,288 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pypergraph.account import DagAccount, DagMonitor
+from pypergraph.account.monitor import (
+    MAX_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
+    SNAPSHOT_GRACE,
+    SNAPSHOT_INTERVAL,
+    SNAPSHOT_LOOKUP_AFTER,
+    TWELVE_MINUTES,
+)
+from pypergraph.network.models.transaction import PendingTransaction
+
+
+def pending_tx(i: int, age: int = 60 * 1000) -> PendingTransaction:
+    return PendingTransaction(
+        hash=f"{i:064x}",
+        timestamp=int(time.time() * 1000) - age,
+        status="POSTED",
+        pending=True,
+    )
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    from secret import mnemo
+
+    account = DagAccount()
+    account.login_with_seed_phrase(mnemo)
+    return DagMonitor(
+        account,
+        state_storage_file_path=str(tmp_path / "state_storage.json"),
+        max_concurrent_checks=4,
+    )
+
+
+@pytest.mark.account
+class TestMonitor:
+    @pytest.mark.asyncio
+    async def test_process_pending_txs_concurrently(self, monitor, monkeypatch):
+        confirmed = {f"{i:064x}" for i in range(0, 20, 2)}
+        in_flight, max_in_flight, looked_up = 0, 0, []
+
+        async def get_transaction(hash):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            looked_up.append(hash)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if hash in confirmed:
+                return SimpleNamespace(timestamp=SimpleNamespace(timestamp=time.time))
+
+        monkeypatch.setattr(monitor.account.network, "get_transaction", get_transaction)
+        # The last transaction was just posted and is not looked up yet
+        pool = [pending_tx(i) for i in range(20)] + [pending_tx(20, age=0)]
+        await monitor.set_to_mem_pool_monitor(pool)
+
+        result = await monitor.process_pending_txs()
+
+        assert max_in_flight == 4
+        assert len(looked_up) == 20
+        assert f"{20:064x}" not in looked_up
+        assert result["pool_count"] == 21
+        assert result["tx_changed"] and result["pending_has_confirmed"]
+        assert sorted(tx.hash for tx in result["pending_txs"]) == sorted(
+            [f"{i:064x}" for i in range(1, 21, 2)] + [f"{20:064x}"]
+        )
+        await monitor.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_pending_txs_snapshot_confirmation(
+        self, monitor, monkeypatch
+    ):
+        monitor.confirmation = "snapshot"
+        latest, requested = 100, []
+
+        async def get_latest_snapshot():
+            return SimpleNamespace(
+                ordinal=latest, timestamp=SimpleNamespace(timestamp=time.time)
+            )
+
+        async def get_transactions_by_snapshot(ordinal):
+            requested.append(ordinal)
+            if ordinal in (102, 103):
+                return [
+                    SimpleNamespace(
+                        hash=f"{ordinal - 101:064x}",
+                        timestamp=SimpleNamespace(timestamp=time.time),
+                    )
+                ]
+            return []
+
+        async def get_transaction(hash):
+            raise AssertionError("Snapshot confirmation shouldn't look up hashes")
+
+        network = monitor.account.network
+        monkeypatch.setattr(network, "get_latest_snapshot", get_latest_snapshot)
+        monkeypatch.setattr(
+            network, "get_transactions_by_snapshot", get_transactions_by_snapshot
+        )
+        monkeypatch.setattr(network, "get_transaction", get_transaction)
+        # A transaction confirmed while younger than MIN_CHECK_AGE is matched too
+        await monitor.set_to_mem_pool_monitor(
+            [pending_tx(0), pending_tx(1), pending_tx(2, age=0)]
+        )
+        # The first tick only records the snapshot ordinal and falls back to hash lookups
+        monitor._last_snapshot_ordinal = latest
+
+        latest = 103
+        result = await monitor.process_pending_txs()
+
+        assert requested == [101, 102, 103]
+        assert monitor._last_snapshot_ordinal == 103
+        assert result["pending_has_confirmed"]
+        assert [tx.hash for tx in result["pending_txs"]] == [f"{0:064x}"]
+
+        # Transaction 0 is in a snapshot read before it was added, it's looked up by hash eventually
+        looked_up = []
+
+        async def get_transaction(hash):
+            looked_up.append(hash)
+            return SimpleNamespace(timestamp=SimpleNamespace(timestamp=time.time))
+
+        monkeypatch.setattr(network, "get_transaction", get_transaction)
+        # Unmatched since ordinal 103
+        for _ in range(SNAPSHOT_LOOKUP_AFTER - 1):
+            latest += 1
+            result = await monitor.process_pending_txs()
+            assert not looked_up and result["pending_txs"]
+        latest += 1
+        result = await monitor.process_pending_txs()
+        assert looked_up == [f"{0:064x}"] and not result["pending_txs"]
+        assert not monitor._unmatched_since
+        await monitor.stop()
+
+    @pytest.mark.asyncio
+    async def test_single_scheduler_task(self, monitor, monkeypatch):
+        ticks = 0
+
+        async def poll_pending_txs():
+            nonlocal ticks
+            ticks += 1
+            return []
+
+        monkeypatch.setattr(monitor, "poll_pending_txs", poll_pending_txs)
+        monitor.start()
+        task = monitor._poll_task
+        for i in range(5):
+            await monitor.add_to_mem_pool_monitor(f"{i:064x}")
+        await asyncio.sleep(0.05)
+
+        assert monitor._poll_task is task and monitor.running
+        # One tick on start, the posts only wake the idle scheduler
+        assert 1 < ticks <= 6
+        assert monitor.metrics.ticks == ticks
+        assert monitor.metrics.next_interval is None
+
+        await monitor.stop()
+        assert not monitor.running and task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_failed_tick_keeps_polling(self, monitor, monkeypatch):
+        ticks = 0
+
+        async def process_pending_txs():
+            nonlocal ticks
+            ticks += 1
+            return None  # Logged and swallowed by process_pending_txs
+
+        monkeypatch.setattr(monitor, "process_pending_txs", process_pending_txs)
+        monitor.start()
+        await asyncio.sleep(0.05)
+
+        assert ticks == 1 and monitor.running
+        assert monitor.metrics.next_interval == MIN_POLL_INTERVAL
+        await monitor.stop()
+
+    def test_next_interval(self, monitor):
+        # Fast right after a post
+        assert monitor._next_interval([pending_tx(0, age=0)]) == MIN_POLL_INTERVAL
+        # Aligned to the snapshot cadence while backing off
+        interval = monitor._next_interval([pending_tx(0, age=90 * 1000)])
+        assert interval % SNAPSHOT_INTERVAL == 0 and interval >= 20
+        # Capped, the youngest transaction decides
+        old = [pending_tx(0, age=60 * 60 * 1000)]
+        assert monitor._next_interval(old) == MAX_POLL_INTERVAL
+        assert monitor._next_interval(old + [pending_tx(1, age=0)]) == (
+            MIN_POLL_INTERVAL
+        )
+        # Poll just after the next expected snapshot
+        monitor._last_snapshot_time = time.time() - 3
+        interval = monitor._next_interval([pending_tx(0, age=90 * 1000)])
+        assert interval - SNAPSHOT_GRACE == pytest.approx(27, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_transaction(self, monitor, monkeypatch):
+        async def get_transaction(hash):
+            if hash == f"{0:064x}":
+                return SimpleNamespace(timestamp=SimpleNamespace(timestamp=time.time))
+
+        monkeypatch.setattr(monitor.account.network, "get_transaction", get_transaction)
+        await monitor.set_to_mem_pool_monitor(
+            [pending_tx(0), pending_tx(1, age=TWELVE_MINUTES + 1000)]
+        )
+        # Many waiters share the scheduler's single lookup per tick
+        confirmed = [monitor.wait_for_transaction(f"{0:064x}") for _ in range(100)]
+        dropped = monitor.wait_for_transaction(f"{1:064x}")
+
+        results = await asyncio.wait_for(asyncio.gather(*confirmed, dropped), 1)
+
+        assert {tx.status for tx in results[:-1]} == {"CONFIRMED"}
+        assert results[-1].status == "DROPPED"
+        assert monitor.wait_for_map == {}
+        await monitor.stop()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_balance_change(self, monitor, monkeypatch):
+        balances, requests = iter([100, 100, 250]), 0
+
+        async def get_address_balance(address):
+            nonlocal requests
+            requests += 1
+            return SimpleNamespace(balance=next(balances))
+
+        monkeypatch.setattr(
+            monitor.account.network, "get_address_balance", get_address_balance
+        )
+        monkeypatch.setattr("pypergraph.account.monitor.SNAPSHOT_INTERVAL", 0.01)
+        futures = [monitor.wait_for_balance_change() for _ in range(50)]
+
+        assert await asyncio.wait_for(asyncio.gather(*futures), 1) == [250] * 50
+        assert requests == 3
+        assert monitor.wait_for_balance_map == {}
+        await monitor.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_waiters(self, monitor, monkeypatch):
+        async def get_transaction(hash):
+            return None
+
+        async def get_address_balance(address):
+            return SimpleNamespace(balance=100)
+
+        network = monitor.account.network
+        monkeypatch.setattr(network, "get_transaction", get_transaction)
+        monkeypatch.setattr(network, "get_address_balance", get_address_balance)
+        await monitor.set_to_mem_pool_monitor([pending_tx(0)])
+        waiters = [
+            monitor.wait_for_transaction(f"{0:064x}"),
+            monitor.wait_for_balance_change(),
+        ]
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        for waiter in waiters:
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(waiter, 1)
+        assert monitor.wait_for_map == {} and monitor.wait_for_balance_map == {}
+
+    @pytest.mark.asyncio
+    async def test_keyed_mem_pool(self, monitor):
+        key = "network-mainnet-mempool"
+        # Memory pools stored as a list of JSON strings are still read
+        legacy = [pending_tx(i).model_dump_json(indent=2) for i in range(3)]
+        await monitor.cache_utils.set(key, legacy)
+
+        await monitor.add_to_mem_pool_monitor(pending_tx(3))
+        await monitor.add_to_mem_pool_monitor(pending_tx(3))
+        await monitor.remove_from_mem_pool_monitor(f"{0:064x}")
+        await monitor.stop()
+
+        stored = await monitor.cache_utils.get(key)
+        assert list(stored) == [f"{i:064x}" for i in range(1, 4)]
+        assert set(stored[f"{3:064x}"]) == {"timestamp", "status", "pending"}
+        assert [tx.hash for tx in await monitor.get_mem_pool_from_monitor()] == list(
+            stored
+        )
+
+        # Loading a stored pool doesn't change the cached value in place
+        monitor._mem_pools.clear()
+        pool = await monitor._get_mem_pool()
+        pool.remove(f"{1:064x}")
+        assert f"{1:064x}" in await monitor.cache_utils.get(key)
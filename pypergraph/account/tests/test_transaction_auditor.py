@@ -0,0 +1,134 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from pypergraph.account import TransactionAuditor, transaction_auditor
+from pypergraph.core.exceptions import NetworkError
+from pypergraph.keystore import KeyStore
+from pypergraph.network.models.block_explorer import Transaction
+from pypergraph.network.models.transaction import TransactionReference
+
+
+def build_history(count: int):
+    keystore = KeyStore()
+    private_key = keystore.generate_private_key()
+    public_key = keystore.get_public_key_from_private(private_key)
+    source = keystore.get_dag_address_from_public_key(public_key)
+    destination = keystore.get_dag_address_from_public_key(
+        keystore.get_public_key_from_private(keystore.generate_private_key())
+    )
+    last_ref = TransactionReference(ordinal=0, hash="0" * 64)
+    records = []
+    for i in range(count):
+        tx, hash_ = keystore.prepare_tx(
+            amount=100 + i,
+            to_address=destination,
+            from_address=source,
+            last_ref=last_ref,
+            fee=1,
+        )
+        proof = {"id": public_key[2:], "signature": keystore.sign(private_key, hash_)}
+        records.append(
+            {
+                **tx.model_dump(exclude={"encoded"}),
+                "hash": hash_,
+                "blockHash": "b" * 64,
+                "snapshotHash": "c" * 64,
+                "snapshotOrdinal": 1000 + i,
+                "transactionOriginal": {
+                    "value": tx.model_dump(exclude={"encoded"}),
+                    "proofs": [proof],
+                },
+                "timestamp": "2025-06-05T11:14:29.933Z",
+                "proofs": [proof],
+            }
+        )
+        last_ref = TransactionReference(ordinal=last_ref.ordinal + 1, hash=hash_)
+    return source, records
+
+
+@pytest.mark.account
+class TestTransactionAuditor:
+    def test_audit(self):
+        source, records = build_history(6)
+        # Tampered amount, parent chain rewritten and a missing transaction
+        records[1]["amount"] += 1
+        records[3]["parent"] = {"ordinal": 3, "hash": "d" * 64}
+        del records[4]
+        transactions = Transaction.process_transactions(records)
+
+        with ProcessPoolExecutor(2) as executor:
+            for auditor in (
+                TransactionAuditor(),
+                TransactionAuditor(executor=executor, chunk_size=2),
+            ):
+                report = auditor.audit(transactions)
+                assert report.checked == 5 and not report.ok
+                # The rewritten parent also changes the hash of transaction 4
+                assert sorted((i.kind, i.ordinal) for i in report.issues) == [
+                    ("broken_chain", 4),
+                    ("chain_gap", 6),
+                    ("hash_mismatch", 2),
+                    ("hash_mismatch", 4),
+                    ("invalid_proof", 2),
+                    ("invalid_proof", 4),
+                    ("original_mismatch", 2),
+                    ("original_mismatch", 4),
+                ]
+        assert (
+            TransactionAuditor()
+            .audit(Transaction.process_transactions(build_history(3)[1]))
+            .ok
+        )
+
+    @pytest.mark.asyncio
+    async def test_audit_address(self, monkeypatch):
+        source, records = build_history(5)
+        pages = {"": (records[:3], {"next": "page-2"}), "page-2": (records[3:], None)}
+
+        async def get_transactions_by_address(address, limit=0, search_after=""):
+            assert address == source and limit == 3
+            page, meta = pages[search_after]
+            return Transaction.process_transactions(page, meta=meta)
+
+        auditor = TransactionAuditor()
+        monkeypatch.setattr(
+            auditor.network.be_api,
+            "get_transactions_by_address",
+            get_transactions_by_address,
+        )
+        reports = await auditor.audit_addresses([source], page_size=3)
+        assert reports[source].checked == 5 and reports[source].ok
+
+    @pytest.mark.asyncio
+    async def test_audit_address_page_error(self, monkeypatch):
+        source, records = build_history(3)
+        calls = []
+        check_transactions = transaction_auditor._check_transactions
+
+        def counting_check(transactions):
+            calls.append(len(transactions))
+            return check_transactions(transactions)
+
+        async def get_transactions_by_address(address, limit=0, search_after=""):
+            if search_after:
+                raise NetworkError("Block explorer unavailable", status=503)
+            return Transaction.process_transactions(records, meta={"next": "page-2"})
+
+        monkeypatch.setattr(transaction_auditor, "_check_transactions", counting_check)
+        # Keep the only worker busy, so the checks of the first page are still queued
+        release = threading.Event()
+        executor = ThreadPoolExecutor(1)
+        executor.submit(release.wait)
+        auditor = TransactionAuditor(executor=executor, chunk_size=1)
+        monkeypatch.setattr(
+            auditor.network.be_api,
+            "get_transactions_by_address",
+            get_transactions_by_address,
+        )
+        with pytest.raises(NetworkError):
+            await auditor.audit_address(source)
+        release.set()
+        executor.shutdown(wait=True)
+        assert calls == []
@@ -0,0 +1,257 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import Executor
+from itertools import chain
+from typing import Dict, Iterable, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from pypergraph.core.exceptions import NetworkError
+from pypergraph.keystore import KeyStore
+from pypergraph.keystore.proof_verifier import verify_proof
+from pypergraph.network import DagTokenNetwork
+from pypergraph.network.models.block_explorer import Transaction
+from pypergraph.network.models.transaction import Transaction as TransactionValue
+
+logger = logging.getLogger(__name__)
+
+IssueKind = Literal[
+    "hash_mismatch",  # The recomputed hash differs from the reported hash
+    "original_mismatch",  # transaction_original differs from the reported fields
+    "missing_proof",
+    "invalid_proof",
+    "foreign_signer",  # The proof isn't signed by the source address
+    "broken_chain",  # The parent hash isn't the hash of the previous transaction
+    "chain_gap",  # Missing ordinals between the first and last transaction
+    "duplicate_ordinal",
+    "unverifiable",
+]
+
+
+class AuditIssue(BaseModel):
+    kind: IssueKind
+    hash: Optional[str] = None  # Reported transaction hash
+    address: Optional[str] = None  # Source address
+    ordinal: Optional[int] = None  # Transaction ordinal (parent ordinal + 1)
+    detail: Optional[str] = None
+
+
+class AuditReport(BaseModel):
+    checked: int = Field(default=0, ge=0)
+    issues: List[AuditIssue] = Field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+
+def _issue(tx: Transaction, kind: IssueKind, detail: Optional[str] = None):
+    return AuditIssue(
+        kind=kind,
+        hash=tx.hash,
+        address=tx.source,
+        ordinal=tx.parent.ordinal + 1,
+        detail=detail,
+    )
+
+
+def _check_transactions(transactions: List[Transaction]) -> List[AuditIssue]:
+    # Hash and proof checks of block explorer records, runs in the executor
+    issues = []
+    for tx in transactions:
+        try:
+            if tx.salt is None:
+                raise ValueError("No salt, the hash can't be recomputed.")
+            value = TransactionValue(
+                source=tx.source,
+                destination=tx.destination,
+                amount=tx.amount,
+                fee=tx.fee,
+                parent=tx.parent,
+                salt=tx.salt,
+            )
+            hash_ = KeyStore.get_transaction_hash(value)
+            if hash_ != tx.hash:
+                issues.append(_issue(tx, "hash_mismatch", f"Recomputed {hash_}."))
+
+            proofs = tx.proofs
+            if tx.transaction_original is not None:
+                if tx.transaction_original.value != value:
+                    issues.append(_issue(tx, "original_mismatch"))
+                proofs = proofs or tx.transaction_original.proofs
+            if not proofs:
+                issues.append(_issue(tx, "missing_proof"))
+            for proof in proofs:
+                if not verify_proof(proof.id, hash_, proof.signature):
+                    issues.append(_issue(tx, "invalid_proof", f"Signer {proof.id}."))
+                elif KeyStore.get_dag_address_from_public_key(proof.id) != tx.source:
+                    issues.append(_issue(tx, "foreign_signer", f"Signer {proof.id}."))
+        except Exception as e:
+            issues.append(_issue(tx, "unverifiable", str(e) or type(e).__name__))
+    return issues
+
+
+def check_chains(transactions: Iterable[Transaction]) -> List[AuditIssue]:
+    """
+    Check the parent reference chain of each source address.
+
+    :param transactions: Block explorer transactions, in any order.
+    :return: Issues, per address in ordinal order.
+    """
+    by_source: Dict[str, Dict[int, List[Transaction]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    for tx in transactions:
+        by_source[tx.source][tx.parent.ordinal + 1].append(tx)
+
+    issues = []
+    for address, by_ordinal in by_source.items():
+        ordinals = sorted(by_ordinal)
+        for ordinal in ordinals:
+            txs = by_ordinal[ordinal]
+            if len({tx.hash for tx in txs}) > 1:
+                issues.append(
+                    _issue(txs[0], "duplicate_ordinal", f"{len(txs)} transactions.")
+                )
+            previous = by_ordinal.get(ordinal - 1)
+            if previous is None:
+                if ordinal != ordinals[0]:
+                    issues.append(
+                        _issue(txs[0], "chain_gap", f"No transaction {ordinal - 1}.")
+                    )
+                continue
+            parents = {tx.hash for tx in previous}
+            for tx in txs:
+                if tx.parent.hash not in parents:
+                    issues.append(
+                        _issue(tx, "broken_chain", f"Parent {tx.parent.hash}.")
+                    )
+    return issues
+
+
+class TransactionAuditor:
+    """
+    Recompute and check block explorer transaction records instead of trusting them.
+
+    Each transaction hash is recomputed from its fields (Transaction.encoded and Kryo), its proofs are verified
+    against the recomputed hash and the source address, and the parent references of every source address
+    must form an unbroken chain.
+    """
+
+    def __init__(
+        self,
+        network: Optional[DagTokenNetwork] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 100,
+    ):
+        """
+        :param network: (Optional) DagTokenNetwork or MetagraphTokenNetwork. Default: new mainnet DagTokenNetwork.
+        :param executor: (Optional) ProcessPoolExecutor or ThreadPoolExecutor checking chunks of transactions.
+            Default: Check in the calling thread.
+        :param chunk_size: Number of transactions per executor task.
+        """
+        self.network = network or DagTokenNetwork()
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    def audit(self, transactions: Iterable[Transaction]) -> AuditReport:
+        """
+        Audit a list of block explorer transactions.
+
+        :param transactions: Block explorer transactions.
+        :return: AuditReport.
+        """
+        start = time.monotonic()
+        transactions = list(transactions)
+        if self.executor is None:
+            issues = _check_transactions(transactions)
+        else:
+            chunks = [
+                transactions[i : i + self.chunk_size]
+                for i in range(0, len(transactions), self.chunk_size)
+            ]
+            issues = list(
+                chain.from_iterable(self.executor.map(_check_transactions, chunks))
+            )
+        return AuditReport(
+            checked=len(transactions),
+            issues=issues + check_chains(transactions),
+            duration=time.monotonic() - start,
+        )
+
+    async def audit_address(self, address: str, page_size: int = 100) -> AuditReport:
+        """
+        Audit the transaction history of an address. Pages are checked while the next page is fetched.
+
+        :param address: DAG address.
+        :param page_size: Transactions per block explorer page.
+        :return: AuditReport, the chain check covers the transactions sent by the address.
+        """
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        checks = []
+        sent = []
+        checked = 0
+        search_after = ""
+        try:
+            while True:
+                try:
+                    page = await self.network.be_api.get_transactions_by_address(
+                        address, limit=page_size, search_after=search_after
+                    )
+                except NetworkError as e:
+                    # The block explorer responds 404 for addresses without transactions
+                    if e.status == 404:
+                        break
+                    raise
+                for i in range(0, len(page), self.chunk_size):
+                    chunk = page[i : i + self.chunk_size]
+                    if self.executor is None:
+                        checks.append(_check_transactions(chunk))
+                    else:
+                        checks.append(
+                            loop.run_in_executor(
+                                self.executor, _check_transactions, chunk
+                            )
+                        )
+                checked += len(page)
+                sent.extend(tx for tx in page if tx.source == address)
+                search_after = (page[-1].meta or {}).get("next") if page else None
+                if not search_after:
+                    break
+        except BaseException:
+            # Don't leave queued checks behind when a page request fails
+            if self.executor is not None:
+                for check in checks:
+                    check.cancel()
+                await asyncio.gather(*checks, return_exceptions=True)
+            raise
+
+        if self.executor is not None:
+            checks = await asyncio.gather(*checks)
+        return AuditReport(
+            checked=checked,
+            issues=list(chain.from_iterable(checks)) + check_chains(sent),
+            duration=time.monotonic() - start,
+        )
+
+    async def audit_addresses(
+        self, addresses: List[str], max_concurrent: int = 4, page_size: int = 100
+    ) -> Dict[str, AuditReport]:
+        """
+        :param addresses: DAG addresses.
+        :param max_concurrent: Maximum number of addresses audited at once.
+        :param page_size: Transactions per block explorer page.
+        :return: AuditReport per address.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def audit(address: str) -> AuditReport:
+            async with semaphore:
+                return await self.audit_address(address, page_size)
+
+        reports = await asyncio.gather(*[audit(address) for address in addresses])
+        return dict(zip(addresses, reports))
@@ -0,0 +1,64 @@
+import hashlib
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+from mnemonic import Mnemonic
+
+VALID_PHRASE_LENGTHS = (12, 15, 18, 21, 24)
+
+
+class Bip39Wordlist:
+    """
+    BIP39 wordlist of a language with a word to index dictionary.
+
+    Use get_wordlist() to share one parsed wordlist per language in the process, instead of
+    reading the wordlist file for every Mnemonic(language).
+    """
+
+    def __init__(self, language: str = "english"):
+        """
+        :param language: Wordlist language, e.g. "english".
+        """
+        self.language = language
+        # Reads and parses the wordlist file
+        self.mnemonic = Mnemonic(language)
+        self.words: List[str] = self.mnemonic.wordlist
+        self.index: Dict[str, int] = {word: i for i, word in enumerate(self.words)}
+
+    def is_valid(self, phrase: str) -> bool:
+        """
+        Validate the words and checksum of a mnemonic phrase, like Mnemonic.check() with dictionary lookups.
+
+        :param phrase: Mnemonic phrase.
+        :return: True if the phrase is valid.
+        """
+        words = Mnemonic.normalize_string(phrase).split(" ")
+        if len(words) not in VALID_PHRASE_LENGTHS:
+            return False
+        bits = 0
+        for word in words:
+            index = self.index.get(word)
+            if index is None:
+                return False
+            bits = bits << 11 | index
+        # 11 bits per word hold the entropy and 1 checksum bit per 32 entropy bits
+        checksum_length = len(words) * 11 // 33
+        entropy = (bits >> checksum_length).to_bytes(checksum_length * 4, "big")
+        checksum = bits & ((1 << checksum_length) - 1)
+        return hashlib.sha256(entropy).digest()[0] >> (8 - checksum_length) == checksum
+
+    def validate_many(self, phrases: Iterable[str]) -> List[bool]:
+        """
+        :param phrases: Mnemonic phrases.
+        :return: True or False for each phrase, in order.
+        """
+        return [self.is_valid(phrase) for phrase in phrases]
+
+
+@lru_cache(maxsize=None)
+def get_wordlist(language: str = "english") -> Bip39Wordlist:
+    """
+    :param language: Wordlist language, e.g. "english".
+    :return: The process-wide Bip39Wordlist of the language.
+    """
+    return Bip39Wordlist(language)
@@ -1,10 +1,20 @@
+import asyncio
 import json
+import os
+import tempfile
 import aiofiles
 from pathlib import Path
+from typing import Optional
 
 
 class JsonStorage:
-    """Async JSON file storage using aiofiles."""
+    """
+    Async JSON file storage using aiofiles. The whole file is rewritten on every write, use
+    SqliteStorage for large state files.
+
+    Writes are atomic and serialized within the instance, but the read-modify-write isn't safe
+    across processes: only SqliteStorage can be shared by several processes.
+    """
 
     def __init__(self, file_path: str = None):
         if not file_path:
@@ -12,27 +22,48 @@ class JsonStorage:
         self.file_path = Path(file_path)
         if not self.file_path.exists():
             self.file_path.write_text(json.dumps({}))  # Sync write for initialization
+        self._lock: Optional[asyncio.Lock] = None  # Created in the running event loop
 
     async def get_item(self, key: str):
         data = await self._read_data()
         return data.get(key)
 
     async def set_item(self, key: str, value: str):
-        data = await self._read_data()
-        data[key] = value
-        await self._write_data(data)
+        async with self._get_lock():
+            data = await self._read_data()
+            data[key] = value
+            await self._write_data(data)
 
     async def remove_item(self, key: str):
-        data = await self._read_data()
-        if key in data:
-            del data[key]
-            await self._write_data(data)
+        async with self._get_lock():
+            data = await self._read_data()
+            if key in data:
+                del data[key]
+                await self._write_data(data)
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Concurrent writes would otherwise drop each other's changes
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
 
     async def _read_data(self):
         async with aiofiles.open(self.file_path, "r") as f:
             contents = await f.read()
-            return json.loads(contents) if contents else None
+            return json.loads(contents) if contents else {}
 
     async def _write_data(self, data):
-        async with aiofiles.open(self.file_path, "w") as f:
-            await f.write(json.dumps(data, indent=2))
+        # Write a temporary file and rename it, an interrupted write leaves the old file intact
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.file_path.parent, prefix=f".{self.file_path.name}.", suffix=".tmp"
+        )
+        os.close(fd)
+        try:
+            async with aiofiles.open(tmp_path, "w") as f:
+                await f.write(json.dumps(data, separators=(",", ":")))
+                await f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,71 @@
+import asyncio
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+class SqliteStorage:
+    """
+    Async key-value storage in a SQLite database using write-ahead logging.
+
+    Each write only touches its own row, and is atomic. Several processes can share the same
+    database file, writers wait for each other up to the timeout.
+    """
+
+    def __init__(self, file_path: str = None, timeout: float = 30.0):
+        if not file_path:
+            raise ValueError("SqliteStorage :: Please provide a file path.")
+        self.file_path = Path(file_path)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        with self._lock:
+            self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Called with the lock held, reopens the connection after close()
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                self.file_path,
+                timeout=self.timeout,
+                isolation_level=None,  # Autocommit, every statement is its own transaction
+                check_same_thread=False,
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS storage (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+        return self._conn
+
+    async def get_item(self, key: str):
+        row = await self._execute(
+            "SELECT value FROM storage WHERE key = ?", (key,), fetch=True
+        )
+        return json.loads(row[0]) if row else None
+
+    async def set_item(self, key: str, value):
+        await self._execute(
+            "INSERT OR REPLACE INTO storage (key, value) VALUES (?, ?)",
+            (key, json.dumps(value, separators=(",", ":"))),
+        )
+
+    async def remove_item(self, key: str):
+        await self._execute("DELETE FROM storage WHERE key = ?", (key,))
+
+    def close(self):
+        """Close the connection, it's opened again on the next read or write."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def _execute(self, sql: str, params: tuple, fetch: bool = False):
+        def execute():
+            with self._lock:
+                cursor = self._connect().execute(sql, params)
+                return cursor.fetchone() if fetch else None
+
+        return await asyncio.to_thread(execute)
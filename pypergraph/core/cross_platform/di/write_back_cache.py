@@ -0,0 +1,128 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+_DELETED = object()
+
+
+class CacheMetrics(BaseModel):
+    reads: int = 0
+    hits: int = 0
+    writes: int = 0
+    coalesced_writes: int = 0  # Writes replacing a value that wasn't flushed yet
+    flushes: int = 0
+    flushed_keys: int = 0
+    dirty_keys: int = 0
+
+
+class WriteBackCache:
+    """
+    In-memory write-back cache around a storage client, e.g. JsonStorage or SqliteStorage.
+
+    Reads are served from memory after the first read of a key. Writes only mark the key dirty,
+    dirty keys are written to the storage client after flush_interval seconds or on flush().
+    Values are cached by reference and shouldn't be changed in place after set_item().
+
+    The cache assumes it is the only writer of the storage: changes made by other processes, e.g. to a
+    shared SQLite database, aren't seen until invalidate() is called.
+    """
+
+    def __init__(self, storage_client, flush_interval: float = 1.0):
+        """
+        :param storage_client: Object with async get_item, set_item and remove_item.
+        :param flush_interval: Seconds between the first unflushed write and the flush.
+        """
+        self.storage_client = storage_client
+        self.flush_interval = flush_interval
+        self.metrics = CacheMetrics()
+        self._cache: Dict[str, Any] = {}
+        self._dirty: Set[str] = set()
+        self._flush_lock: Optional[asyncio.Lock] = (
+            None  # Created in the running event loop
+        )
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def get_item(self, key: str):
+        self.metrics.reads += 1
+        if key in self._cache:
+            self.metrics.hits += 1
+        else:
+            self._cache[key] = await self.storage_client.get_item(key)
+        value = self._cache[key]
+        return None if value is _DELETED else value
+
+    async def set_item(self, key: str, value):
+        self._write(key, value)
+
+    async def remove_item(self, key: str):
+        self._write(key, _DELETED)
+
+    def _write(self, key: str, value):
+        self.metrics.writes += 1
+        if key in self._dirty:
+            self.metrics.coalesced_writes += 1
+        self._cache[key] = value
+        self._dirty.add(key)
+        self.metrics.dirty_keys = len(self._dirty)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        # Keys written during a flush, or not written because it failed, are flushed after another interval
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                # A flush in progress isn't cancelled by close(), close() waits for it instead
+                await asyncio.shield(self.flush())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"WriteBackCache :: {e}", exc_info=True)
+            if not self._dirty:
+                return
+
+    async def flush(self):
+        """Write all dirty keys to the storage client. A key stays dirty until its write succeeded."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            try:
+                for key in list(self._dirty):
+                    value = self._cache[key]
+                    if value is _DELETED:
+                        await self.storage_client.remove_item(key)
+                    else:
+                        await self.storage_client.set_item(key, value)
+                    self.metrics.flushed_keys += 1
+                    # Written again meanwhile, the new value is flushed next time
+                    if self._cache.get(key) is value:
+                        self._dirty.discard(key)
+            finally:
+                self.metrics.dirty_keys = len(self._dirty)
+                self.metrics.flushes += 1
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        Drop cached reads, so they are read from the storage client again. Unflushed writes are kept.
+
+        :param key: (Optional) Key to drop. Default: All keys.
+        """
+        keys = list(self._cache) if key is None else [key]
+        for key in keys:
+            if key not in self._dirty:
+                self._cache.pop(key, None)
+
+    async def close(self):
+        """Cancel the scheduled flush, wait for a flush in progress and write all dirty keys."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
@@ -1,16 +1,48 @@
+from pathlib import Path
 from typing import Optional
 
 from pypergraph.core.cross_platform.di.json_storage import JsonStorage
+from pypergraph.core.cross_platform.di.sqlite_storage import SqliteStorage
+from pypergraph.core.cross_platform.di.write_back_cache import WriteBackCache
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
 
 
 class StateStorageDb:
-    def __init__(self, storage_client=None, file_path: Optional[str] = None):
+    def __init__(
+        self,
+        storage_client=None,
+        file_path: Optional[str] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        """
+        :param storage_client: (Optional) Object with async get_item, set_item and remove_item.
+        :param file_path: Path to the fallback storage file. A SQLite database is used if the suffix is
+            .db, .sqlite or .sqlite3, else a JSON file.
+        :param flush_interval: (Optional) Cache reads and writes in memory and write changes to the storage
+            client after this number of seconds. Call flush() or close() before shutting down.
+        """
+        self.flush_interval = flush_interval
         self.key_prefix = "pypergraph-"
-        self.default_storage = JsonStorage(file_path=file_path)  # Fallback storage
-        self.storage_client = storage_client or self.default_storage
+        if file_path and Path(file_path).suffix.lower() in SQLITE_SUFFIXES:
+            self.default_storage = SqliteStorage(file_path=file_path)
+        else:
+            self.default_storage = JsonStorage(file_path=file_path)  # Fallback storage
+        self.storage_client = self._wrap(storage_client or self.default_storage)
+
+    def _wrap(self, client):
+        if self.flush_interval is None:
+            return client
+        return WriteBackCache(client, flush_interval=self.flush_interval)
+
+    async def set_client(self, client):
+        """
+        Flush and close the current client, then use another one.
 
-    def set_client(self, client):
-        self.storage_client = client or self.default_storage
+        :param client: Object with async get_item, set_item and remove_item. None for the fallback storage.
+        """
+        await self.close()
+        self.storage_client = self._wrap(client or self.default_storage)
 
     def set_prefix(self, prefix: str):
         if not prefix:
@@ -33,3 +65,18 @@ class StateStorageDb:
     async def delete(self, key: str = "vault"):
         full_key = self.key_prefix + key
         await self.storage_client.remove_item(full_key)
+
+    async def flush(self):
+        """Write cached changes to the storage client, if caching is enabled."""
+        if isinstance(self.storage_client, WriteBackCache):
+            await self.storage_client.flush()
+
+    async def close(self):
+        """
+        Write cached changes and stop the scheduled flush, if caching is enabled, and close the fallback
+        storage. Clients passed to the constructor or set_client() are closed by their owner.
+        """
+        if isinstance(self.storage_client, WriteBackCache):
+            await self.storage_client.close()
+        if isinstance(self.default_storage, SqliteStorage):
+            self.default_storage.close()
@@ -0,0 +1,85 @@
+import hashlib
+from concurrent.futures import Executor
+from itertools import chain
+from typing import Iterable, List, Optional, Union
+
+import base58
+
+from pypergraph.core.constants import PKCS_PREFIX
+
+_PKCS_PREFIX = bytes.fromhex(PKCS_PREFIX)
+_ALPHABET = base58.BITCOIN_ALPHABET.decode()
+# The address holds the last 36 base58 digits of the hash, encoded two digits at a time
+_ADDRESS_DIGITS = 36
+_PAIRS = [a + b for a in _ALPHABET for b in _ALPHABET]
+# Sum of the decimal digits ("1" to "9") in each pair, for the parity digit
+_PAIR_DIGIT_SUMS = [sum(int(c) for c in pair if c.isdigit()) for pair in _PAIRS]
+_PAIR_BASE = 58**2
+_ADDRESS_MODULUS = 58**_ADDRESS_DIGITS
+
+
+def _public_key_bytes(public_key: Union[str, bytes]) -> bytes:
+    # Uncompressed public key with the 04 prefix
+    if isinstance(public_key, str):
+        if len(public_key) == 128:
+            return b"\x04" + bytes.fromhex(public_key)
+        if len(public_key) == 130 and public_key[:2] == "04":
+            return bytes.fromhex(public_key)
+    elif len(public_key) == 64:
+        return b"\x04" + public_key
+    elif len(public_key) == 65 and public_key[0] == 4:
+        return bytes(public_key)
+    raise ValueError("KeyStore :: Not a valid public key.")
+
+
+def get_dag_address(public_key: Union[str, bytes]) -> str:
+    """
+    Derive the DAG address of a public key.
+
+    :param public_key: Uncompressed public key as bytes or hexadecimal string, with or without the 04 prefix.
+    :return: DAG address.
+    """
+    digest = hashlib.sha256(_PKCS_PREFIX + _public_key_bytes(public_key)).digest()
+    value = int.from_bytes(digest, "big")
+    if value < _ADDRESS_MODULUS:
+        # Practically unreachable, the base58 encoding with leading zero bytes is shorter than the address
+        encoded = base58.b58encode(digest).decode()[-_ADDRESS_DIGITS:]
+        parity = sum(int(c) for c in encoded if c.isdigit()) % 9
+        return f"DAG{parity}{encoded}"
+
+    value %= _ADDRESS_MODULUS
+    pairs = []
+    digit_sum = 0
+    for _ in range(_ADDRESS_DIGITS // 2):
+        value, pair = divmod(value, _PAIR_BASE)
+        pairs.append(_PAIRS[pair])
+        digit_sum += _PAIR_DIGIT_SUMS[pair]
+    pairs.reverse()
+    return f"DAG{digit_sum % 9}{''.join(pairs)}"
+
+
+def _get_dag_addresses(public_keys: List[Union[str, bytes]]) -> List[str]:
+    return [get_dag_address(public_key) for public_key in public_keys]
+
+
+def derive_addresses(
+    public_keys: Iterable[Union[str, bytes]],
+    executor: Optional[Executor] = None,
+    chunk_size: int = 10_000,
+) -> List[str]:
+    """
+    Derive the DAG addresses of many public keys, e.g. for pre-generated deposit addresses.
+
+    :param public_keys: Uncompressed public keys as bytes or hexadecimal strings.
+    :param executor: (Optional) Executor, e.g. ProcessPoolExecutor, deriving chunks of public keys in parallel.
+        Default: Derive in the calling thread.
+    :param chunk_size: Number of public keys per executor task.
+    :return: DAG addresses, in the order of public_keys.
+    """
+    if executor is None:
+        return _get_dag_addresses(list(public_keys))
+    public_keys = list(public_keys)
+    chunks = [
+        public_keys[i : i + chunk_size] for i in range(0, len(public_keys), chunk_size)
+    ]
+    return list(chain.from_iterable(executor.map(_get_dag_addresses, chunks)))
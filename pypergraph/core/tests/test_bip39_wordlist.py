@@ -0,0 +1,32 @@
+import pytest
+from mnemonic import Mnemonic
+
+from pypergraph.core.bip39_wordlist import get_wordlist
+from pypergraph.keystore import KeyStore
+
+
+@pytest.mark.parametrize("language", ["english", "japanese"])
+@pytest.mark.parametrize("strength", [128, 256])
+def test_validate_many(language, strength):
+    wordlist = get_wordlist(language)
+    assert get_wordlist(language) is wordlist
+
+    mnemo = Mnemonic(language)
+    phrases = [mnemo.generate(strength) for _ in range(20)]
+    # Swapping the last word breaks the checksum (or leaves it valid by chance)
+    swapped = [
+        p.rsplit(mnemo.delimiter, 1)[0] + mnemo.delimiter + wordlist.words[7]
+        for p in phrases
+    ]
+    phrases += swapped + ["", "abandon", phrases[0] + " extra"]
+    assert wordlist.validate_many(phrases) == [mnemo.check(p) for p in phrases]
+    assert all(wordlist.validate_many(phrases[:20]))
+
+
+def test_keystore_validate_mnemonics():
+    phrase = KeyStore.generate_mnemonic()
+    assert KeyStore.validate_mnemonics([phrase, phrase.upper(), "abandon " * 12]) == [
+        True,
+        False,
+        False,
+    ]
@@ -0,0 +1,142 @@
+import asyncio
+import json
+
+import pytest
+
+from pypergraph.core.cross_platform.di.json_storage import JsonStorage
+from pypergraph.core.cross_platform.di.sqlite_storage import SqliteStorage
+from pypergraph.core.cross_platform.state_storage_db import StateStorageDb
+
+
+@pytest.mark.parametrize("file_name", ["state.json", "state.db"])
+@pytest.mark.asyncio
+async def test_state_storage_db(tmp_path, file_name):
+    db = StateStorageDb(file_path=str(tmp_path / file_name))
+    assert isinstance(
+        db.storage_client, SqliteStorage if file_name.endswith(".db") else JsonStorage
+    )
+
+    value = [{"hash": "a" * 64, "amount": 1}, {"hash": "b" * 64, "amount": 2}]
+    await db.set("network-mainnet-mempool", value)
+    await db.set("vault", {"wallets": []})
+    assert await db.get("network-mainnet-mempool") == value
+    assert await db.get("vault") == {"wallets": []}
+
+    await db.delete("vault")
+    assert await db.get("vault") is None
+    # Persisted across instances
+    db = StateStorageDb(file_path=str(tmp_path / file_name))
+    assert await db.get("network-mainnet-mempool") == value
+
+
+@pytest.mark.asyncio
+async def test_json_storage_atomic_write(tmp_path):
+    storage = JsonStorage(file_path=str(tmp_path / "state.json"))
+    await storage.set_item("key", "value")
+
+    assert json.loads((tmp_path / "state.json").read_text()) == {"key": "value"}
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+    # Concurrent writes from one instance don't drop each other's changes
+    await asyncio.gather(*[storage.set_item(f"key-{i}", i) for i in range(20)])
+    assert len(await storage._read_data()) == 21
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_shared_file(tmp_path):
+    # Two clients, e.g. two processes, writing the same database
+    first = SqliteStorage(file_path=str(tmp_path / "state.db"))
+    second = SqliteStorage(file_path=str(tmp_path / "state.db"))
+
+    await asyncio.gather(
+        *[first.set_item(f"first-{i}", i) for i in range(50)],
+        *[second.set_item(f"second-{i}", i) for i in range(50)],
+    )
+
+    assert await second.get_item("first-49") == 49
+    assert await first.get_item("second-49") == 49
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_write_back_cache(tmp_path, monkeypatch):
+    db = StateStorageDb(file_path=str(tmp_path / "state.json"), flush_interval=0.05)
+    client = db.storage_client.storage_client
+    writes = []
+    set_item = client.set_item
+
+    async def counting_set_item(key, value):
+        writes.append(key)
+        await set_item(key, value)
+
+    monkeypatch.setattr(client, "set_item", counting_set_item)
+
+    for i in range(100):
+        await db.set("network-mainnet-mempool", [i])
+    await db.set("vault", {"wallets": []})
+    assert await db.get("network-mainnet-mempool") == [99]
+    assert writes == []
+    assert db.storage_client.metrics.coalesced_writes == 99
+    assert db.storage_client.metrics.dirty_keys == 2
+
+    await asyncio.sleep(0.1)
+    assert sorted(writes) == ["pypergraph-network-mainnet-mempool", "pypergraph-vault"]
+    assert db.storage_client.metrics.dirty_keys == 0
+
+    await db.delete("vault")
+    assert await db.get("vault") is None
+    # Writes of another client are seen after invalidate(), unflushed changes are kept
+    await client.set_item("pypergraph-network-mainnet-mempool", [100])
+    assert await db.get("network-mainnet-mempool") == [99]
+    db.storage_client.invalidate()
+    assert await db.get("network-mainnet-mempool") == [100]
+    assert await db.get("vault") is None
+    await db.close()
+    assert await StateStorageDb(file_path=str(tmp_path / "state.json")).get(
+        "network-mainnet-mempool"
+    ) == [100]
+    assert await client.get_item("pypergraph-vault") is None
+
+
+@pytest.mark.asyncio
+async def test_write_back_cache_failed_and_slow_writes(tmp_path, monkeypatch):
+    db = StateStorageDb(file_path=str(tmp_path / "state.json"), flush_interval=0.01)
+    cache, client = db.storage_client, db.storage_client.storage_client
+    set_item, fail = client.set_item, True
+
+    async def flaky_set_item(key, value):
+        nonlocal fail
+        if fail:
+            fail = False
+            raise OSError("Disk full")
+        await asyncio.sleep(0.05)
+        await set_item(key, value)
+
+    monkeypatch.setattr(client, "set_item", flaky_set_item)
+    await db.set("vault", {"wallets": []})
+    # A failed write stays dirty for the next flush
+    with pytest.raises(OSError):
+        await cache.flush()
+    assert cache.metrics.dirty_keys == 1
+    # Closing during the scheduled (slow) flush waits for it
+    await asyncio.sleep(0.03)
+    await db.set("network-mainnet-mempool", [1])
+    await db.close()
+    assert await client.get_item("pypergraph-vault") == {"wallets": []}
+    assert await client.get_item("pypergraph-network-mainnet-mempool") == [1]
+
+
+@pytest.mark.asyncio
+async def test_set_client_flushes_the_previous_client(tmp_path):
+    db = StateStorageDb(file_path=str(tmp_path / "state.db"), flush_interval=60)
+    await db.set("vault", {"wallets": []})
+    other = JsonStorage(file_path=str(tmp_path / "other.json"))
+    await db.set_client(other)
+    assert await db.get("vault") is None
+
+    # The fallback storage was flushed and closed, and reopens when used again
+    await db.set_client(None)
+    assert await db.get("vault") == {"wallets": []}
+    await db.close()
+    assert db.default_storage._conn is None
@@ -3,6 +3,7 @@ from .wallets.multi_chain_wallet import MultiChainWallet
 from .wallets.single_account_wallet import SingleAccountWallet
 from .wallets.multi_key_wallet import MultiKeyWallet
 from .keyrings.hd_keyring import HdKeyring
+from .keyrings.hd_deriver import HdDeriver
 from .keyrings.simple_keyring import SimpleKeyring
 from .keyrings.registry import account_registry
 from .encryptor import AsyncAesGcmEncryptor as Encryptor
@@ -12,6 +13,7 @@ from .models.kcs import KeyringAssetInfo
 __all__ = [
     "account_registry",
     "Encryptor",
+    "HdDeriver",
     "HdKeyring",
     "KeyringManager",
     "MultiAccountWallet",
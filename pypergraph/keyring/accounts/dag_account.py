@@ -2,9 +2,9 @@ import hashlib
 from typing import List
 
 import base58
-from cryptography.hazmat.primitives import serialization
 
-from pypergraph.core.constants import PKCS_PREFIX, KeyringAssetType, NetworkId
+from pypergraph.core.constants import KeyringAssetType, NetworkId
+from pypergraph.core.dag_address import get_dag_address
 from .ecdsa_account import EcdsaAccount
 
 
@@ -41,16 +41,8 @@ class DagAccount(EcdsaAccount):
 
         return valid_len and valid_prefix and valid_parity and valid_base58
 
-    def get_public_key(self) -> str:
-        public_key = self.wallet.public_key()
-        public_bytes = public_key.public_bytes(
-            encoding=serialization.Encoding.X962,
-            format=serialization.PublicFormat.UncompressedPoint,
-        )
-        return public_bytes.hex()
-
-    def get_address(self) -> str:
-        return self.get_address_from_public_key(self.get_public_key())
+    def _get_address_from_public_bytes(self, public_bytes: bytes) -> str:
+        return get_dag_address(public_bytes)
 
     def verify_message(self, msg: str, signature: str, says_address: str) -> bool:
         public_key = self.recover_signed_msg_public_key(msg, signature)
@@ -66,24 +58,4 @@ class DagAccount(EcdsaAccount):
         :param public_key_hex: The private key as a hexadecimal string.
         :return: The DAG address corresponding to the public key (node ID).
         """
-        if len(public_key_hex) == 128:
-            public_key = PKCS_PREFIX + "04" + public_key_hex
-        elif len(public_key_hex) == 130 and public_key_hex[:2] == "04":
-            public_key = PKCS_PREFIX + public_key_hex
-        else:
-            raise ValueError("KeyStore :: Not a valid public key.")
-
-        public_key = hashlib.sha256(bytes.fromhex(public_key)).hexdigest()
-        public_key = base58.b58encode(bytes.fromhex(public_key)).decode()
-        public_key = public_key[len(public_key) - 36 :]
-
-        check_digits = "".join([char for char in public_key if char.isdigit()])
-        check_digit = 0
-        for n in check_digits:
-            check_digit += int(n)
-            if check_digit >= 9:
-                check_digit = check_digit % 9
-
-        address = f"DAG{check_digit}{public_key}"
-
-        return address
+        return get_dag_address(public_key_hex)
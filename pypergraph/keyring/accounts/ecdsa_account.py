@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, Tuple
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
@@ -7,7 +7,7 @@ from cryptography.hazmat.primitives.asymmetric import ec
 
 from eth_utils import keccak, to_checksum_address
 from eth_keys import keys
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
 
 class EcdsaAccount(BaseModel, ABC):
@@ -18,6 +18,10 @@ class EcdsaAccount(BaseModel, ABC):
     provider: Any = None
     label: Optional[str] = None
 
+    # Values derived from the signing key: (wallet, public key, private key), recomputed when the key changes
+    _key_cache: Optional[Tuple[Any, bytes, bytes]] = PrivateAttr(default=None)
+    _address: Optional[str] = PrivateAttr(default=None)
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @property
@@ -44,6 +48,36 @@ class EcdsaAccount(BaseModel, ABC):
     def verify_message(self, msg: str, signature: str, says_address: str) -> bool:
         pass
 
+    def __getstate__(self):
+        # The signing key can't be pickled, e.g. for wallets restored in worker processes
+        state = super().__getstate__()
+        if state.get("__pydantic_private__"):
+            state["__pydantic_private__"] = {
+                **state["__pydantic_private__"],
+                "_key_cache": None,
+            }
+        if self.wallet is not None:
+            state["__dict__"] = {
+                **state["__dict__"],
+                "wallet": self.wallet.private_numbers().private_value.to_bytes(
+                    32, byteorder="big"
+                ),
+            }
+        return state
+
+    def __setstate__(self, state):
+        private_key = state["__dict__"].get("wallet")
+        if isinstance(private_key, bytes):
+            state["__dict__"] = {
+                **state["__dict__"],
+                "wallet": ec.derive_private_key(
+                    private_value=int.from_bytes(private_key, byteorder="big"),
+                    curve=ec.SECP256K1(),
+                    backend=default_backend(),
+                ),
+            }
+        super().__setstate__(state)
+
     def get_decimals(self) -> int:
         return self.decimals
 
@@ -176,29 +210,40 @@ class EcdsaAccount(BaseModel, ABC):
         # Return the public key in hexadecimal format
         return public_key.to_hex()
 
+    def _get_keys(self) -> Tuple[bytes, bytes]:
+        """
+        :return: Uncompressed public key and private key bytes, computed once per signing key.
+        """
+        cache = self._key_cache
+        if cache is None or cache[0] is not self.wallet:
+            public_bytes = self.wallet.public_key().public_bytes(
+                encoding=serialization.Encoding.X962,
+                format=serialization.PublicFormat.UncompressedPoint,
+            )
+            private_bytes = self.wallet.private_numbers().private_value.to_bytes(
+                32, "big"
+            )
+            cache = self._key_cache = (self.wallet, public_bytes, private_bytes)
+            self._address = None
+        return cache[1], cache[2]
+
     def get_address(self) -> str:
-        public_key = self.wallet.public_key()
-        public_bytes = public_key.public_bytes(
-            encoding=serialization.Encoding.X962,
-            format=serialization.PublicFormat.UncompressedPoint,
-        )
+        public_bytes, _ = self._get_keys()
+        if self._address is None:
+            self._address = self._get_address_from_public_bytes(public_bytes)
+        return self._address
 
+    def _get_address_from_public_bytes(self, public_bytes: bytes) -> str:
         # Take keccak of everything except the first byte (0x04)
         address = keccak(public_bytes[1:])[-20:]
 
         return to_checksum_address("0x" + address.hex())
 
     def get_public_key(self) -> str:
-        public_key = self.wallet.public_key()
-        public_bytes = public_key.public_bytes(
-            encoding=serialization.Encoding.X962,
-            format=serialization.PublicFormat.UncompressedPoint,
-        )
-        return public_bytes.hex()
+        return self._get_keys()[0].hex()
 
     def get_private_key(self) -> str:
-        private_bytes = self.wallet.private_numbers().private_value.to_bytes(32, "big")
-        return private_bytes.hex()
+        return self._get_keys()[1].hex()
 
     def get_private_key_buffer(self):
-        return self.wallet.private_numbers().private_value.to_bytes(32, "big")
+        return self._get_keys()[1]
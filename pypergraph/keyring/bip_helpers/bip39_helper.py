@@ -1,5 +1,9 @@
+from typing import Iterable, List
+
 from mnemonic import Mnemonic
 
+from pypergraph.core.bip39_wordlist import get_wordlist
+
 
 class Bip39Helper:
     """Generate 12 or 24 words and derive entropy"""
@@ -35,8 +39,7 @@ class Bip39Helper:
         """
         :return: Dictionary with Mnemonic object, mnemonic phrase, mnemonic seed, mnemonic entropy.
         """
-        mnemo = Mnemonic(self.language)
-        return mnemo.generate(strength=self.strength)
+        return get_wordlist(self.language).mnemonic.generate(strength=self.strength)
 
     def is_valid(self, seed: str) -> bool:
         """
@@ -46,10 +49,16 @@ class Bip39Helper:
         :param seed: Mnemonic phrase.
         :return:
         """
+        return get_wordlist(self.language).is_valid(seed)
 
-        mnemo = Mnemonic(self.language)
-        return mnemo.check(seed)
+    def validate_many(self, phrases: Iterable[str]) -> List[bool]:
+        """
+        Validate a batch of mnemonic phrases, e.g. imported phrases.
+
+        :param phrases: Mnemonic phrases.
+        :return: True or False for each phrase, in order.
+        """
+        return get_wordlist(self.language).validate_many(phrases)
 
     def get_seed_bytes_from_mnemonic(self, mnemonic: str):
-        mnemo = Mnemonic(self.language)
-        return mnemo.to_seed(mnemonic)
+        return Mnemonic.to_seed(mnemonic)
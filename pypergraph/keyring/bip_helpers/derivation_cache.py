@@ -0,0 +1,141 @@
+import hashlib
+import hmac
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from bip32utils import BIP32Key
+
+from .bip32_helper import Bip32Helper
+from .bip39_helper import Bip39Helper
+
+
+class DerivationCache:
+    """
+    Cache of BIP39 seeds, BIP32 path nodes and child private keys for one session, e.g. a KeyringManager,
+    wallet or HdDeriver.
+
+    Entries are keyed by an HMAC of the mnemonic with a random session key, the mnemonic itself is not stored.
+    Restoring the same mnemonic for several chains, or adding accounts, reuses the seed (2048 PBKDF2 rounds)
+    and the nodes already derived. Each kind of entry is bounded, the least recently used entries are
+    dropped first. The cache is not pickled, a copy sent to another process starts empty.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        :param max_entries: Maximum number of seeds, of path nodes and of child keys kept.
+        """
+        if max_entries < 1:
+            raise ValueError("DerivationCache :: max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __reduce__(self):
+        # Secrets aren't copied to other processes, e.g. with wallets restored in a worker
+        return DerivationCache, (self.max_entries,)
+
+    def clear(self):
+        """Drop all cached seeds and keys and start a new session key."""
+        with self._lock:
+            self._session_key = secrets.token_bytes(32)
+            self._seeds: Dict[bytes, bytes] = OrderedDict()
+            self._nodes: Dict[Tuple[bytes, str], BIP32Key] = OrderedDict()
+            self._children: Dict[Tuple[bytes, str, int], str] = OrderedDict()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._seeds) + len(self._nodes) + len(self._children)
+
+    def _digest(self, mnemonic: str) -> bytes:
+        return hmac.new(
+            self._session_key, mnemonic.encode("utf-8"), hashlib.sha256
+        ).digest()
+
+    def _get(self, cache: OrderedDict, key):
+        with self._lock:
+            value = cache.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                cache.move_to_end(key)
+            return value
+
+    def _set(self, cache: OrderedDict, key, value):
+        with self._lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > self.max_entries:
+                cache.popitem(last=False)
+
+    def get_seed(self, mnemonic: str) -> bytes:
+        """
+        :param mnemonic: Mnemonic phrase.
+        :return: BIP39 seed bytes.
+        """
+        digest = self._digest(mnemonic)
+        seed = self._get(self._seeds, digest)
+        if seed is None:
+            seed = Bip39Helper().get_seed_bytes_from_mnemonic(mnemonic=mnemonic)
+            self._set(self._seeds, digest, seed)
+        return seed
+
+    def get_node(self, mnemonic: str, hd_path: str) -> BIP32Key:
+        """
+        Derive the key at a derivation path, starting from the deepest cached node on the path.
+
+        :param mnemonic: Mnemonic phrase.
+        :param hd_path: Derivation path, e.g. "m/44'/1137'/0'/0". Hardened indexes end with "'".
+        :return: The key at the derivation path.
+        """
+        digest = self._digest(mnemonic)
+        parts = hd_path.split("/")
+        depth = len(parts)
+        node = None
+        # Find the deepest cached node, e.g. "m/44'" is shared by the Constellation and Ethereum paths
+        while depth > 0:
+            node = self._get(self._nodes, (digest, "/".join(parts[:depth])))
+            if node is not None:
+                break
+            depth -= 1
+        if node is None:
+            node = Bip32Helper.get_root_key_from_seed(self.get_seed(mnemonic))
+            self._set(self._nodes, (digest, parts[0]), node)
+            depth = 1
+        for i in range(depth, len(parts)):
+            part = parts[i]
+            index = int(part.rstrip("'"))
+            node = node.ChildKey(index + 2**31 if part.endswith("'") else index)
+            self._set(self._nodes, (digest, "/".join(parts[: i + 1])), node)
+        return node
+
+    def get_child_private_key(self, mnemonic: str, hd_path: str, index: int) -> str:
+        """
+        :param mnemonic: Mnemonic phrase.
+        :param hd_path: Derivation path without index, e.g. "m/44'/1137'/0'/0".
+        :param index: Account index (bip44_index).
+        :return: Private key in hexadecimal format.
+        """
+        key = (self._digest(mnemonic), hd_path, index)
+        private_key = self._get(self._children, key)
+        if private_key is None:
+            node = self.get_node(mnemonic, hd_path)
+            private_key = node.ChildKey(index).PrivateKey().hex()
+            self._set(self._children, key, private_key)
+        return private_key
+
+    def set_child_private_key(
+        self, mnemonic: str, hd_path: str, index: int, private_key: str
+    ):
+        """
+        Add a child private key derived elsewhere, e.g. in a worker process.
+
+        :param mnemonic: Mnemonic phrase.
+        :param hd_path: Derivation path without index, e.g. "m/44'/1137'/0'/0".
+        :param index: Account index (bip44_index).
+        :param private_key: Private key in hexadecimal format.
+        """
+        self._set(self._children, (self._digest(mnemonic), hd_path, index), private_key)
@@ -1,8 +1,9 @@
 import asyncio
 import json
 import secrets
+import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives import hashes
@@ -25,25 +26,80 @@ class SecurityConstants:
     NONCE_SIZE = 12  # 96-bit nonce for GCM
     HMAC_KEY_SIZE = 32
     VERSION = 1
+    # Re-key policy for keys reused by a session, random 96-bit nonces are safe far beyond this
+    SESSION_MAX_USES = 10_000
+    SESSION_MAX_AGE = 60 * 60  # Seconds
+
+
+class KeySession:
+    """
+    Encryption and HMAC keys derived from a password and salt. Reused to re-encrypt with a fresh
+    nonce, which skips the Argon2id key derivation.
+    """
+
+    def __init__(self, salt: bytes, encryption_key: bytes, hmac_key: bytes):
+        self.salt = salt
+        self.encryption_key = encryption_key
+        self.hmac_key = hmac_key
+        self.created_at = time.monotonic()
+        self.uses = 0
+
+    def expired(
+        self,
+        max_uses: int = SecurityConstants.SESSION_MAX_USES,
+        max_age: Optional[float] = SecurityConstants.SESSION_MAX_AGE,
+    ) -> bool:
+        if self.uses >= max_uses:
+            return True
+        return max_age is not None and time.monotonic() - self.created_at >= max_age
 
 
 class AsyncAesGcmEncryptor:
     def __init__(self):
         self.version = SecurityConstants.VERSION
 
-    async def encrypt(self, password: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_session(
+        self, password: str, salt: Optional[bytes] = None
+    ) -> KeySession:
+        """
+        Derive the keys once for several encryptions.
+
+        :param password: The vault password.
+        :param salt: (Optional) Salt of an existing vault. Default: New random salt.
+        :return: KeySession.
+        """
+        salt = salt or secrets.token_bytes(SecurityConstants.SALT_SIZE)
+        encryption_key, hmac_key = await self._derive_keys(password, salt)
+        return KeySession(salt, encryption_key, hmac_key)
+
+    async def encrypt(
+        self,
+        password: str,
+        data: Dict[str, Any],
+        session: Optional[KeySession] = None,
+    ) -> Dict[str, Any]:
         """
         Securely encrypt wallet data using:
         - Argon2id for memory-hard KDF
         - AES-256-GCM for authenticated encryption
         - HKDF for key separation
         - Random nonce with HMAC integrity
+
+        :param session: (Optional) Reuse the session salt and keys, only the nonce is new.
         """
-        salt = secrets.token_bytes(SecurityConstants.SALT_SIZE)
         nonce = secrets.token_bytes(SecurityConstants.NONCE_SIZE)
 
-        # Async key derivation
-        encryption_key, hmac_key = await self._derive_keys(password, salt)
+        if session is not None:
+            salt, encryption_key, hmac_key = (
+                session.salt,
+                session.encryption_key,
+                session.hmac_key,
+            )
+            session.uses += 1
+        else:
+            salt = secrets.token_bytes(SecurityConstants.SALT_SIZE)
+            # Async key derivation
+            encryption_key, hmac_key = await self._derive_keys(password, salt)
 
         # Encrypt data
         aesgcm = AESGCM(encryption_key)
@@ -68,8 +124,17 @@ class AsyncAesGcmEncryptor:
         vault["hmac"] = (await self._calculate_hmac(hmac_key, vault)).hex()
         return vault
 
-    async def decrypt(self, password: str, vault: Dict[str, Any]) -> Dict[str, Any]:
-        """Secure decryption with full validation"""
+    async def decrypt(
+        self,
+        password: str,
+        vault: Dict[str, Any],
+        session: Optional[KeySession] = None,
+    ) -> Dict[str, Any]:
+        """
+        Secure decryption with full validation
+
+        :param session: (Optional) Keys derived for the vault salt, skips the key derivation.
+        """
         await self._validate_vault(vault)
 
         salt = bytes.fromhex(vault["salt"])
@@ -77,8 +142,11 @@ class AsyncAesGcmEncryptor:
         ciphertext = bytes.fromhex(vault["ciphertext"])
         stored_hmac = bytes.fromhex(vault["hmac"])
 
-        # Derive keys async
-        encryption_key, hmac_key = await self._derive_keys(password, salt)
+        if session is not None and session.salt == salt:
+            encryption_key, hmac_key = session.encryption_key, session.hmac_key
+        else:
+            # Derive keys async
+            encryption_key, hmac_key = await self._derive_keys(password, salt)
 
         # Verify HMAC before decryption
         if not secrets.compare_digest(
@@ -0,0 +1,153 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Dict, Any
+
+from pydantic import BaseModel, Field
+
+from pypergraph.core.constants import BIP_44_PATHS, NetworkId
+from pypergraph.keyring.keyrings.registry import account_registry
+from ..bip_helpers.derivation_cache import DerivationCache
+
+# Cache of a worker process, dropped with the process pool
+_worker_cache: Optional[DerivationCache] = None
+
+
+class DerivedKey(BaseModel):
+    index: int = Field(ge=0)  # bip44_index
+    address: str
+    private_key: str
+
+
+class HdDeriver:
+    """
+    Derive ranges of child keys and addresses from a mnemonic in worker processes.
+
+    Child key derivation in ``bip32utils`` is pure Python, a range of indexes is split into chunks derived
+    concurrently by a process pool. Derived keys are added to the deriver's derivation cache, a wallet sharing
+    the cache (wallet.set_derivation_cache(deriver.derivation_cache)) doesn't derive them again.
+
+    Use the deriver as an async context manager to keep the worker processes between derive() calls,
+    otherwise each call starts and shuts down its own pool.
+    """
+
+    def __init__(
+        self,
+        mnemonic: str,
+        network: str = NetworkId.Constellation.value,
+        hd_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 16,
+        derivation_cache: Optional[DerivationCache] = None,
+    ):
+        """
+        :param mnemonic: Mnemonic phrase.
+        :param network: "Constellation" or "Ethereum".
+        :param hd_path: (Optional) Derivation path without index. Default: The BIP44 path of the network.
+        :param workers: (Optional) Number of worker processes, 0 to derive in the calling thread. Default: One per CPU.
+        :param chunk_size: Number of indexes derived per worker task.
+        :param derivation_cache: (Optional) Cache shared with a wallet or KeyringManager. Default: New cache.
+        """
+        if chunk_size < 1:
+            raise ValueError("HdDeriver :: The chunk size must be at least 1.")
+        self.mnemonic = mnemonic
+        self.network = network
+        self.hd_path = hd_path or (
+            BIP_44_PATHS.ETH_WALLET_PATH.value
+            if network == NetworkId.Ethereum.value
+            else BIP_44_PATHS.CONSTELLATION_PATH.value
+        )
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.derivation_cache = (
+            DerivationCache() if derivation_cache is None else derivation_cache
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def derive(self, start: int = 0, count: int = 1) -> List[DerivedKey]:
+        """
+        Derive the keys and addresses of a range of indexes.
+
+        :param start: First index.
+        :param count: Number of indexes.
+        :return: List of DerivedKey, ordered by index.
+        """
+        if start < 0 or count < 0:
+            raise ValueError("HdDeriver :: Start and count must be positive.")
+        indexes = list(range(start, start + count))
+        if self.workers == 0:
+            results = _derive_keys(
+                self.mnemonic,
+                self.hd_path,
+                self.network,
+                indexes,
+                self.derivation_cache,
+            )
+        else:
+            executor = self._executor or ProcessPoolExecutor(max_workers=self.workers)
+            loop = asyncio.get_running_loop()
+            try:
+                chunks = await asyncio.gather(
+                    *[
+                        loop.run_in_executor(
+                            executor,
+                            _derive_keys,
+                            self.mnemonic,
+                            self.hd_path,
+                            self.network,
+                            indexes[i : i + self.chunk_size],
+                        )
+                        for i in range(0, len(indexes), self.chunk_size)
+                    ]
+                )
+            finally:
+                if executor is not self._executor:
+                    executor.shutdown(wait=False)
+            results = [result for chunk in chunks for result in chunk]
+            for result in results:
+                self.derivation_cache.set_child_private_key(
+                    self.mnemonic, self.hd_path, result["index"], result["private_key"]
+                )
+        return [DerivedKey(**result) for result in results]
+
+    def close(self):
+        """Shut down the worker processes kept by the context manager."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def __aenter__(self):
+        if self.workers != 0 and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _derive_keys(
+    mnemonic: str,
+    hd_path: str,
+    network: str,
+    indexes: List[int],
+    derivation_cache: Optional[DerivationCache] = None,
+) -> List[Dict[str, Any]]:
+    # Runs in a worker process, the seed and path node are cached per worker
+    global _worker_cache
+    if derivation_cache is None:
+        if _worker_cache is None:
+            _worker_cache = DerivationCache()
+        derivation_cache = _worker_cache
+    results = []
+    for index in indexes:
+        private_key = derivation_cache.get_child_private_key(mnemonic, hd_path, index)
+        account = account_registry.create_account(network).deserialize(
+            private_key=private_key, bip44_index=index
+        )
+        results.append(
+            {
+                "index": index,
+                "address": account.get_address(),
+                "private_key": private_key,
+            }
+        )
+    return results
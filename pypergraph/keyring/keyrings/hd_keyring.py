@@ -1,7 +1,7 @@
 from typing import Optional, List, Dict, Any, Union
 
 from bip32utils import BIP32Key
-from pydantic import BaseModel, Field, model_serializer, ConfigDict
+from pydantic import BaseModel, Field, model_serializer, ConfigDict, PrivateAttr
 from typing_extensions import Self
 
 from pypergraph.core.constants import NetworkId
@@ -9,8 +9,7 @@ from pypergraph.keyring.keyrings.registry import account_registry
 from ..accounts.ecdsa_account import EcdsaAccount
 from ..accounts.eth_account import EthAccount
 from ..accounts.dag_account import DagAccount
-from ..bip_helpers.bip32_helper import Bip32Helper
-from ..bip_helpers.bip39_helper import Bip39Helper
+from ..bip_helpers.derivation_cache import DerivationCache
 
 
 class HdKeyring(BaseModel):
@@ -26,6 +25,7 @@ class HdKeyring(BaseModel):
     network: Optional[str] = Field(default=None)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    _derivation_cache: Optional[DerivationCache] = PrivateAttr(default=None)
 
     # Serialize all accounts
     @model_serializer
@@ -38,7 +38,12 @@ class HdKeyring(BaseModel):
         }
 
     def create(
-        self, mnemonic: str, hd_path: str, network: str, number_of_accounts: int = 1
+        self,
+        mnemonic: str,
+        hd_path: str,
+        network: str,
+        number_of_accounts: int = 1,
+        derivation_cache: Optional[DerivationCache] = None,
     ) -> Self:
         """
         Create a hierarchical deterministic keyring.
@@ -47,19 +52,21 @@ class HdKeyring(BaseModel):
         :param hd_path: The derivation path for the coin chain (without index).
         :param network: The network associated with the coin.
         :param number_of_accounts: How many accounts (indexes) to create.
+        :param derivation_cache: (Optional) Cache shared with other keyrings, e.g. of the same wallet.
+            Default: New cache for the keyring.
         :return: Hierarchical deterministic keyring.
         """
-        bip39 = Bip39Helper()
-        bip32 = Bip32Helper()
         self.network = network
         inst = HdKeyring()
         inst.mnemonic = mnemonic
         inst.hd_path = hd_path
-        # Init from mnemonic
-        seed_bytes = bip39.get_seed_bytes_from_mnemonic(mnemonic=inst.mnemonic)
-        inst.root_key = bip32.get_hd_root_key_from_seed(
-            seed_bytes=seed_bytes, hd_path=inst.hd_path
-        )  # Needs to handle indexes
+        inst.set_derivation_cache(
+            DerivationCache() if derivation_cache is None else derivation_cache
+        )
+        # Init from mnemonic, the seed and path nodes are reused within the session
+        inst.root_key = inst.get_derivation_cache().get_node(
+            mnemonic=inst.mnemonic, hd_path=inst.hd_path
+        )
         accounts = inst.create_accounts(number_of_accounts=number_of_accounts)
         inst.deserialize({"network": network, "accounts": accounts})
         return inst
@@ -102,7 +109,9 @@ class HdKeyring(BaseModel):
         """
         index = index if index >= 0 else len(self.accounts)
         if self.mnemonic:
-            private_key = self.root_key.ChildKey(index).PrivateKey().hex()
+            private_key = self.get_derivation_cache().get_child_private_key(
+                self.mnemonic, self.hd_path, index
+            )
             account = account_registry.create_account(self.network)
             account = account.deserialize(private_key=private_key, bip44_index=index)
         else:
@@ -125,6 +134,17 @@ class HdKeyring(BaseModel):
         )
         return inst
 
+    def get_derivation_cache(self) -> DerivationCache:
+        if self._derivation_cache is None:
+            self._derivation_cache = DerivationCache()
+        return self._derivation_cache
+
+    def set_derivation_cache(self, derivation_cache: DerivationCache):
+        """
+        :param derivation_cache: Cache of the seeds and keys derived by this keyring.
+        """
+        self._derivation_cache = derivation_cache
+
     def get_network(self) -> str:
         return self.network
 
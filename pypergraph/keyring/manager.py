@@ -1,27 +1,66 @@
 import asyncio
+import hashlib
+import hmac
+import json
 import re
-from typing import Optional, Union, List
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Optional, Union, List, Tuple
 
 from rx.subject import BehaviorSubject, Subject
 
 from pypergraph.core import KeyringWalletType, NetworkId
 from pypergraph.keyring import Encryptor
+from pypergraph.keyring.encryptor import KeySession, SecurityConstants
 
 from pypergraph.core.cross_platform.state_storage_db import StateStorageDb
 from .storage.observable_store import ObservableStore
 from .accounts.dag_account import DagAccount
 from .accounts.eth_account import EthAccount
 from .bip_helpers.bip39_helper import Bip39Helper
+from .bip_helpers.derivation_cache import DerivationCache
 from .wallets.multi_account_wallet import MultiAccountWallet
 from .wallets.multi_chain_wallet import MultiChainWallet
 from .wallets.multi_key_wallet import MultiKeyWallet
 from .wallets.single_account_wallet import SingleAccountWallet
+from .wallets.lazy_wallet import LazyWallet
+from .wallets.shared import sid_manager
 
 
 class KeyringManager:
-    def __init__(self, storage_file_path: Optional[str] = None):
+    def __init__(
+        self,
+        storage_file_path: Optional[str] = None,
+        max_key_uses: int = SecurityConstants.SESSION_MAX_USES,
+        max_key_age: Optional[float] = SecurityConstants.SESSION_MAX_AGE,
+        restore_workers: Optional[int] = None,
+    ):
+        """
+        :param storage_file_path: Path to the vault storage file.
+        :param max_key_uses: Re-key policy, number of vault encryptions before a new salt and keys are derived.
+        :param max_key_age: Re-key policy, seconds before a new salt and keys are derived. None to disable.
+        :param restore_workers: (Optional) Number of worker processes deriving the keys of restored wallets,
+            keeps the event loop responsive while unlocking. Default: Restore in the calling thread.
+        """
         super().__init__()
         self.encryptor: Encryptor = Encryptor()
+        self.max_key_uses = max_key_uses
+        self.max_key_age = max_key_age
+        self.restore_workers = restore_workers
+        # Created on first use and shut down on logout
+        self._restore_executor: Optional[ProcessPoolExecutor] = None
+        # Keys derived from the password, kept while unlocked
+        self._key_session: Optional[KeySession] = None
+        # Seeds and HD keys derived by the wallets of this manager, cleared on logout
+        self.derivation_cache = DerivationCache()
+        # The vault is an encrypted index of record ids and one encrypted record per wallet
+        self._record_ids: Dict[str, str] = {}  # Wallet id: record id
+        self._record_digests: Dict[str, str] = {}  # Record id: digest of stored wallet
+        # Digests are HMACs with a key of this session, they don't reveal the records they were computed from
+        self._digest_key = secrets.token_bytes(32)
+        self._record_index: Optional[List[str]] = None
+        self._records_salt: Optional[bytes] = None
         self.storage: StateStorageDb = StateStorageDb(file_path=storage_file_path)
         self.wallets: List[
             Union[
@@ -31,6 +70,20 @@ class KeyringManager:
                 SingleAccountWallet,
             ]
         ] = []
+        # Address: (wallet, account), the account of a lazily restored wallet is resolved on first lookup
+        self._address_index: Dict[
+            str,
+            Tuple[
+                Union[
+                    MultiChainWallet,
+                    MultiKeyWallet,
+                    MultiAccountWallet,
+                    SingleAccountWallet,
+                    LazyWallet,
+                ],
+                Optional[Union[DagAccount, EthAccount]],
+            ],
+        ] = {}
         self.password: Optional[str] = None
         self.mem_store: ObservableStore = ObservableStore()
         # Reactive state management
@@ -44,6 +97,7 @@ class KeyringManager:
         """Clear wallet cache."""
 
         self.wallets = []
+        self._address_index = {}
         self.mem_store.update_state(wallets=[])
 
     @staticmethod
@@ -63,6 +117,7 @@ class KeyringManager:
         """
 
         wallet = MultiChainWallet()
+        wallet.set_derivation_cache(self.derivation_cache)
         label = label or "Wallet #" + f"{len(self.wallets) + 1}"
         # Create the multichain wallet from a seed phrase.
         wallet.create(label, seed)
@@ -134,18 +189,88 @@ class KeyringManager:
 
         self.set_password(password)
 
-        s_wallets = [w.model_dump() for w in self.wallets]
-
-        encrypted_string = await self.encryptor.encrypt(
-            self.password, {"wallets": s_wallets}
-        )
+        session = await self._get_key_session()
+        # Records in storage, collected before a re-key forgets the digests
+        stored_ids = set(self._record_digests) | set(self._record_index or [])
+        if session.salt != self._records_salt:
+            # New keys, every record is re-encrypted
+            self._record_digests = {}
+            self._record_index = None
+
+        record_ids = []
+        for wallet in self.wallets:
+            record_id = self._record_ids.setdefault(wallet.id, secrets.token_hex(8))
+            record_ids.append(record_id)
+            # The state lets login serve addresses without deriving keys
+            state = wallet.get_state()
+            data = {
+                "wallet": wallet.model_dump(),
+                "state": {
+                    "supported_assets": state["supported_assets"],
+                    "accounts": state["accounts"],
+                },
+            }
+            digest = self._record_digest(data)
+            if self._record_digests.get(record_id) == digest:
+                continue  # Unchanged
+            encrypted_record = await self.encryptor.encrypt(
+                self.password, data, session=session
+            )
+            await self.storage.set(f"vault-{record_id}", encrypted_record)
+            self._record_digests[record_id] = digest
 
-        await self.storage.set("vault", encrypted_string)
+        # Records are written before the index referencing them and deleted after
+        if record_ids != self._record_index:
+            encrypted_index = await self.encryptor.encrypt(
+                self.password, {"records": record_ids}, session=session
+            )
+            await self.storage.set("vault", encrypted_index)
+            self._record_index = record_ids
+        for record_id in stored_ids - set(record_ids):
+            await self.storage.delete(f"vault-{record_id}")
+            self._record_digests.pop(record_id, None)
+        self._record_ids = {
+            wallet_id: record_id
+            for wallet_id, record_id in self._record_ids.items()
+            if record_id in self._record_digests
+        }
+        self._records_salt = session.salt
+
+    async def _get_key_session(self) -> KeySession:
+        if self._key_session is None or self._key_session.expired(
+            self.max_key_uses, self.max_key_age
+        ):
+            self._key_session = await self.encryptor.create_session(self.password)
+        return self._key_session
+
+    async def rekey(self):
+        """Derive new keys with a new salt and re-encrypt the vault."""
+        self._key_session = None
+        await self._persist_all_wallets(self.password)
 
     async def _update_mem_store_wallets(self):
         wallets = [w.get_state() for w in self.wallets]
+        self._index_addresses(wallets)
         self.mem_store.update_state(wallets=wallets)
 
+    def _index_addresses(self, states: List[dict]):
+        """
+        Rebuild the address index from the wallet states, e.g. after wallets or accounts were added or removed.
+
+        :param states: get_state() of each wallet in self.wallets.
+        """
+        index = {}
+        for wallet, state in zip(self.wallets, states):
+            if isinstance(wallet, LazyWallet) and not wallet.materialized:
+                accounts = [None] * len(state["accounts"])
+            else:
+                # The state lists the accounts in get_accounts() order
+                accounts = wallet.get_accounts()
+            for account_state, account in zip(state["accounts"], accounts):
+                # The first wallet holding an address wins, e.g. an account imported in several wallets
+                index.setdefault(account_state["address"], (wallet, account))
+        self._address_index = index
+
     def set_password(self, password: str):
         """Will enforce basic restrictions on password creation"""
 
@@ -166,6 +291,9 @@ class KeyringManager:
                 "KeyringManager :: Password must contain at least one uppercase letter."
             )
 
+        if password != self.password:
+            # The session keys were derived from the previous password
+            self._key_session = None
         self.password = password
 
     def set_wallet_label(self, wallet_id: str, label: str):
@@ -186,7 +314,7 @@ class KeyringManager:
 
     async def remove_account(self, address):
         wallet_for_account = self.get_wallet_for_account(address)
-        wallet_for_account.remove_account()
+        wallet_for_account.remove_account(self.get_account_by_address(address))
         self._event_subject.on_next({"type": "removed_account", "data": address})
         accounts = wallet_for_account.get_accounts()
         if len(accounts) == 0:
@@ -197,24 +325,29 @@ class KeyringManager:
 
     def remove_empty_wallets(self):
         self.wallets = [w for w in self.wallets if len(w.get_accounts()) > 0]
+        self._index_addresses([w.get_state() for w in self.wallets])
 
     def get_wallet_for_account(
         self, address: str
     ) -> Union[
         MultiChainWallet, SingleAccountWallet, MultiAccountWallet, MultiKeyWallet
     ]:
-        winner = next(
-            (
-                w
-                for w in self.wallets
-                if any(a.get_address() == address for a in w.get_accounts())
-            ),
-            None,
-        )
-        if winner:
-            return winner
+        if address in self._address_index:
+            return self._address_index[address][0]
         raise ValueError("KeyringManager :: No wallet found for the requested account.")
 
+    def get_account_by_address(self, address: str) -> Union[DagAccount, EthAccount]:
+        """
+        :param address: DAG or Ethereum address.
+        :return: The account of the address in any unlocked wallet.
+        """
+        wallet = self.get_wallet_for_account(address)
+        account = self._address_index[address][1]
+        if account is None:
+            account = wallet.get_account_by_address(address)
+            self._address_index[address] = (wallet, account)
+        return account
+
     def check_password(self, password) -> bool:
         return bool(self.password == password)
 
@@ -227,6 +360,13 @@ class KeyringManager:
         # Reset ID counter that used to enumerate wallet IDs. \
         [w.reset_sid() for w in self.wallets]
         self.password = None
+        self._key_session = None
+        self._reset_records()
+        # Drop cached seeds and keys derived while unlocked
+        self.derivation_cache.clear()
+        if self._restore_executor is not None:
+            self._restore_executor.shutdown(wait=False)
+            self._restore_executor = None
         self.mem_store.update_state(is_unlocked=False)
         await self.clear_wallets()
         self._event_subject.on_next({"type": "lock"})
@@ -255,19 +395,144 @@ class KeyringManager:
             return []
 
         await self.clear_wallets()
+        session = await self.encryptor.create_session(
+            password, bytes.fromhex(encrypted_vault.get("salt", ""))
+        )
         vault = await self.encryptor.decrypt(
-            password, encrypted_vault
+            password, encrypted_vault, session=session
         )  # VaultSerialized
         self.password = password
-        tasks = [self._restore_wallet(w) for w in vault["wallets"]]
-        self.wallets = [
-            w
-            for w in await asyncio.gather(*tasks, return_exceptions=True)
-            if not isinstance(w, Exception)
-        ]
+        # Keep the keys to re-encrypt the vault without deriving them again
+        self._key_session = session
+        self._reset_records()
+
+        if "records" in vault:
+            record_ids = vault["records"]
+            records = [
+                await self.encryptor.decrypt(
+                    password,
+                    await self.storage.get(f"vault-{record_id}"),
+                    session=session,
+                )
+                for record_id in record_ids
+            ]
+        else:
+            # Single encrypted blob with all wallets, migrated to records below
+            record_ids, records = None, vault["wallets"]
+
+        # Records without cached state are restored up front, wallet ids are assigned in vault order below
+        restored = iter(
+            await self._deserialize_wallets(
+                [record for record in records if "state" not in record]
+            )
+        )
+        self.wallets = []
+        for index, record in enumerate(records):
+            if "state" in record:
+                # Keys are derived when the wallet is used
+                wallet = LazyWallet(
+                    record["wallet"],
+                    record["state"],
+                    partial(
+                        self._deserialize_wallet, derivation_cache=self.derivation_cache
+                    ),
+                )
+            else:
+                wallet = next(restored)
+                if isinstance(wallet, Exception):
+                    continue
+                wallet.id = sid_manager.next_sid(wallet.type)
+            self.wallets.append(wallet)
+            if record_ids is not None:
+                record_id = record_ids[index]
+                self._record_ids[wallet.id] = record_id
+                self._record_digests[record_id] = self._record_digest(record)
+
+        if record_ids is None:
+            await self._persist_all_wallets(password)
+        else:
+            self._record_index = record_ids
+            self._records_salt = session.salt
         await self._update_mem_store_wallets()
         return self.wallets
 
+    async def _deserialize_wallets(
+        self, wallets_data: List[dict]
+    ) -> List[
+        Union[
+            MultiChainWallet,
+            SingleAccountWallet,
+            MultiAccountWallet,
+            MultiKeyWallet,
+            Exception,
+        ]
+    ]:
+        """
+        Restore wallets without assigning wallet ids, in the worker processes if restore_workers is set.
+
+        :param wallets_data: Serialized wallets.
+        :return: Wallets or exceptions, in the order of wallets_data.
+        """
+        if not self.restore_workers:
+            results = []
+            for data in wallets_data:
+                try:
+                    with sid_manager.paused():
+                        results.append(
+                            self._deserialize_wallet(data, self.derivation_cache)
+                        )
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        if self._restore_executor is None:
+            self._restore_executor = ProcessPoolExecutor(
+                max_workers=self.restore_workers
+            )
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    self._restore_executor, _deserialize_wallet_worker, data
+                )
+                for data in wallets_data
+            ],
+            return_exceptions=True,
+        )
+        for wallet in results:
+            # Caches aren't pickled, the wallets come back with empty ones
+            if hasattr(wallet, "set_derivation_cache"):
+                wallet.set_derivation_cache(self.derivation_cache)
+        return results
+
+    async def materialize_wallets(self):
+        """
+        Derive the keys of all lazily restored wallets, e.g. to warm up an unlocked server before signing.
+        Runs in the worker processes if restore_workers is set.
+        """
+        stubs = [
+            w for w in self.wallets if isinstance(w, LazyWallet) and not w.materialized
+        ]
+        results = await self._deserialize_wallets([w.model_dump() for w in stubs])
+        for stub, wallet in zip(stubs, results):
+            if isinstance(wallet, Exception):
+                raise wallet
+            stub.set_wallet(wallet)
+
+    def _record_digest(self, data: dict) -> str:
+        return hmac.new(
+            self._digest_key,
+            json.dumps(data, sort_keys=True).encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+    def _reset_records(self):
+        self._record_ids = {}
+        self._record_digests = {}
+        self._digest_key = secrets.token_bytes(32)
+        self._record_index = None
+        self._records_salt = None
+
     def _update_unlocked(self):
         self.mem_store.update_state(is_unlocked=True)
         self._state_subject.on_next(self.mem_store.get_state())
@@ -277,10 +542,22 @@ class KeyringManager:
         self, data
     ) -> Union[
         MultiChainWallet, SingleAccountWallet, MultiAccountWallet, MultiKeyWallet
+    ]:  # KeyringSerialized
+        wallet = self._deserialize_wallet(data, self.derivation_cache)
+        self.wallets.append(wallet)
+        return wallet
+
+    @staticmethod
+    def _deserialize_wallet(
+        data, derivation_cache: Optional[DerivationCache] = None
+    ) -> Union[
+        MultiChainWallet, SingleAccountWallet, MultiAccountWallet, MultiKeyWallet
     ]:  # KeyringSerialized
         if data["type"] == KeyringWalletType.MultiChainWallet.value:
             ## Can export secret (mnemonic) but cant remove or import
             wallet = MultiChainWallet()
+            if derivation_cache is not None:
+                wallet.set_derivation_cache(derivation_cache)
             # Create keyrings
             wallet.deserialize(
                 label=data["label"], secret=data["secret"], rings=data["rings"]
@@ -297,6 +574,8 @@ class KeyringManager:
         elif data["type"] == KeyringWalletType.MultiAccountWallet.value:
             ## This can export secret key (mnemonic), remove account but not import
             wallet = MultiAccountWallet()
+            if derivation_cache is not None:
+                wallet.set_derivation_cache(derivation_cache)
             # Create keyrings
             wallet.deserialize(
                 label=data["label"],
@@ -323,6 +602,11 @@ class KeyringManager:
                 + "]"
             )
 
-        self.wallets.append(wallet)
-
         return wallet
+
+
+def _deserialize_wallet_worker(
+    data,
+) -> Union[MultiChainWallet, SingleAccountWallet, MultiAccountWallet, MultiKeyWallet]:
+    # Runs in a worker process, the wallet is pickled back to the manager
+    return KeyringManager._deserialize_wallet(data)
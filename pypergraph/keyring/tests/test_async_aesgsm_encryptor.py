@@ -131,3 +131,32 @@ class TestEncryptor:
         decrypted_data = await encryptor.decrypt(password, vault)
 
         assert decrypted_data == data, "Empty data should decrypt correctly"
+
+    @pytest.mark.asyncio
+    async def test_session_reuses_keys(self, monkeypatch):
+        """Ensures that a session encrypts with fresh nonces without deriving keys again."""
+        encryptor = AsyncAesGcmEncryptor()
+        password = "SessionPassword123!"
+        session = await encryptor.create_session(password)
+
+        derivations = 0
+        derive_keys = encryptor._derive_keys
+
+        async def counting_derive_keys(*args):
+            nonlocal derivations
+            derivations += 1
+            return await derive_keys(*args)
+
+        monkeypatch.setattr(encryptor, "_derive_keys", counting_derive_keys)
+        vaults = [
+            await encryptor.encrypt(password, {"i": i}, session) for i in range(3)
+        ]
+
+        assert derivations == 0 and session.uses == 3
+        assert {v["salt"] for v in vaults} == {session.salt.hex()}
+        assert len({v["nonce"] for v in vaults}) == 3
+        assert await encryptor.decrypt(password, vaults[2], session) == {"i": 2}
+        # Without the session the keys are derived from the password
+        assert await encryptor.decrypt(password, vaults[1]) == {"i": 1}
+        assert derivations == 1
+        assert session.expired(max_uses=3) and not session.expired()
@@ -1,10 +1,22 @@
 import pytest
 
-from pypergraph.keyring import KeyringManager, MultiKeyWallet, MultiAccountWallet
+from concurrent.futures import ThreadPoolExecutor
+
+from pypergraph.core import KeyringWalletType
+from pypergraph.keyring import (
+    KeyringManager,
+    MultiKeyWallet,
+    MultiAccountWallet,
+    MultiChainWallet,
+    SingleAccountWallet,
+)
+from pypergraph.keyring.accounts.dag_account import DagAccount
 from pypergraph.keyring.accounts.dag_asset_library import DagAssetLibrary
+from pypergraph.keyring.bip_helpers.derivation_cache import DerivationCache
 from pypergraph.keyring.models.kcs import KeyringAssetInfo
 from pypergraph.keyring.tests.secret import mnemo, from_address
 from pypergraph.keyring.tests.test_account import CustomAccount
+from pypergraph.keyring.wallets.shared import sid_manager
 from pypergraph.keystore import KeyStore
 
 # We need to write some more tests
@@ -327,3 +339,313 @@ class TestKeyring:
                 }
             },
         }
+
+    @pytest.mark.asyncio
+    async def test_vault_key_session(self, tmp_path, monkeypatch):
+        key_manager = KeyringManager(
+            storage_file_path=str(tmp_path / "key_storage.json"), max_key_uses=6
+        )
+        derivations = 0
+        derive_keys = key_manager.encryptor._derive_keys
+
+        async def counting_derive_keys(*args):
+            nonlocal derivations
+            derivations += 1
+            return await derive_keys(*args)
+
+        monkeypatch.setattr(key_manager.encryptor, "_derive_keys", counting_derive_keys)
+        await key_manager.create_or_restore_vault(
+            password="super_S3cretP_Asswo0rd", seed=mnemo
+        )
+        await key_manager.create_single_account_wallet(
+            label="SAW", private_key=KeyStore.get_private_key_from_mnemonic(mnemo)
+        )
+        assert derivations == 1
+        # Re-key after six encryptions (wallet records and index) with the same keys
+        await key_manager.create_multi_chain_hd_wallet(seed=mnemo)
+        await key_manager.create_multi_chain_hd_wallet(seed=mnemo)
+        assert derivations == 2
+        salt = (await key_manager.storage.get("vault"))["salt"]
+        await key_manager.logout()
+
+        await key_manager.login("super_S3cretP_Asswo0rd")
+        assert len(key_manager.wallets) == 4 and derivations == 3
+        await key_manager.create_single_account_wallet(
+            label="SAW", private_key=KeyStore.get_private_key_from_mnemonic(mnemo)
+        )
+        assert derivations == 3
+        assert (await key_manager.storage.get("vault"))["salt"] == salt
+        await key_manager.rekey()
+        assert derivations == 4
+        assert (await key_manager.storage.get("vault"))["salt"] != salt
+        await key_manager.logout()
+
+    @pytest.mark.asyncio
+    async def test_vault_records(self, tmp_path, monkeypatch):
+        password = "super_S3cretP_Asswo0rd"
+        key_manager = KeyringManager(storage_file_path=str(tmp_path / "vault.json"))
+        pk = KeyStore.get_private_key_from_mnemonic(mnemo)
+        # Vault stored as a single encrypted blob is migrated on login
+        blob = await key_manager.encryptor.encrypt(
+            password,
+            {
+                "wallets": [
+                    {
+                        "type": "SAW",
+                        "label": f"SAW {i}",
+                        "network": "Constellation",
+                        "secret": pk,
+                    }
+                    for i in range(3)
+                ]
+            },
+        )
+        await key_manager.storage.set("vault", blob)
+        await key_manager.login(password)
+        assert [w.label for w in key_manager.wallets] == ["SAW 0", "SAW 1", "SAW 2"]
+
+        encrypted = []
+        encrypt = key_manager.encryptor.encrypt
+
+        async def counting_encrypt(password, data, session=None):
+            encrypted.append(data)
+            return await encrypt(password, data, session)
+
+        monkeypatch.setattr(key_manager.encryptor, "encrypt", counting_encrypt)
+        # Only the changed record is encrypted and written
+        key_manager.set_wallet_label(key_manager.wallets[1].id, "Renamed")
+        await key_manager._persist_all_wallets(password)
+        assert [d["wallet"]["label"] for d in encrypted] == ["Renamed"]
+        # Change detection uses digests keyed per session, not plain hashes of the records
+        other = KeyringManager(storage_file_path=str(tmp_path / "other.json"))
+        assert other._record_digest({"secret": pk}) != key_manager._record_digest(
+            {"secret": pk}
+        )
+        # Adding a wallet writes its record and the index
+        encrypted.clear()
+        await key_manager.create_single_account_wallet(label="SAW 3", private_key=pk)
+        assert [d.get("wallet", {}).get("label") for d in encrypted] == ["SAW 3", None]
+        await key_manager.logout()
+
+        await key_manager.login(password)
+        assert [w.label for w in key_manager.wallets] == [
+            "SAW 0",
+            "Renamed",
+            "SAW 2",
+            "SAW 3",
+        ]
+        stored = await key_manager.storage.storage_client._read_data()
+        assert len(stored) == 5 and "wallets" not in str(stored)
+        # The record of a removed wallet is deleted when the vault is re-keyed too
+        key_manager.wallets.pop()
+        await key_manager.rekey()
+        stored = await key_manager.storage.storage_client._read_data()
+        assert len(stored) == 4
+        await key_manager.logout()
+
+    @pytest.mark.asyncio
+    async def test_lazy_login(self, tmp_path):
+        password = "super_S3cretP_Asswo0rd"
+        key_manager = KeyringManager(storage_file_path=str(tmp_path / "vault.json"))
+        await key_manager.create_or_restore_vault(password=password, seed=mnemo)
+        await key_manager.create_single_account_wallet(
+            label="SAW", private_key=KeyStore.get_private_key_from_mnemonic(mnemo)
+        )
+        states = [w.get_state() for w in key_manager.wallets]
+        await key_manager.logout()
+
+        await key_manager.login(password)
+        wallets = key_manager.wallets
+        # Restored from the vault records without deriving keys
+        assert not any(w.materialized for w in wallets)
+        assert [w.get_state() for w in wallets] == states
+        assert key_manager.get_wallet_for_account(from_address) is wallets[0]
+        assert [w.type for w in wallets] == [
+            KeyringWalletType.MultiChainWallet.value,
+            KeyringWalletType.SingleAccountWallet.value,
+        ]
+        assert not wallets[0].materialized
+
+        # Signing and exporting derive the keys, the wallet keeps its id
+        account = wallets[0].get_account_by_address(from_address)
+        assert account.get_address() == from_address
+        assert wallets[0].materialized and wallets[0].id == "MCW1"
+        assert isinstance(wallets[0].materialize(), MultiChainWallet)
+        assert wallets[1].export_secret_key() == KeyStore.get_private_key_from_mnemonic(
+            mnemo
+        )
+        assert [w.id for w in wallets] == ["MCW1", "SAW2"]
+        await key_manager.logout()
+
+    @pytest.mark.asyncio
+    async def test_restore_workers(self, tmp_path):
+        password = "super_S3cretP_Asswo0rd"
+        key_manager = KeyringManager(
+            storage_file_path=str(tmp_path / "vault.json"), restore_workers=2
+        )
+        pk = KeyStore.get_private_key_from_mnemonic(mnemo)
+        # Wallets of a single blob vault are restored in the worker processes
+        blob = await key_manager.encryptor.encrypt(
+            password,
+            {
+                "wallets": [
+                    {"type": "MCW", "label": "MCW", "secret": mnemo, "rings": []},
+                    {
+                        "type": "SAW",
+                        "label": "SAW",
+                        "network": "Constellation",
+                        "secret": pk,
+                    },
+                ]
+            },
+        )
+        await key_manager.storage.set("vault", blob)
+        await key_manager.login(password)
+        wallets = key_manager.wallets
+        assert [w.id for w in wallets] == ["MCW1", "SAW2"]
+        assert wallets[1].export_secret_key() == pk
+        assert key_manager.get_wallet_for_account(from_address) is wallets[0]
+        await key_manager.logout()
+
+        await key_manager.login(password)
+        await key_manager.materialize_wallets()
+        wallets = key_manager.wallets
+        assert all(w.materialized for w in wallets)
+        assert [w.id for w in wallets] == ["MCW1", "SAW2"]
+        assert wallets[0].get_account_by_address(from_address).get_private_key() == pk
+        await key_manager.logout()
+
+    @pytest.mark.asyncio
+    async def test_derivation_cache(self, key_manager):
+        derivation_cache = key_manager.derivation_cache
+        await key_manager.create_or_restore_vault(
+            password="super_S3cretP_Asswo0rd", seed=mnemo
+        )
+        # Both chains share the seed and the "m/44'" node
+        assert len(derivation_cache._seeds) == 1
+        misses = derivation_cache.misses
+        wallet = MultiAccountWallet()
+        wallet.set_derivation_cache(derivation_cache)
+        wallet.create(
+            network="Constellation", label="New MAW", mnemonic=mnemo, num_of_accounts=3
+        )
+        # Only the two new account keys are derived
+        assert derivation_cache.misses - misses == 2
+        wallet.set_num_of_accounts(4)
+        assert derivation_cache.misses - misses == 3
+        assert wallet.get_accounts()[0].get_address() == from_address
+        assert mnemo not in str(derivation_cache.__dict__)
+        # Caches are per session, another manager's logout doesn't clear this one
+        await KeyringManager(storage_file_path="key_storage.json").logout()
+        assert len(derivation_cache) > 0
+        await key_manager.logout()
+        assert len(derivation_cache) == 0
+
+    def test_derivation_cache_bound(self):
+        derivation_cache = DerivationCache(max_entries=2)
+        keys = [
+            derivation_cache.get_child_private_key(mnemo, "m/44'/1137'/0'/0", i)
+            for i in range(3)
+        ]
+        assert len(derivation_cache._children) == 2
+        # The least recently used key was dropped and is derived again
+        misses = derivation_cache.misses
+        assert (
+            derivation_cache.get_child_private_key(mnemo, "m/44'/1137'/0'/0", 2)
+            == keys[2]
+        )
+        assert derivation_cache.misses == misses
+        assert (
+            derivation_cache.get_child_private_key(mnemo, "m/44'/1137'/0'/0", 0)
+            == keys[0]
+        )
+        assert derivation_cache.misses == misses + 1
+        # Wallets without a shared cache keep their own
+        wallet = MultiAccountWallet()
+        wallet.create(network="Constellation", label="MAW", mnemonic=mnemo)
+        assert len(wallet.get_derivation_cache()) > 0
+        assert wallet.keyring.get_derivation_cache() is wallet.get_derivation_cache()
+
+    @pytest.mark.asyncio
+    async def test_address_index(self, key_manager, monkeypatch):
+        await key_manager.create_or_restore_vault(
+            password="super_S3cretP_Asswo0rd", seed=mnemo
+        )
+        wallet = MultiAccountWallet()
+        wallet.create(
+            network="Constellation", label="New MAW", mnemonic=mnemo, num_of_accounts=3
+        )
+        key_manager.wallets.append(wallet)
+        await key_manager._full_update()
+        last_address = wallet.get_accounts()[2].get_address()
+
+        def get_address(self):
+            raise AssertionError("Address derived on lookup")
+
+        with monkeypatch.context() as m:
+            m.setattr(DagAccount, "get_address", get_address)
+            assert key_manager.get_wallet_for_account(last_address) is wallet
+            assert (
+                key_manager.get_account_by_address(last_address)
+                is wallet.get_accounts()[2]
+            )
+        # The MCW and MAW both hold the first account, the first wallet wins
+        assert (
+            key_manager.get_wallet_for_account(from_address) is key_manager.wallets[0]
+        )
+
+        await key_manager.remove_account(last_address)
+        assert len(wallet.get_accounts()) == 2
+        with pytest.raises(ValueError):
+            key_manager.get_wallet_for_account(last_address)
+        await key_manager.logout()
+
+    def test_account_key_cache(self, monkeypatch):
+        pk = KeyStore.get_private_key_from_mnemonic(mnemo)
+        account = DagAccount().deserialize(private_key=pk)
+        assert account.get_address() == from_address
+        calls = []
+        public_key = type(account.wallet).public_key
+
+        monkeypatch.setattr(
+            type(account.wallet),
+            "public_key",
+            lambda self: calls.append(1) or public_key(self),
+        )
+        # Derived once per signing key
+        for _ in range(3):
+            assert account.get_address() == from_address
+            assert account.get_private_key() == pk
+            account.get_public_key()
+        assert calls == []
+        # A new key invalidates the cached values
+        account.deserialize(private_key=KeyStore().generate_private_key())
+        assert account.get_address() != from_address
+        assert len(calls) == 1
+
+    def test_paused_sids(self):
+        pk = KeyStore.get_private_key_from_mnemonic(mnemo)
+
+        def restore(_):
+            with sid_manager.paused():
+                wallet = SingleAccountWallet()
+                wallet.create(network="Constellation", private_key=pk, label="SAW")
+                return None
+
+        def create(_):
+            return SingleAccountWallet().id
+
+        # Restoring wallets in other threads never hands out an id twice
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(
+                lambda i: (restore if i % 2 else create)(i), range(200)
+            )
+            ids = [sid for sid in results if sid]
+        assert len(set(ids)) == len(ids) == 100
+
+        # Pausing only affects the calling thread, other threads aren't blocked meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with sid_manager.paused():
+                assert sid_manager.next_sid("SAW") == "SAW"
+                sid = executor.submit(create, 0).result(timeout=5)
+            assert sid.startswith("SAW") and sid != "SAW"
@@ -0,0 +1,88 @@
+from typing import Any, Callable, Dict, Optional
+
+from .shared import sid_manager
+
+
+class LazyWallet:
+    """
+    Stub for a restored wallet. The label, addresses and tokens are served from the vault record,
+    the keys are only derived when the wallet is used for anything else, e.g. signing or exporting.
+
+    Check the wallet type with wallet.type, e.g. KeyringWalletType.MultiChainWallet.value, isinstance()
+    only sees the wallet class after materialize().
+    """
+
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        state: Dict[str, Any],
+        restore: Callable[[Dict[str, Any]], Any],
+    ):
+        """
+        :param data: Serialized wallet (model_dump()).
+        :param state: Cached wallet state without id, type and label, e.g. {"supported_assets": [...], "accounts": [...]}.
+        :param restore: Callable creating the wallet from the serialized wallet.
+        """
+        self.type = data["type"]
+        self.id = sid_manager.next_sid(self.type)
+        self._data = data
+        self._state = state
+        self._restore = restore
+        self._wallet = None
+
+    @property
+    def materialized(self) -> bool:
+        return self._wallet is not None
+
+    def materialize(self):
+        """
+        Restore the wallet and derive its keys.
+
+        :return: The wallet, e.g. MultiChainWallet.
+        """
+        if self._wallet is None:
+            with sid_manager.paused():
+                self.set_wallet(self._restore(self._data))
+        return self._wallet
+
+    def set_wallet(self, wallet):
+        """
+        Use a wallet restored elsewhere, e.g. in a worker process.
+
+        :param wallet: The wallet restored from model_dump().
+        """
+        wallet.id = self.id
+        self._wallet = wallet
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not set on the stub
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    @property
+    def label(self) -> Optional[str]:
+        return self._wallet.label if self._wallet else self._data["label"]
+
+    def get_label(self) -> Optional[str]:
+        return self.label
+
+    def set_label(self, label: str):
+        if self._wallet:
+            self._wallet.set_label(label)
+        elif not label:
+            raise ValueError("LazyWallet :: No label set.")
+        else:
+            self._data = {**self._data, "label": label}
+
+    def get_state(self) -> Dict[str, Any]:
+        if self._wallet:
+            return self._wallet.get_state()
+        return {"id": self.id, "type": self.type, "label": self.label, **self._state}
+
+    def model_dump(self) -> Dict[str, Any]:
+        return self._wallet.model_dump() if self._wallet else self._data
+
+    @staticmethod
+    def reset_sid():
+        sid_manager.reset_sid()
@@ -1,11 +1,12 @@
 from typing import Optional, List, Dict, Any
 
-from pydantic import Field, model_serializer, model_validator, BaseModel
+from pydantic import Field, model_serializer, model_validator, BaseModel, PrivateAttr
 
 from pypergraph.core import BIP_44_PATHS, KeyringAssetType, KeyringWalletType, NetworkId
 
 from .shared import sid_manager
 from ..bip_helpers.bip39_helper import Bip39Helper
+from ..bip_helpers.derivation_cache import DerivationCache
 from ..keyrings.hd_keyring import HdKeyring
 
 
@@ -16,6 +17,8 @@ class MultiAccountWallet(BaseModel):
     label: Optional[str] = Field(default=None, max_length=12)
     keyring: HdKeyring = Field(default=None)
     mnemonic: Optional[str] = Field(default=None)
+    # Seeds and keys derived by the wallet's keyrings, see set_derivation_cache()
+    _derivation_cache: DerivationCache = PrivateAttr(default_factory=DerivationCache)
     network: str = Field(default=None)
 
     @model_validator(mode="after")
@@ -117,6 +120,7 @@ class MultiAccountWallet(BaseModel):
             hd_path=bip44_path,
             network=self.network,
             number_of_accounts=num_of_accounts,
+            derivation_cache=self._derivation_cache,
         )
         rings = rings or self.model_serialize().get("rings")
         if rings:
@@ -157,6 +161,7 @@ class MultiAccountWallet(BaseModel):
             hd_path=self.keyring.get_hd_path(),
             network=self.network,
             number_of_accounts=num,
+            derivation_cache=self._derivation_cache,
         )
 
     def remove_account(self, account):
@@ -170,6 +175,19 @@ class MultiAccountWallet(BaseModel):
     def export_secret_key(self) -> str:
         return self.mnemonic
 
+    def get_derivation_cache(self) -> DerivationCache:
+        return self._derivation_cache
+
+    def set_derivation_cache(self, derivation_cache: DerivationCache):
+        """
+        Share a derivation cache, e.g. the session cache of a KeyringManager or the cache of an HdDeriver.
+
+        :param derivation_cache: Cache used by the wallet's keyring.
+        """
+        self._derivation_cache = derivation_cache
+        if self.keyring is not None:
+            self.keyring.set_derivation_cache(derivation_cache)
+
     @staticmethod
     def reset_sid():
         sid_manager.reset_sid()
@@ -1,6 +1,6 @@
 from typing import Optional, List, Dict, Any, Union
 
-from pydantic import Field, model_serializer, model_validator, BaseModel
+from pydantic import Field, model_serializer, model_validator, BaseModel, PrivateAttr
 
 from pypergraph.core import BIP_44_PATHS, KeyringWalletType, NetworkId
 
@@ -8,6 +8,7 @@ from .shared import sid_manager
 from ..accounts.dag_account import DagAccount
 from ..accounts.eth_account import EthAccount
 from ..bip_helpers.bip39_helper import Bip39Helper
+from ..bip_helpers.derivation_cache import DerivationCache
 from ..keyrings.hd_keyring import HdKeyring
 
 
@@ -18,6 +19,8 @@ class MultiChainWallet(BaseModel):
     label: Optional[str] = Field(default=None, max_length=12)
     keyrings: List[HdKeyring] = Field(default=[])
     mnemonic: Optional[str] = Field(default=None)
+    # Seeds and keys derived by the wallet's keyrings, see set_derivation_cache()
+    _derivation_cache: DerivationCache = PrivateAttr(default_factory=DerivationCache)
 
     @model_validator(mode="after")
     def compute_id(self):
@@ -117,7 +120,7 @@ class MultiChainWallet(BaseModel):
         return account
 
     @staticmethod
-    def remove_account():
+    def remove_account(account=None):
         """Remove MCW not supported."""
         raise ValueError("MultiChainWallet :: Does not allow removing accounts.")
 
@@ -139,12 +142,14 @@ class MultiChainWallet(BaseModel):
                 hd_path=BIP_44_PATHS.CONSTELLATION_PATH.value,
                 network=NetworkId.Constellation.value,
                 number_of_accounts=1,
+                derivation_cache=self._derivation_cache,
             ),
             HdKeyring().create(
                 mnemonic=self.mnemonic,
                 hd_path=BIP_44_PATHS.ETH_WALLET_PATH.value,
                 network=NetworkId.Ethereum.value,
                 number_of_accounts=1,
+                derivation_cache=self._derivation_cache,
             ),
         ]
 
@@ -152,6 +157,19 @@ class MultiChainWallet(BaseModel):
             for i, r in enumerate(rings):
                 self.keyrings[i].deserialize(r)
 
+    def get_derivation_cache(self) -> DerivationCache:
+        return self._derivation_cache
+
+    def set_derivation_cache(self, derivation_cache: DerivationCache):
+        """
+        Share a derivation cache, e.g. the session cache of a KeyringManager or the cache of an HdDeriver.
+
+        :param derivation_cache: Cache used by the wallet's keyrings.
+        """
+        self._derivation_cache = derivation_cache
+        for keyring in self.keyrings:
+            keyring.set_derivation_cache(derivation_cache)
+
     @staticmethod
     def reset_sid():
         sid_manager.reset_sid()
@@ -147,7 +147,7 @@ class MultiKeyWallet(BaseModel):
         return account
 
     @staticmethod
-    def remove_account():
+    def remove_account(account=None):
         """Not supported by MKW."""
         raise ValueError("MultiKeyWallet :: Does not allow removing accounts.")
 
@@ -1,12 +1,18 @@
 import threading
+from contextlib import contextmanager
 
 
 class SIDManager:
     def __init__(self):
         self._sid = 0
         self._lock = threading.Lock()
+        # Pausing only affects the calling thread, wallets created by other threads meanwhile get SIDs
+        self._local = threading.local()
 
     def next_sid(self, prefix: str) -> str:
+        if getattr(self._local, "paused", 0):
+            # The caller assigns the id, e.g. of an existing stub
+            return prefix
         with self._lock:
             self._sid += 1
             return f"{prefix}{self._sid}"
@@ -15,6 +21,15 @@ class SIDManager:
         with self._lock:
             self._sid = 0
 
+    @contextmanager
+    def paused(self):
+        """Create wallets in the calling thread without using SIDs, e.g. wallets taking the id of an existing stub."""
+        self._local.paused = getattr(self._local, "paused", 0) + 1
+        try:
+            yield
+        finally:
+            self._local.paused -= 1
+
 
 # Create a global instance
 sid_manager = SIDManager()
@@ -1,3 +1,5 @@
 from .keystore import KeyStore
+from .proof_verifier import ProofVerifier
+from .signer import Signer, SigningDaemon
 
-__all__ = ["KeyStore"]
+__all__ = ["KeyStore", "ProofVerifier", "Signer", "SigningDaemon"]
@@ -1,5 +1,9 @@
+from typing import Iterable, List
+
 from mnemonic import Mnemonic
 
+from pypergraph.core.bip39_wordlist import get_wordlist
+
 
 class Bip39Helper:
     """Generate 12 or 24 words and derive entropy"""
@@ -35,20 +39,27 @@ class Bip39Helper:
         """
         :return: Dictionary with Mnemonic object, mnemonic phrase, mnemonic seed, mnemonic entropy.
         """
-        mnemo = Mnemonic(self.language)
-        phrase = mnemo.generate(strength=self.strength)
+        phrase = get_wordlist(self.language).mnemonic.generate(strength=self.strength)
         # seed = mnemo.to_seed(words)
         # entropy = mnemo.to_entropy(words)
         return phrase
 
     def get_seed_from_mnemonic(self, phrase: str):
-        mnemo = Mnemonic(self.language)
-        return mnemo.to_seed(phrase)
+        return Mnemonic.to_seed(phrase)
 
     @staticmethod
     def validate_mnemonic(mnemonic_phrase: str, language: str = "english"):
-        mnemo = Mnemonic(language)
-        if mnemo.check(mnemonic_phrase):
-            return True
-        else:
-            return False
+        return get_wordlist(language).is_valid(mnemonic_phrase)
+
+    @staticmethod
+    def validate_many(
+        mnemonic_phrases: Iterable[str], language: str = "english"
+    ) -> List[bool]:
+        """
+        Validate a batch of mnemonic phrases, e.g. imported phrases.
+
+        :param mnemonic_phrases: Mnemonic phrases.
+        :param language: Wordlist language.
+        :return: True or False for each phrase, in order.
+        """
+        return get_wordlist(language).validate_many(mnemonic_phrases)
@@ -1,8 +1,9 @@
 import base64
 import json
 import random
+from concurrent.futures import Executor
 from decimal import Decimal
-from typing import Tuple, Callable, Optional, Union, Literal, Dict, Any
+from typing import Tuple, Callable, Optional, Union, Literal, Dict, Any, List
 
 import base58
 import eth_keyfile
@@ -21,12 +22,12 @@ import hashlib
 
 import eth_utils
 
-from pypergraph.core.constants import PKCS_PREFIX
+from pypergraph.core.dag_address import get_dag_address, derive_addresses
 from pypergraph.network.models.transaction import Transaction, TransactionReference
 from .kryo import Kryo
 from .bip_helpers.bip32_helper import Bip32Helper
 from .bip_helpers.bip39_helper import Bip39Helper
-from .utils import normalize_object, serialize_brotli
+from .utils import canonical_json, compress_brotli
 from .v3_keystore import V3KeystoreCrypto, V3Keystore
 from ..core.constants import BIP_44_PATHS, SECP256K1_ORDER
 
@@ -80,14 +81,18 @@ class KeyStore:
             salt=MIN_SALT + int(random.getrandbits(48)),
         )
 
-        # Get encoded transaction
-        encoded_tx = tx.encoded
+        return tx, KeyStore.get_transaction_hash(tx)
 
-        kryo = Kryo()
-        serialized_tx = kryo.serialize(msg=encoded_tx, set_references=False)
-        hash_value = hashlib.sha256(bytes.fromhex(serialized_tx)).hexdigest()
+    @staticmethod
+    def get_transaction_hash(tx: Transaction) -> str:
+        """
+        Compute the hash signed by the proofs of a currency transaction.
 
-        return tx, hash_value
+        :param tx: Transaction value.
+        :return: SHA-256 hash of the Kryo serialized transaction encoding, in hex.
+        """
+        serialized_tx = Kryo().serialize(msg=tx.encoded, set_references=False)
+        return hashlib.sha256(bytes.fromhex(serialized_tx)).hexdigest()
 
     def encode_data(
         self,
@@ -105,7 +110,6 @@ class KeyStore:
         :param encoding: Can be None (default), 'base64' or a custom encoding function.
         :return: Encoded data transaction.
         """
-        self._remove_nulls(msg)
         if encoding:
             if callable(encoding):
                 # Use custom encoding function
@@ -136,20 +140,6 @@ class KeyStore:
             return serialization(encoded_msg)
         return encoded_msg.encode("utf-8")
 
-    def _remove_nulls(self, obj):
-        def process_value(value):
-            if value is None:
-                return None
-            if isinstance(value, list):
-                return [process_value(v) for v in value if process_value(v) is not None]
-            if isinstance(value, dict):
-                return self._remove_nulls(value)
-            return value
-
-        return {
-            k: process_value(v) for k, v in obj.items() if process_value(v) is not None
-        }
-
     def data_sign(
         self,
         private_key,
@@ -248,8 +238,9 @@ class KeyStore:
         return self.sign(private_key, message)
 
     def brotli_sign(self, public_key: str, private_key: str, body: dict):
-        normalized_msg = normalize_object(body)
-        serialized_tx = serialize_brotli(body)
+        # Nulls removed and keys sorted once, for both the signed bytes and the returned value
+        normalized_msg, utf8_bytes = canonical_json(body)
+        serialized_tx = compress_brotli(utf8_bytes)
         msg_hash = hashlib.sha256(serialized_tx).hexdigest()
         signature = self.sign(private_key, msg_hash)
 
@@ -362,6 +353,16 @@ class KeyStore:
         """
         return Bip39Helper.validate_mnemonic(mnemonic_phrase=phrase)
 
+    @staticmethod
+    def validate_mnemonics(phrases: List[str]) -> List[bool]:
+        """
+        Validate a batch of phrases with the cached wordlist.
+
+        :param phrases: List of phrases.
+        :return: Boolean value for each phrase, in order.
+        """
+        return Bip39Helper.validate_many(mnemonic_phrases=phrases)
+
     @staticmethod
     def generate_mnemonic() -> str:
         """
@@ -515,27 +516,18 @@ class KeyStore:
         :param public_key: The private key as a hexadecimal string.
         :return: The DAG address corresponding to the public key (node ID).
         """
-        # TODO: Use utils.py
-        if len(public_key) == 128:
-            public_key = PKCS_PREFIX + "04" + public_key
-        elif len(public_key) == 130 and public_key[:2] == "04":
-            public_key = PKCS_PREFIX + public_key
-        else:
-            raise ValueError("KeyStore :: Not a valid public key.")
-
-        public_key = hashlib.sha256(bytes.fromhex(public_key)).hexdigest()
-        public_key = base58.b58encode(bytes.fromhex(public_key)).decode()
-        public_key = public_key[len(public_key) - 36 :]
+        return get_dag_address(public_key)
 
-        check_digits = "".join([char for char in public_key if char.isdigit()])
-        check_digit = 0
-        for n in check_digits:
-            check_digit += int(n)
-            if check_digit >= 9:
-                check_digit = check_digit % 9
-
-        address = f"DAG{check_digit}{public_key}"
-        return address
+    @staticmethod
+    def get_dag_addresses_from_public_keys(
+        public_keys: List[str], executor: Optional[Executor] = None
+    ) -> List[str]:
+        """
+        :param public_keys: List of public keys as hexadecimal strings.
+        :param executor: (Optional) Executor, e.g. ProcessPoolExecutor, deriving the addresses in parallel.
+        :return: The DAG addresses, in the order of public_keys.
+        """
+        return derive_addresses(public_keys, executor=executor)
 
     def get_dag_address_from_private_key(self, private_key: str):
         public_key = self.get_public_key_from_private(private_key=private_key)
@@ -0,0 +1,206 @@
+import hashlib
+from concurrent.futures import Executor
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+from pydantic import BaseModel
+
+from pypergraph.network.models.transaction import Transaction
+from .keystore import KeyStore
+from .utils import canonical_json
+
+# Fields of a currency transaction value, hashed with Kryo instead of JSON
+_TRANSACTION_FIELDS = {"source", "destination", "amount", "fee", "parent", "salt"}
+
+
+class ProofResult(BaseModel):
+    index: int  # Position of the signed object
+    proof_index: int  # Position of the proof in the object's proofs
+    id: str  # Node ID (public key without the 04 prefix)
+    hash: Optional[str] = None
+    valid: bool = False
+    error: Optional[str] = None
+
+
+@lru_cache(maxsize=4096)
+def load_public_key(node_id: str) -> ec.EllipticCurvePublicKey:
+    """
+    :param node_id: Uncompressed public key in hex, with or without the 04 prefix.
+    :return: Public key object, cached by node ID (per process).
+    """
+    public_key_bytes = bytes.fromhex(node_id)
+    if len(public_key_bytes) == 64:
+        public_key_bytes = b"\x04" + public_key_bytes
+    if len(public_key_bytes) != 65:
+        raise ValueError("Public key must be 64 bytes (uncompressed SECP256k1).")
+    return ec.EllipticCurvePublicKey.from_encoded_point(
+        ec.SECP256K1(), public_key_bytes
+    )
+
+
+def verify_proof(node_id: str, hash_: str, signature: str) -> bool:
+    """
+    Equivalent of KeyStore.verify() with a cached public key object.
+
+    :param node_id: Public key of the signer.
+    :param hash_: Signed hash in hex.
+    :param signature: DER signature in hex.
+    :return: True if the signature is valid.
+    """
+    digest = hashlib.sha512(hash_.encode("utf-8")).digest()[:32]
+    try:
+        load_public_key(node_id).verify(
+            bytes.fromhex(signature),
+            digest,
+            ec.ECDSA(Prehashed(hashes.SHA256())),
+        )
+        return True
+    except InvalidSignature:
+        return False
+
+
+def _verify_proofs(
+    items: List[Tuple[str, str, str]],
+) -> List[Tuple[bool, Optional[str]]]:
+    # (node_id, hash, signature) -> (valid, error), runs in the executor
+    results = []
+    for node_id, hash_, signature in items:
+        try:
+            results.append((verify_proof(node_id, hash_, signature), None))
+        except Exception as e:
+            results.append((False, str(e) or type(e).__name__))
+    return results
+
+
+def _as_dict(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True, mode="json")
+    return obj
+
+
+def get_signed_hash(value: Any) -> str:
+    """
+    Recompute the hash signed by the proofs of an object.
+
+    Currency transactions are hashed with Kryo (KeyStore.get_transaction_hash()). Other values, e.g. snapshots,
+    blocks and state channel snapshot binaries, are hashed as canonical JSON (nulls removed, keys sorted).
+    Models only hold the fields they declare, so pass the raw value from the API response to hash exactly
+    what was signed.
+
+    :param value: The 'value' of a signed object, as a model or dictionary.
+    :return: SHA-256 hash in hex.
+    """
+    if isinstance(value, Transaction):
+        return KeyStore.get_transaction_hash(value)
+    value = _as_dict(value)
+    if isinstance(value, dict) and _TRANSACTION_FIELDS <= value.keys():
+        return KeyStore.get_transaction_hash(Transaction(**value))
+    _, serialized = canonical_json(value)
+    return hashlib.sha256(serialized).hexdigest()
+
+
+def _get_value_and_proofs(signed: Any) -> Tuple[Any, List[Tuple[str, str]]]:
+    if isinstance(signed, dict):
+        value, proofs = signed.get("value"), signed.get("proofs")
+    else:
+        value, proofs = signed.value, signed.proofs
+    return value, [
+        (p["id"], p["signature"]) if isinstance(p, dict) else (p.id, p.signature)
+        for p in proofs or []
+    ]
+
+
+class ProofVerifier:
+    """
+    Verify the signature proofs of signed objects in bulk, e.g. SignedGlobalIncrementalSnapshot, SignedBlock,
+    SignedTransaction, SignedStateChannelSnapshotBinary or the raw {"value": ..., "proofs": [...]} responses.
+
+    The signed hash is computed once per object and the proofs are verified in chunks across an executor.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, chunk_size: int = 256):
+        """
+        :param executor: (Optional) ThreadPoolExecutor or ProcessPoolExecutor verifying chunks of proofs in parallel.
+            Default: Verify in the calling thread.
+        :param chunk_size: Number of proofs per executor task.
+        """
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    def verify(self, signed: Any, hash_: Optional[str] = None) -> List[ProofResult]:
+        """
+        :param signed: Signed object or dictionary with 'value' and 'proofs'.
+        :param hash_: (Optional) Known signed hash, e.g. from the block explorer. Default: Recompute the hash.
+        :return: Result per proof.
+        """
+        return self.verify_many([signed], None if hash_ is None else [hash_])
+
+    def verify_many(
+        self,
+        signed_objects: Iterable[Any],
+        hashes: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[ProofResult]:
+        """
+        :param signed_objects: Signed objects or dictionaries with 'value' and 'proofs'.
+        :param hashes: (Optional) Known signed hash per object, None entries are recomputed.
+        :return: Result per proof, in object and proof order.
+        """
+        signed_objects = list(signed_objects)
+        if hashes is not None and len(hashes) != len(signed_objects):
+            raise ValueError(
+                f"ProofVerifier :: Got {len(hashes)} hashes for {len(signed_objects)} signed objects."
+            )
+        results: List[ProofResult] = []
+        pending: List[ProofResult] = []
+        items: List[Tuple[str, str, str]] = []
+        for index, signed in enumerate(signed_objects):
+            value, proofs = _get_value_and_proofs(signed)
+            hash_, error = hashes[index] if hashes is not None else None, None
+            if hash_ is None:
+                try:
+                    if value is None:
+                        raise ValueError("The signed object has no value.")
+                    hash_ = get_signed_hash(value)
+                except Exception as e:
+                    error = f"Unable to compute the signed hash: {e}"
+            for proof_index, (node_id, signature) in enumerate(proofs):
+                result = ProofResult(
+                    index=index,
+                    proof_index=proof_index,
+                    id=node_id,
+                    hash=hash_,
+                    error=error,
+                )
+                results.append(result)
+                if error is None:
+                    pending.append(result)
+                    items.append((node_id, hash_, signature))
+
+        for result, (valid, error) in zip(pending, self._verify(items)):
+            result.valid, result.error = valid, error
+        return results
+
+    def _verify(
+        self, items: List[Tuple[str, str, str]]
+    ) -> List[Tuple[bool, Optional[str]]]:
+        if self.executor is None or len(items) <= self.chunk_size:
+            return _verify_proofs(items)
+        chunks = [
+            items[i : i + self.chunk_size]
+            for i in range(0, len(items), self.chunk_size)
+        ]
+        return list(chain.from_iterable(self.executor.map(_verify_proofs, chunks)))
+
+    @staticmethod
+    def all_valid(results: Iterable[ProofResult]) -> bool:
+        """
+        :param results: Results of verify() or verify_many().
+        :return: True if there is at least one result and every proof is valid.
+        """
+        results = list(results)
+        return bool(results) and all(result.valid for result in results)
@@ -0,0 +1,308 @@
+import asyncio
+import json
+import logging
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+from .keystore import KeyStore
+from .signing_worker import handle_requests, init_worker
+
+logger = logging.getLogger(__name__)
+
+# Frame: 4 byte big-endian length followed by compact JSON
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[Any]:
+    """
+    :param reader: Stream reader.
+    :return: Decoded frame or None if the connection was closed.
+    """
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"Signer :: Frame of {size} bytes exceeds the maximum size.")
+    return json.loads(await reader.readexactly(size))
+
+
+def write_frame(writer: asyncio.StreamWriter, data: Any):
+    payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    writer.write(FRAME_HEADER.pack(len(payload)) + payload)
+
+
+class SigningDaemon:
+    """
+    Serve signatures over a Unix socket, the private keys only live in the daemon and its workers.
+
+    Requests are batches of operations, answered in order:
+    {"requests": [{"op": "sign", "address": address, "msg": hash}, ...]} -> {"results": [{"signature": ...}, ...]}
+    Operations: "sign", "data_sign" (msg, prefix, encoding), "brotli_sign" (body) and "public_key".
+    Failed operations return {"error": message}.
+    """
+
+    def __init__(
+        self,
+        private_keys: List[str],
+        socket_path: str,
+        workers: Optional[int] = None,
+        chunk_size: int = 64,
+    ):
+        """
+        :param private_keys: Private keys to serve, in hexadecimal format.
+        :param socket_path: Path of the Unix socket, only accessible by the owner.
+        :param workers: (Optional) Number of signing worker processes, 0 to sign in the daemon's event loop.
+            Default: One per CPU.
+        :param chunk_size: Number of operations per worker task.
+        """
+        self.socket_path = socket_path
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._keys: Dict[str, Dict[str, str]] = {}
+        for private_key in private_keys:
+            public_key = KeyStore.get_public_key_from_private(private_key)
+            self._keys[KeyStore.get_dag_address_from_public_key(public_key)] = {
+                "private_key": private_key,
+                "public_key": public_key,
+            }
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @classmethod
+    def from_keyring(
+        cls, key_manager, socket_path: str, workers: Optional[int] = None
+    ) -> "SigningDaemon":
+        """
+        Serve the Constellation accounts of an unlocked KeyringManager.
+
+        :param key_manager: Unlocked KeyringManager.
+        :param socket_path: Path of the Unix socket.
+        :param workers: (Optional) Number of signing worker processes.
+        :return: SigningDaemon, use start() to serve.
+        """
+        if not key_manager.is_unlocked():
+            raise ValueError("SigningDaemon :: The keyring is locked.")
+        private_keys = [
+            account.get_private_key()
+            for account in key_manager.get_accounts()
+            if account.get_network_id() == "Constellation"
+        ]
+        return cls(private_keys, socket_path, workers=workers)
+
+    @property
+    def addresses(self) -> List[str]:
+        return list(self._keys)
+
+    async def start(self):
+        """Start serving on the Unix socket."""
+        if self.workers != 0 and self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=init_worker,
+                initargs=(self._keys,),
+            )
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=self.socket_path
+        )
+        os.chmod(self.socket_path, 0o600)
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop serving and shut down the signing workers."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        try:
+            while True:
+                frame = await read_frame(reader)
+                if frame is None:
+                    break
+                results = await self.handle(frame.get("requests", []))
+                write_frame(writer, {"id": frame.get("id"), "results": results})
+                await writer.drain()
+        except Exception as e:
+            logger.error(f"SigningDaemon :: {e}", exc_info=True)
+        finally:
+            writer.close()
+
+    async def handle(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        :param requests: Batch of operations.
+        :return: Results, in the order of requests.
+        """
+        if self._executor is None:
+            return handle_requests(requests, self._keys)
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    self._executor,
+                    handle_requests,
+                    requests[i : i + self.chunk_size],
+                )
+                for i in range(0, len(requests), self.chunk_size)
+            ]
+        )
+        return [result for chunk in chunks for result in chunk]
+
+
+class Signer:
+    """Client of a SigningDaemon, e.g. for DagAccount.login_with_signer()."""
+
+    def __init__(self, socket_path: str):
+        """
+        :param socket_path: Path of the daemon's Unix socket.
+        """
+        self.socket_path = socket_path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        # Created on first use, so the Signer can be built outside the loop it's used in
+        self._lock: Optional[asyncio.Lock] = None
+        self._request_id = 0
+
+    async def request(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send a batch of operations.
+
+        :param requests: E.g. [{"op": "sign", "address": address, "msg": hash}, ...]
+        :return: Results in the order of requests, failed operations return {"error": message}.
+        """
+        async with self._get_lock():
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_unix_connection(
+                    self.socket_path
+                )
+            self._request_id += 1
+            try:
+                write_frame(
+                    self._writer, {"id": self._request_id, "requests": requests}
+                )
+                await self._writer.drain()
+                response = await read_frame(self._reader)
+            except Exception:
+                await self.close()
+                raise
+            if response is None:
+                await self.close()
+                raise ValueError("Signer :: The signing daemon closed the connection.")
+        return response["results"]
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _request_one(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        (result,) = await self.request([request])
+        if "error" in result:
+            raise ValueError(f"Signer :: {result['error']}")
+        return result
+
+    async def get_public_key(self, address: str) -> str:
+        """
+        :param address: DAG address served by the daemon.
+        :return: Public key in hexadecimal format, with the 04 prefix.
+        """
+        result = await self._request_one({"op": "public_key", "address": address})
+        return result["public_key"]
+
+    async def sign(self, address: str, msg: str) -> str:
+        """
+        Equivalent of KeyStore.sign() with the key of the address.
+
+        :param address: DAG address served by the daemon.
+        :param msg: Message, e.g. transaction hash.
+        :return: Canonical DER signature in hex.
+        """
+        result = await self._request_one({"op": "sign", "address": address, "msg": msg})
+        return result["signature"]
+
+    async def sign_many(self, address: str, msgs: List[str]) -> List[str]:
+        """
+        Sign several messages in one request.
+
+        :param address: DAG address served by the daemon.
+        :param msgs: Messages, e.g. transaction hashes.
+        :return: Signatures, in the order of msgs.
+        """
+        results = await self.request(
+            [{"op": "sign", "address": address, "msg": msg} for msg in msgs]
+        )
+        for result in results:
+            if "error" in result:
+                raise ValueError(f"Signer :: {result['error']}")
+        return [result["signature"] for result in results]
+
+    async def data_sign(
+        self,
+        address: str,
+        msg: Union[dict, str],
+        prefix: Union[bool, str] = True,
+        encoding: Optional[str] = None,
+    ):
+        """
+        Equivalent of KeyStore.data_sign(), custom encoding functions are not supported.
+
+        :return: signature, transaction hash.
+        """
+        if callable(encoding):
+            raise ValueError("Signer :: Custom encoding functions are not supported.")
+        result = await self._request_one(
+            {
+                "op": "data_sign",
+                "address": address,
+                "msg": msg,
+                "prefix": prefix,
+                "encoding": encoding,
+            }
+        )
+        return result["signature"], result["hash"]
+
+    async def brotli_sign(self, address: str, body: dict) -> Dict[str, Any]:
+        """
+        Equivalent of KeyStore.brotli_sign().
+
+        :return: Dictionary with the normalized value and proofs.
+        """
+        return await self._request_one(
+            {"op": "brotli_sign", "address": address, "body": body}
+        )
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._reader, self._writer = None, None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
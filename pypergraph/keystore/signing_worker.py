@@ -0,0 +1,63 @@
+from typing import Any, Dict, List, Optional
+
+from .keystore import KeyStore
+
+# Keys of a signing worker process, set by the pool initializer
+_worker_keys: Dict[str, Dict[str, str]] = {}
+
+
+def init_worker(keys: Dict[str, Dict[str, str]]):
+    """
+    Process pool initializer, keeps the keys in the worker so they aren't sent with every batch.
+
+    :param keys: Address mapped to {"private_key": ..., "public_key": ...}.
+    """
+    global _worker_keys
+    _worker_keys = keys
+
+
+def handle_requests(
+    requests: List[Dict[str, Any]], keys: Optional[Dict[str, Dict[str, str]]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Sign a batch of operations, in a signing worker or in the calling process.
+
+    :param requests: E.g. [{"op": "sign", "address": address, "msg": hash}, ...]
+    :param keys: Keys to sign with, defaults to the keys set by init_worker().
+    :return: Results in the order of requests, failed operations return {"error": message}.
+    """
+    keys = _worker_keys if keys is None else keys
+    keystore = KeyStore()
+    results = []
+    for request in requests:
+        try:
+            op = request.get("op")
+            key = keys.get(request.get("address"))
+            if key is None:
+                raise ValueError("No key for the address.")
+            if op == "sign":
+                result = {
+                    "signature": keystore.sign(key["private_key"], request["msg"])
+                }
+            elif op == "data_sign":
+                signature, hash_ = keystore.data_sign(
+                    key["private_key"],
+                    request["msg"],
+                    prefix=request.get("prefix", True),
+                    encoding=request.get("encoding"),
+                )
+                result = {"signature": signature, "hash": hash_}
+            elif op == "brotli_sign":
+                result = keystore.brotli_sign(
+                    public_key=key["public_key"][2:],
+                    private_key=key["private_key"],
+                    body=request["body"],
+                )
+            elif op == "public_key":
+                result = {"public_key": key["public_key"]}
+            else:
+                raise ValueError(f"Unsupported operation: {op}")
+        except Exception as e:
+            result = {"error": str(e) or type(e).__name__}
+        results.append(result)
+    return results
@@ -1,11 +1,16 @@
 import asyncio
+import hashlib
 import json
+from concurrent.futures import ProcessPoolExecutor
+
+import base58
 
 import pytest
 from httpx import ReadTimeout
 
 from pypergraph import DagTokenNetwork
 from pypergraph.core import BIP_44_PATHS
+from pypergraph.core.constants import PKCS_PREFIX
 from pypergraph.keystore.keystore import KeyStore
 
 
@@ -140,6 +145,27 @@ class TestKeystore:
         eth_address = keystore.get_eth_address_from_private_key(eth_private_key)
         assert eth_address == "0x8fbc948ba2dd081a51036de02582f5dcb51a310c"
 
+    def test_get_dag_addresses_from_public_keys(self):
+        def reference_address(public_key: str) -> str:
+            digest = hashlib.sha256(bytes.fromhex(PKCS_PREFIX + public_key)).digest()
+            encoded = base58.b58encode(digest).decode()[-36:]
+            return f"DAG{sum(int(c) for c in encoded if c.isdigit()) % 9}{encoded}"
+
+        keystore = KeyStore()
+        public_keys = [
+            keystore.get_public_key_from_private(keystore.generate_private_key())
+            for _ in range(200)
+        ]
+        expected = [reference_address(public_key) for public_key in public_keys]
+        assert [
+            keystore.get_dag_address_from_public_key(pk[2:]) for pk in public_keys
+        ] == expected
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            assert (
+                keystore.get_dag_addresses_from_public_keys(public_keys, executor)
+                == expected
+            )
+
     @pytest.mark.asyncio
     async def test_generate_transaction_and_verify_signature(self, i: int = 1):
         keystore = KeyStore()
@@ -207,3 +233,118 @@ class TestKeystore:
 
         encoded_msg = encode(water_and_energy_usage)
         assert KeyStore().verify_data(pubk, encoded_msg, signature)
+
+    @pytest.mark.parametrize("accelerated", [True, False])
+    def test_canonical_json(self, monkeypatch, accelerated):
+        from pypergraph.keystore import utils
+
+        def reference(obj):
+            # Former remove_nulls() followed by sort_object_keys()
+            if isinstance(obj, list):
+                return [reference(item) for item in obj if item is not None]
+            if isinstance(obj, dict):
+                return {
+                    key: reference(obj[key])
+                    for key in sorted(obj)
+                    if obj[key] is not None
+                }
+            return obj
+
+        if not accelerated:
+            monkeypatch.setattr(utils, "orjson", None)
+        leaf = "\u00e6\u00f8\u00e5 \u2028 \x1f"
+        nested = {"leaf": leaf, "none": None}
+        for depth in range(30):
+            nested = {"z": [nested, None, depth], "a": None, "m": {"n": leaf}}
+        samples = [
+            nested,
+            {"b": 1.5, "a": [1e16, 2**70, -(2**63)], "c": {"y": None, "x": True}},
+            {"source": "DAG...", "amount": 1, "parent": {"ordinal": 0, "hash": ""}},
+        ]
+        for sample in samples:
+            normalized, serialized = utils.canonical_json(sample)
+            assert normalized == reference(sample)
+            assert list(normalized) == sorted(normalized)
+            assert serialized == json.dumps(
+                reference(sample), separators=(",", ":"), ensure_ascii=False
+            ).encode("utf-8")
+            assert utils.serialize_brotli(sample) == utils.compress_brotli(serialized)
+
+    def test_proof_verifier(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from pypergraph.keystore import ProofVerifier
+        from pypergraph.keystore.proof_verifier import get_signed_hash, load_public_key
+        from pypergraph.network.models.transaction import (
+            SignatureProof,
+            SignedTransaction,
+            TransactionReference,
+        )
+
+        keystore = KeyStore()
+        keys = [keystore.generate_private_key() for _ in range(3)]
+        node_ids = [keystore.get_public_key_from_private(pk)[2:] for pk in keys]
+        from_address = keystore.get_dag_address_from_public_key(node_ids[0])
+        to_address = keystore.get_dag_address_from_public_key(node_ids[1])
+
+        transactions = []
+        for i in range(3):
+            tx, hash_ = keystore.prepare_tx(
+                amount=i + 1,
+                to_address=to_address,
+                from_address=from_address,
+                last_ref=TransactionReference(ordinal=i, hash="0" * 64),
+            )
+            assert get_signed_hash(tx) == get_signed_hash(tx.model_dump()) == hash_
+            proof = SignatureProof(
+                id=node_ids[0], signature=keystore.sign(keys[0], hash_)
+            )
+            transactions.append(SignedTransaction(value=tx, proofs=[proof]))
+        # Tampered amount
+        transactions[2].value.amount += 1
+
+        # Snapshot-like response signed by every facilitator, hashed as canonical JSON
+        value = {"ordinal": 7, "lastSnapshotHash": "a" * 64, "optional": None}
+        hash_ = hashlib.sha256(b'{"lastSnapshotHash":"' + b"a" * 64 + b'","ordinal":7}')
+        snapshot = {
+            "value": value,
+            "proofs": [
+                {"id": node_id, "signature": keystore.sign(pk, hash_.hexdigest())}
+                for pk, node_id in zip(keys, node_ids)
+            ]
+            + [
+                # Malformed signature, public key not on the curve
+                {"id": node_ids[0], "signature": "00"},
+                {
+                    "id": "11" * 64,
+                    "signature": keystore.sign(keys[0], hash_.hexdigest()),
+                },
+            ],
+        }
+
+        load_public_key.cache_clear()
+        signed = [*transactions, snapshot]
+        expected = [True, True, False, True, True, True, False, False]
+        for executor in (None, ThreadPoolExecutor(2), ProcessPoolExecutor(2)):
+            results = ProofVerifier(executor=executor, chunk_size=2).verify_many(signed)
+            assert [r.valid for r in results] == expected
+            assert [(r.index, r.proof_index) for r in results][-2:] == [(3, 3), (3, 4)]
+            assert results[-2].error is None and results[-1].error
+            assert results[3].hash == hash_.hexdigest()
+            if executor:
+                executor.shutdown()
+        # One public key object per node ID in this process
+        assert load_public_key.cache_info().currsize == 3
+
+        verifier = ProofVerifier()
+        assert verifier.all_valid(verifier.verify(transactions[0]))
+        assert not verifier.all_valid(verifier.verify(transactions[0], hash_="0" * 64))
+        assert verifier.verify({"value": None, "proofs": snapshot["proofs"][:1]})[
+            0
+        ].error
+        # Known hashes line up with the objects, one per object
+        results = verifier.verify_many(transactions[:2], hashes=[None, "0" * 64])
+        assert [r.valid for r in results] == [True, False]
+        for hashes in ([], [None]):
+            with pytest.raises(ValueError):
+                verifier.verify_many(transactions[:2], hashes=hashes)
@@ -1,44 +1,84 @@
 import json
+from typing import Any, Tuple
+
 import brotli
 
+try:
+    # Optional accelerated backend, see canonical_json()
+    import orjson
+except ImportError:
+    orjson = None
 
-def remove_nulls(obj):
-    if obj is None:
-        return None
-    if isinstance(obj, list):
-        # Process list items and filter out None values
-        return [remove_nulls(item) for item in obj if remove_nulls(item) is not None]
-    if isinstance(obj, dict):
-        # Process dictionary values and remove keys with None values
-        return {
-            key: remove_nulls(value)
-            for key, value in obj.items()
-            if remove_nulls(value) is not None
-        }
-    return obj
+# Integers orjson serializes natively
+_ORJSON_MIN_INT = -(2**63)
+_ORJSON_MAX_INT = 2**64 - 1
 
 
-def sort_object_keys(obj):
+def _normalize(obj, sort: bool, remove: bool, exact: list):
+    # One traversal removing nulls and sorting keys. exact[0] is set when the result holds values orjson would
+    # serialize differently from json.dumps (floats, large integers, non-string keys, custom types)
     if isinstance(obj, dict):
-        # Sort keys and recursively process values
-        return {key: sort_object_keys(obj[key]) for key in sorted(obj)}
+        result = {}
+        for key in sorted(obj) if sort else obj:
+            value = obj[key]
+            if value is None and remove:
+                continue
+            if type(key) is not str:
+                exact[0] = True
+            result[key] = _normalize(value, sort, remove, exact)
+        return result
     if isinstance(obj, list):
-        # Recursively process list items
-        return [sort_object_keys(item) for item in obj]
+        return [
+            _normalize(item, sort, remove, exact)
+            for item in obj
+            if item is not None or not remove
+        ]
+    kind = type(obj)
+    if kind is int:
+        if not _ORJSON_MIN_INT <= obj <= _ORJSON_MAX_INT:
+            exact[0] = True
+    elif kind is not str and kind is not bool and obj is not None:
+        exact[0] = True
     return obj
 
 
+def remove_nulls(obj):
+    return normalize_object(obj, sort=False)
+
+
+def sort_object_keys(obj):
+    return normalize_object(obj, remove=False)
+
+
 def normalize_object(obj, sort=True, remove=True):
-    processed = obj
-    if remove:
-        processed = remove_nulls(processed)
-    if sort:
-        processed = sort_object_keys(processed)
-    return processed
+    return _normalize(obj, sort, remove, [False])
 
 
-def serialize_brotli(content, compression_level=2):
-    normalized = normalize_object(content)
-    normalized_json = json.dumps(normalized, separators=(",", ":"), ensure_ascii=False)
-    utf8_bytes = normalized_json.encode("utf-8")
+def canonical_json(obj: Any, sort=True, remove=True) -> Tuple[Any, bytes]:
+    """
+    Remove nulls, sort keys and serialize to compact UTF-8 JSON in a single traversal.
+
+    Uses orjson when installed and the output is identical to
+    json.dumps(normalized, separators=(",", ":"), ensure_ascii=False).
+
+    :param obj: Dictionary, list or JSON value.
+    :param sort: Sort dictionary keys.
+    :param remove: Remove None values from dictionaries and lists.
+    :return: Normalized object, JSON bytes.
+    """
+    exact = [False]
+    normalized = _normalize(obj, sort, remove, exact)
+    if orjson is not None and not exact[0]:
+        return normalized, orjson.dumps(normalized)
+    return normalized, json.dumps(
+        normalized, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def compress_brotli(utf8_bytes: bytes, compression_level=2) -> bytes:
     return brotli.compress(utf8_bytes, quality=compression_level)
+
+
+def serialize_brotli(content, compression_level=2):
+    _, utf8_bytes = canonical_json(content)
+    return compress_brotli(utf8_bytes, compression_level)
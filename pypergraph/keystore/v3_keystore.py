@@ -12,7 +12,7 @@ from concurrent.futures import ThreadPoolExecutor
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
-from mnemonic import Mnemonic
+from pypergraph.core.bip39_wordlist import get_wordlist
 
 _executor = ThreadPoolExecutor(max_workers=4)  # Adjust as needed
 
@@ -82,8 +82,7 @@ class V3KeystoreCrypto:
             raise TypeError(
                 "V3KeystoreCrypto :: Both phrase and password must be strings."
             )
-        mnemo = Mnemonic("english")
-        if not mnemo.check(phrase):
+        if not get_wordlist("english").is_valid(phrase):
             raise TypeError("V3KeystoreCrypto :: Invalid BIP39 phrase.")
 
         keystore_id = str(uuid.uuid4())
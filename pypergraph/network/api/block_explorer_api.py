@@ -56,16 +56,27 @@ class BlockExplorerApi:
         return Snapshot(**result["data"])
 
     async def get_transactions_by_snapshot(
-        self, id: Union[str, int]
+        self,
+        id: Union[str, int],
+        limit: int = 0,
+        search_after: str = "",
+        search_before: str = "",
     ) -> List[Transaction]:
         """
-        Retrieve transactions for a given snapshot.
+        Retrieve transactions for a given snapshot. Supports pagination.
 
         :param id: Hash or ordinal identifier.
+        :param limit: Maximum number of transactions.
+        :param search_after: Pagination parameter.
+        :param search_before: Pagination parameter.
         :return: List of Transaction objects.
         """
+        base_path = f"/global-snapshots/{id}/transactions"
+        request = self._get_transaction_search_path_and_params(
+            base_path, limit, search_after, False, False, search_before
+        )
         results = await self._make_request(
-            "GET", f"/global-snapshots/{id}/transactions"
+            "GET", request["path"], params=request["params"]
         )
         return Transaction.process_transactions(
             data=results["data"],
@@ -312,4 +323,7 @@ class BlockExplorerApi:
         results = await self._make_request(
             "GET", request["path"], params=request["params"]
         )
-        return Transaction.process_transactions(results["data"])
+        return Transaction.process_transactions(
+            data=results["data"],
+            meta=results.get("meta"),
+        )
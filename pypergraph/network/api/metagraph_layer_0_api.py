@@ -2,7 +2,7 @@ from typing import Optional
 
 from pypergraph.core.cross_platform.di.rest_client import RESTClient
 from pypergraph.network.api.layer_0_api import L0Api
-from pypergraph.network.models.network import TotalSupply
+from pypergraph.network.models.network import Ordinal, TotalSupply
 from pypergraph.network.models.account import Balance
 
 
@@ -12,6 +12,10 @@ class ML0Api(L0Api):
     ):
         super().__init__(host=host, client=client, timeout=timeout)
 
+    async def get_latest_snapshot_ordinal(self) -> Ordinal:
+        result = await self._make_request("GET", "/snapshots/latest/ordinal")
+        return Ordinal(**result)
+
     async def get_total_supply(self) -> TotalSupply:
         result = await self._make_request("GET", "/currency/total-supply")
         return TotalSupply(**result)
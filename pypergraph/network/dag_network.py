@@ -1,4 +1,4 @@
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union
 
 from rx.subject import BehaviorSubject
 
@@ -195,6 +195,33 @@ class DagTokenNetwork:
         response = await self.be_api.get_latest_snapshot()
         return response
 
+    async def get_transactions_by_snapshot(
+        self, ordinal: Union[int, str]
+    ) -> List[Transaction]:
+        """
+        Get all transactions included in a global snapshot, following the block explorer pagination.
+
+        :param ordinal: Snapshot ordinal or hash.
+        :return: List of BlockExplorerTransaction objects.
+        """
+        transactions = []
+        search_after = ""
+        while True:
+            try:
+                page = await self.be_api.get_transactions_by_snapshot(
+                    ordinal, search_after=search_after
+                )
+            except NetworkError as e:
+                # The block explorer responds 404 for snapshots without transactions
+                if e.status == 404:
+                    logger.debug(f"DagTokenNetwork :: No transactions in {ordinal}.")
+                    return transactions
+                raise e
+            transactions.extend(page)
+            search_after = (page[-1].meta or {}).get("next") if page else None
+            if not search_after:
+                return transactions
+
     async def post_delegate_stake(self, tx: dict) -> str:
         """
         Delegate stake on L0.
@@ -1,6 +1,8 @@
-from typing import Optional, Dict, List
+import asyncio
+from typing import Optional, Dict, List, Union
 
 from pypergraph.core.cross_platform.di.rest_client import RESTClient
+from pypergraph.core.exceptions import NetworkError
 from pypergraph.network.models.account import Balance
 from pypergraph.network.models.transaction import TransactionReference
 from pypergraph.network.api import MetagraphLayer0Api
@@ -13,6 +15,10 @@ from pypergraph.network.models.transaction import (
 )
 from pypergraph.network.models.network import NetworkInfo
 from pypergraph.network.models.block_explorer import Transaction
+from pypergraph.network.shared.balance_cache import (
+    BalanceSnapshot,
+    OrdinalBalanceCache,
+)
 import logging
 
 # Get a logger for this specific module
@@ -69,6 +75,9 @@ class MetagraphTokenNetwork:
             if data_l1_host
             else None
         )  # Data layer
+        self.balance_cache = OrdinalBalanceCache()
+        # Latest snapshot ordinal seen, 404s at or below it mean no balance rather than no snapshot yet
+        self._latest_ordinal: Optional[int] = None
 
     def get_network(self) -> Dict:
         """
@@ -90,6 +99,81 @@ class MetagraphTokenNetwork:
         except AttributeError:
             logging.warning("MetagraphTokenNetwork :: Layer 0 API object not set.")
 
+    async def get_latest_ordinal(self) -> int:
+        """
+        Get the ordinal of the latest Metagraph snapshot, e.g. to pin balance queries.
+
+        :return: Snapshot ordinal.
+        """
+        if self.l0_api is None:
+            raise ValueError("MetagraphTokenNetwork :: Layer 0 API object not set.")
+        latest = await self.l0_api.get_latest_snapshot_ordinal()
+        if self._latest_ordinal is None or latest.ordinal > self._latest_ordinal:
+            self._latest_ordinal = latest.ordinal
+        return latest.ordinal
+
+    async def get_address_balance_at_ordinal(
+        self, ordinal: int, address: str
+    ) -> Balance:
+        """
+        Get the balance of a DAG address at a snapshot ordinal. Results are cached in balance_cache, ordinals past
+        the latest snapshot ordinal raise ValueError.
+
+        :param ordinal: Snapshot ordinal.
+        :param address: DAG address.
+        :return: Balance object, balance 0 if the address held no balance at the ordinal.
+        """
+        if self.l0_api is None:
+            raise ValueError("MetagraphTokenNetwork :: Layer 0 API object not set.")
+        balance = self.balance_cache.get(ordinal, address)
+        if balance is None:
+            try:
+                balance = await self.l0_api.get_address_balance_at_ordinal(
+                    ordinal, address
+                )
+            except NetworkError as e:
+                if e.status != 404:
+                    raise
+                # Metagraph layer 0 responds 404 for addresses without balance, and for ordinals it doesn't have
+                if self._latest_ordinal is None or ordinal > self._latest_ordinal:
+                    await self.get_latest_ordinal()
+                if ordinal > self._latest_ordinal:
+                    raise ValueError(
+                        f"MetagraphTokenNetwork :: Snapshot ordinal {ordinal} doesn't exist yet, "
+                        f"the latest is {self._latest_ordinal}."
+                    )
+                balance = Balance(ordinal=ordinal, balance=0)
+            balance = balance.model_copy(update={"address": address})
+            self.balance_cache.set(ordinal, address, balance)
+        return balance
+
+    async def get_balances_at_ordinal(
+        self,
+        addresses: List[str],
+        ordinal: Optional[int] = None,
+        max_concurrent: int = 16,
+    ) -> BalanceSnapshot:
+        """
+        Get the balances of many DAG addresses at the same snapshot ordinal, for consistent cut-offs.
+
+        :param addresses: DAG addresses.
+        :param ordinal: (Optional) Snapshot ordinal. Default: Pin the latest snapshot ordinal.
+        :param max_concurrent: Maximum number of concurrent balance requests.
+        :return: BalanceSnapshot with the ordinal and the balance per address.
+        """
+        if ordinal is None:
+            ordinal = await self.get_latest_ordinal()
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def get_balance(address: str) -> int:
+            async with semaphore:
+                balance = await self.get_address_balance_at_ordinal(ordinal, address)
+                return balance.balance
+
+        addresses = list(dict.fromkeys(addresses))
+        balances = await asyncio.gather(*[get_balance(a) for a in addresses])
+        return BalanceSnapshot(ordinal=ordinal, balances=dict(zip(addresses, balances)))
+
     async def get_address_last_accepted_transaction_ref(
         self, address: str
     ) -> TransactionReference:
@@ -236,3 +320,34 @@ class MetagraphTokenNetwork:
             self.connected_network.metagraph_id
         )
         return response
+
+    async def get_transactions_by_snapshot(
+        self, ordinal: Union[int, str]
+    ) -> List[Transaction]:
+        """
+        Get all transactions included in a Metagraph currency snapshot, following the block explorer pagination.
+
+        :param ordinal: Snapshot ordinal or hash.
+        :return: List of BlockExplorerTransaction objects.
+        """
+        transactions = []
+        search_after = ""
+        while True:
+            try:
+                page = await self.be_api.get_currency_transactions_by_snapshot(
+                    self.connected_network.metagraph_id,
+                    ordinal,
+                    search_after=search_after,
+                )
+            except NetworkError as e:
+                # The block explorer responds 404 for snapshots without transactions
+                if e.status == 404:
+                    logger.debug(
+                        f"MetagraphTokenNetwork :: No transactions in {ordinal}."
+                    )
+                    return transactions
+                raise e
+            transactions.extend(page)
+            search_after = (page[-1].meta or {}).get("next") if page else None
+            if not search_after:
+                return transactions
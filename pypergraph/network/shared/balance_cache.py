@@ -0,0 +1,49 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from pypergraph.network.models.account import Balance
+
+
+class BalanceSnapshot(BaseModel):
+    ordinal: int = Field(ge=0)  # Snapshot ordinal all balances were read at
+    balances: Dict[str, int] = Field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.balances.values())
+
+
+class OrdinalBalanceCache:
+    """
+    Balances at a snapshot ordinal never change once the snapshot exists. Kept per network instance, keyed by
+    (ordinal, address), least recently used balances are dropped beyond max_entries.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """
+        :param max_entries: Maximum number of balances kept.
+        """
+        if max_entries < 1:
+            raise ValueError("OrdinalBalanceCache :: max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self._balances: Dict[Tuple[int, str], Balance] = OrderedDict()
+
+    def get(self, ordinal: int, address: str) -> Optional[Balance]:
+        balance = self._balances.get((ordinal, address))
+        if balance is not None:
+            self._balances.move_to_end((ordinal, address))
+        return balance
+
+    def set(self, ordinal: int, address: str, balance: Balance):
+        self._balances[(ordinal, address)] = balance
+        self._balances.move_to_end((ordinal, address))
+        while len(self._balances) > self.max_entries:
+            self._balances.popitem(last=False)
+
+    def clear(self):
+        self._balances.clear()
+
+    def __len__(self) -> int:
+        return len(self._balances)
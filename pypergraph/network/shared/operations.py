@@ -16,6 +16,7 @@ async def allow_spend(
     fee: int = 0,
     currency_id: Optional[str] = None,
     valid_until_epoch: Optional[int] = None,
+    signer: Any = None,  # Signer, signs with the key held by a SigningDaemon
 ):
     from pypergraph import KeyStore
 
@@ -42,11 +43,16 @@ async def allow_spend(
             currency=currency_id or None,
         )
         # Generate signature
-        signed_allow_spend = KeyStore().brotli_sign(
-            body=body.model_dump(),
-            public_key=normalize_public_key(key_trio.public_key),
-            private_key=key_trio.private_key,
-        )
+        if signer is not None:
+            signed_allow_spend = await signer.brotli_sign(
+                address=key_trio.address, body=body.model_dump()
+            )
+        else:
+            signed_allow_spend = KeyStore().brotli_sign(
+                body=body.model_dump(),
+                public_key=normalize_public_key(key_trio.public_key),
+                private_key=key_trio.private_key,
+            )
         if not signed_allow_spend:
             raise ValueError("Unable to generate signed allow spend")
 
@@ -78,6 +84,7 @@ async def token_lock(
     unlock_epoch: Optional[int],
     network: Any,  # Should be a shared abstract class DagTokenNetwork, MetagraphTokenNetwork
     key_trio: KeyTrio,
+    signer: Any = None,  # Signer, signs with the key held by a SigningDaemon
 ):
     from pypergraph import KeyStore
     # Validate schema
@@ -103,11 +110,16 @@ async def token_lock(
         )
 
         # Generate signature
-        signed_token_lock = KeyStore().brotli_sign(
-            body=body.model_dump(),
-            public_key=normalize_public_key(key_trio.public_key),
-            private_key=key_trio.private_key,
-        )
+        if signer is not None:
+            signed_token_lock = await signer.brotli_sign(
+                address=key_trio.address, body=body.model_dump()
+            )
+        else:
+            signed_token_lock = KeyStore().brotli_sign(
+                body=body.model_dump(),
+                public_key=normalize_public_key(key_trio.public_key),
+                private_key=key_trio.private_key,
+            )
         if not signed_token_lock:
             raise ValueError("Unable to generate signed token lock")
 
@@ -3725,6 +3725,71 @@ class TestMockedL0API:
         result = await network.l0_api.get_latest_snapshot_ordinal()
         assert result.model_dump() == {"ordinal": 3382271}
 
+    @pytest.mark.asyncio
+    async def test_get_metagraph_balances_at_ordinal(self, httpx_mock: HTTPXMock):
+        from pypergraph.network import MetagraphTokenNetwork
+        from pypergraph.network.models.account import Balance
+        from pypergraph.network.shared.balance_cache import OrdinalBalanceCache
+
+        network = MetagraphTokenNetwork(
+            metagraph_id="DAG7ChnhUF7uKgn8tXy45aj4zn9AFuhaZr8VXY43",
+            l0_host="http://localhost:9200",
+        )
+        funded = "DAG0zJW14beJtZX2BY2KA9gLbpaZ8x6vgX4KVPVX"
+        empty = "DAG5WLxvp7hQgumY7qEFqWZ9yuRghSNzLddLbxDN"
+        httpx_mock.add_response(
+            url="http://localhost:9200/snapshots/latest/ordinal",
+            json={"value": 1200},
+        )
+        httpx_mock.add_response(
+            url=f"http://localhost:9200/currency/1200/{funded}/balance",
+            json={"ordinal": 1200, "balance": 5699930},
+        )
+        httpx_mock.add_response(
+            url=f"http://localhost:9200/currency/1200/{empty}/balance",
+            status_code=404,
+        )
+
+        snapshot = await network.get_balances_at_ordinal([funded, empty, funded])
+        assert snapshot.ordinal == 1200
+        assert snapshot.balances == {funded: 5699930, empty: 0}
+        assert snapshot.total == 5699930
+
+        # Balances at an ordinal are immutable, repeat queries don't hit the network
+        snapshot = await network.get_balances_at_ordinal([empty, funded], ordinal=1200)
+        assert snapshot.balances == {empty: 0, funded: 5699930}
+        balance = await network.get_address_balance_at_ordinal(1200, funded)
+        assert balance.address == funded
+        assert len(httpx_mock.get_requests()) == 3
+        assert len(network.balance_cache) == 2
+
+        # Layer 0 also responds 404 for ordinals past the latest snapshot
+        httpx_mock.add_response(
+            url=f"http://localhost:9200/currency/1300/{empty}/balance",
+            status_code=404,
+        )
+        httpx_mock.add_response(
+            url="http://localhost:9200/snapshots/latest/ordinal",
+            json={"value": 1250},
+        )
+        with pytest.raises(ValueError):
+            await network.get_address_balance_at_ordinal(1300, empty)
+        # A 404 at or below the latest ordinal is a missing balance
+        httpx_mock.add_response(
+            url=f"http://localhost:9200/currency/1250/{empty}/balance",
+            status_code=404,
+        )
+        balance = await network.get_address_balance_at_ordinal(1250, empty)
+        assert balance.balance == 0 and balance.address == empty
+        assert len(httpx_mock.get_requests()) == 6
+        assert len(network.balance_cache) == 3
+
+        # Least recently used balances are dropped beyond max_entries
+        cache = OrdinalBalanceCache(max_entries=2)
+        for ordinal in (1, 2, 1, 3):
+            cache.set(ordinal, funded, Balance(ordinal=ordinal, balance=ordinal))
+        assert cache.get(2, funded) is None and cache.get(1, funded).balance == 1
+
 
 @pytest.mark.integration
 class TestIntegrationL0API: